@@ -1,26 +1,31 @@
 # Import order should not be changed to avoid a circular dependency.
 from .common import Point, Dimension, Bounds, Insets, RGBA
 from .error import ErrorHandler, ErrorHandlerSupport
+from .damage import DamageRegion
+from .spatial import SpatialIndex
 from .registry import Registry
 from .font import FontRegistry, ToyFontRegistry
-from .image import Image, ImageRegistry
+from .image import Image, ImageCache, ImageRegistry
 from .context_aware import ContextAware
 from .input import Input, InputLookup
 from .event import Event, EventDispatcher, EventHandler, EventLoopAware, PositionalEvent, PropagatingEvent
 from .context import Context
 from .bounded import Bounded
 from .drawable import Drawable
-from .keyboard import KeyInput
+from .keyboard import KeyInput, KeyState, PollingKeyInput
 from .mouse import MouseButton, MouseEvent, MouseDownEvent, MouseUpEvent, MouseMoveEvent, MouseOverEvent, \
     MouseOutEvent, DragStartEvent, DragEvent, DragOverEvent, DragLeaveEvent, DragEndEvent, \
-    MouseEventHandler, MouseInput, FakeMouseInput
+    MouseEventHandler, MouseInput, FakeMouseInput, PollingMouseInput
 from .toolkit import Toolkit
-from .style import StyleLookup, StyleResolver, StyleChangeEvent, ColorChangeEvent, FontChangeEvent, InsetsChangeEvent
+from .theme import Theme
+from .style import StyleLookup, StyleResolver, StyleChangeEvent, ColorChangeEvent, FontChangeEvent, \
+    InsetsChangeEvent, ThemeChangeEvent
 from .component import Component, ComponentUI
 from .laf import LookAndFeel
-from .layout.layout import Layout, LayoutItem
+from .layout.layout import ChildrenChange, Layout, LayoutItem
 from .container import Container, ContainerUI
 from .panel import Panel
+from .list_view import ListView
 from .label import Label, LabelUI, TextAlign
 from .button import Button, LabelButton
 from .canvas import Canvas, CanvasUI
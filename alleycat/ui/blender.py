@@ -1,30 +1,29 @@
 from __future__ import annotations
 
-from functools import reduce
 from pathlib import Path
-from typing import Iterable, Optional, Sequence, Set, cast
+from typing import AbstractSet, Optional, Sequence, cast
 
 import bge
 import bgl
 import bpy
 import gpu
-import rx
-from alleycat.reactive import RV, ReactiveObject, functions as rv
+from alleycat.reactive import RV, functions as rv
 from bge.logic import KX_INPUT_ACTIVE, KX_INPUT_JUST_ACTIVATED, keyboard, mouse
 from bge.types import SCA_InputEvent
 from bgl import Buffer
 from bpy.types import BlendDataImages, Image as BLImage, SpaceView3D
-from cairocffi import Context as Graphics, FORMAT_ARGB32, FontOptions, ImageSurface, Matrix, Surface
+from cairocffi import FontOptions, ImageSurface, Surface
 from gpu.types import GPUBatch, GPUShader
 from gpu_extras.batch import batch_for_shader
 from returns.maybe import Maybe, Nothing, Some
-from rx import Observable, operators as ops
-from rx.subject import BehaviorSubject, Subject
+from rx import operators as ops
+from rx.subject import BehaviorSubject
 
-from alleycat.ui import Bounds, Context, Dimension, FontRegistry, Image, ImageRegistry, Input, KeyInput, \
-    LookAndFeel, MouseButton, MouseInput, Point, Toolkit, ToyFontRegistry, WindowManager
+from alleycat.ui import Bounds, Context, Dimension, FontRegistry, Image, ImageCache, ImageRegistry, Input, \
+    LookAndFeel, MouseButton, Point, PollingKeyInput, PollingMouseInput, Toolkit, ToyFontRegistry, WindowManager
 from alleycat.ui.context import ContextBuilder, ErrorHandler
-from alleycat.ui.event import EventLoopAware
+from alleycat.ui.pixels import surface_from_pixels
+from alleycat.ui.texture import GLBackend, SurfaceTexture
 
 # noinspection PyUnresolvedReferences
 use_viewport_render = bpy.context.scene.game_settings.use_viewport_render
@@ -62,17 +61,14 @@ class BlenderContext(Context):
 
             bge.logic.getCurrentScene().post_draw.append(self.process)
 
-        # noinspection PyTypeChecker
-        self._texture = Buffer(bgl.GL_INT, 1)
-
-        bgl.glGenTextures(1, self.texture)
+        self._texture = SurfaceTexture(BlenderGLBackend())
 
     @property
     def shader(self) -> GPUShader:
         return self._shader
 
     @property
-    def texture(self) -> Buffer:
+    def texture(self) -> SurfaceTexture:
         return self._texture
 
     def create_batch(self, size: Dimension) -> GPUBatch:
@@ -101,31 +97,22 @@ class BlenderContext(Context):
 
         self._resolution.on_next(Dimension(width, height))
 
-        super().process_draw()
-
-        data = self.surface.get_data()
-
-        source = bgl.Buffer(bgl.GL_BYTE, width * height * 4, data)
-
         bgl.glEnable(bgl.GL_BLEND)
         bgl.glActiveTexture(bgl.GL_TEXTURE0)
 
-        # noinspection PyUnresolvedReferences
-        bgl.glBindTexture(bgl.GL_TEXTURE_2D, self.texture[0])
+        self.texture.bind()
 
-        bgl.glTexImage2D(
-            bgl.GL_TEXTURE_2D, 0, bgl.GL_SRGB_ALPHA, width, height, 0, bgl.GL_BGRA, bgl.GL_UNSIGNED_BYTE, source)
+        # If nothing has changed since the last frame, we can just redraw the previous texture.
+        if self.frame_dirty:
+            super().process_draw()
 
-        bgl.glTexParameteri(bgl.GL_TEXTURE_2D, bgl.GL_TEXTURE_MIN_FILTER, bgl.GL_NEAREST)
-        bgl.glTexParameteri(bgl.GL_TEXTURE_2D, bgl.GL_TEXTURE_MAG_FILTER, bgl.GL_NEAREST)
+            self.texture.update(self.surface, self.drawn_areas)
 
         self.shader.bind()
         self.shader.uniform_int("image", 0)
 
         self.batch.draw(self.shader)
 
-        bgl.glDeleteBuffers(1, source)
-
     def dispose(self) -> None:
         if self._draw_handler:
             # noinspection PyArgumentList
@@ -133,21 +120,68 @@ class BlenderContext(Context):
         else:
             bge.logic.getCurrentScene().post_draw.remove(self.process)
 
-        bgl.glDeleteTextures(1, self.texture)
+        self.texture.dispose()
+
+        super().dispose()
+
 
+class BlenderGLBackend(GLBackend):
+
+    def create_texture(self) -> int:
         # noinspection PyTypeChecker
-        bgl.glDeleteBuffers(1, self.texture)
+        textures = Buffer(bgl.GL_INT, 1)
 
-        super().dispose()
+        bgl.glGenTextures(1, textures)
+
+        return textures[0]
+
+    def delete_texture(self, texture: int) -> None:
+        # noinspection PyTypeChecker
+        bgl.glDeleteTextures(1, Buffer(bgl.GL_INT, 1, [texture]))
+
+    def bind_texture(self, texture: int) -> None:
+        bgl.glBindTexture(bgl.GL_TEXTURE_2D, texture)
+
+    def allocate_texture(self, width: int, height: int) -> None:
+        bgl.glTexImage2D(
+            bgl.GL_TEXTURE_2D, 0, bgl.GL_SRGB_ALPHA, width, height, 0, bgl.GL_BGRA, bgl.GL_UNSIGNED_BYTE, None)
+
+        bgl.glTexParameteri(bgl.GL_TEXTURE_2D, bgl.GL_TEXTURE_MIN_FILTER, bgl.GL_NEAREST)
+        bgl.glTexParameteri(bgl.GL_TEXTURE_2D, bgl.GL_TEXTURE_MAG_FILTER, bgl.GL_NEAREST)
+
+    def create_buffer(self, size: int) -> Buffer:
+        # noinspection PyTypeChecker
+        return Buffer(bgl.GL_BYTE, size)
+
+    def buffer_data(self, buffer: Buffer) -> memoryview:
+        return memoryview(buffer)
+
+    def upload(self, buffer: Buffer, row_length: int, area: Bounds) -> None:
+        (x, y, w, h) = map(int, area.tuple)
+
+        # Let GL pick the area from the whole surface, so we don't have to copy it into a separate buffer.
+        bgl.glPixelStorei(bgl.GL_UNPACK_ROW_LENGTH, row_length)
+        bgl.glPixelStorei(bgl.GL_UNPACK_SKIP_ROWS, y)
+        bgl.glPixelStorei(bgl.GL_UNPACK_SKIP_PIXELS, x)
+
+        bgl.glTexSubImage2D(bgl.GL_TEXTURE_2D, 0, x, y, w, h, bgl.GL_BGRA, bgl.GL_UNSIGNED_BYTE, buffer)
+
+        bgl.glPixelStorei(bgl.GL_UNPACK_ROW_LENGTH, 0)
+        bgl.glPixelStorei(bgl.GL_UNPACK_SKIP_ROWS, 0)
+        bgl.glPixelStorei(bgl.GL_UNPACK_SKIP_PIXELS, 0)
 
 
 class BlenderToolkit(Toolkit[BlenderContext]):
 
-    def __init__(self, resource_path: Path = Path("//"), error_handler: Optional[ErrorHandler] = None) -> None:
+    def __init__(self,
+                 resource_path: Path = Path("//"),
+                 error_handler: Optional[ErrorHandler] = None,
+                 image_budget: Optional[int] = None,
+                 image_cache: Optional[ImageCache] = None) -> None:
         super().__init__(resource_path, error_handler)
 
         self._font_registry = ToyFontRegistry(self.error_handler)
-        self._image_registry = BlenderImageRegistry(self.error_handler)
+        self._image_registry = BlenderImageRegistry(self.error_handler, image_budget, image_cache)
 
     @property
     def fonts(self) -> FontRegistry:
@@ -170,141 +204,82 @@ class UI(ContextBuilder[BlenderContext]):
         return BlenderContext(**self.args)
 
 
-class BlenderMouseInput(MouseInput, ReactiveObject, EventLoopAware):
-    position: RV[Point] = rv.new_view()
-
-    buttons: RV[int] = rv.new_view()
+class BlenderMouseInput(PollingMouseInput):
 
     def __init__(self, context: BlenderContext) -> None:
         super().__init__(context)
 
-        self._position = Subject()
-        self._activeInputs = Subject()
+        self._codes = (
+            (MouseButton.LEFT, bge.events.LEFTMOUSE),
+            (MouseButton.MIDDLE, bge.events.MIDDLEMOUSE),
+            (MouseButton.RIGHT, bge.events.RIGHTMOUSE))
 
-        # noinspection PyTypeChecker
-        self.position = self._position.pipe(
-            ops.distinct_until_changed(),
-            ops.map(lambda v: tuple(p * s for p, s in zip(v, context.window_size.tuple))),
-            ops.map(Point.from_tuple),
-            ops.share())
+    def poll_position(self) -> Point:
+        (x, y) = mouse.position
+        (width, height) = cast(BlenderContext, self.context).window_size.tuple
 
-        codes = {
-            MouseButton.LEFT: bge.events.LEFTMOUSE,
-            MouseButton.MIDDLE: bge.events.MIDDLEMOUSE,
-            MouseButton.RIGHT: bge.events.RIGHTMOUSE
-        }
+        return Point(x * width, y * height)
 
-        def pressed(e: SCA_InputEvent) -> bool:
-            return KX_INPUT_ACTIVE in e.status or KX_INPUT_JUST_ACTIVATED in e.status
+    def poll_buttons(self) -> int:
+        inputs = mouse.activeInputs
 
-        def value_for(button: MouseButton) -> Observable:
-            code = codes[button]
+        if len(inputs) == 0:
+            return 0
 
-            return self._activeInputs.pipe(
-                ops.start_with({}),
-                ops.map(lambda i: code in i and pressed(i[code])),
-                ops.map(lambda v: button if v else 0))
+        buttons = 0
 
-        # noinspection PyTypeChecker
-        self.buttons = rx.combine_latest(*[value_for(b) for b in MouseButton]).pipe(
-            ops.map(lambda v: reduce(lambda a, b: a | b, v)),
-            ops.distinct_until_changed(),
-            ops.share())
+        for (button, code) in self._codes:
+            if code in inputs and _is_active(inputs[code]):
+                buttons |= button
 
-    @property
-    def on_mouse_wheel(self) -> Observable:
-        def on_wheel(code: int) -> Observable:
-            return self._activeInputs.pipe(
-                ops.filter(lambda i: code in i),
-                ops.map(lambda i: i[code].values[-1]),
-                ops.filter(lambda v: v != 0))
+        return buttons
 
-        return rx.merge(on_wheel(bge.events.WHEELUPMOUSE), on_wheel(bge.events.WHEELDOWNMOUSE))
+    def poll_wheel(self) -> float:
+        inputs = mouse.activeInputs
 
-    def process(self) -> None:
-        self._position.on_next(mouse.position)
-        self._activeInputs.on_next(mouse.activeInputs)
+        if len(inputs) == 0:
+            return 0
 
-    def dispose(self) -> None:
-        super().dispose()
+        value = 0
+
+        # Scrolling down should produce a positive value, like FakeMouseInput.scroll.
+        if bge.events.WHEELUPMOUSE in inputs:
+            value -= abs(inputs[bge.events.WHEELUPMOUSE].values[-1])
 
-        self.execute_safely(self._position.dispose)
-        self.execute_safely(self._activeInputs.dispose)
+        if bge.events.WHEELDOWNMOUSE in inputs:
+            value += abs(inputs[bge.events.WHEELDOWNMOUSE].values[-1])
 
+        return value
 
-class BlenderKeyInput(KeyInput, ReactiveObject, EventLoopAware):
-    pressed: RV[Set[int]] = rv.new_view()
+
+class BlenderKeyInput(PollingKeyInput):
 
     def __init__(self, context: BlenderContext) -> None:
         super().__init__(context)
 
-        self._activeInputs = Subject()
+    def poll(self) -> AbstractSet[int]:
+        return keyboard.activeInputs.keys()
 
-        # noinspection PyTypeChecker
-        self.pressed = self._activeInputs.pipe(
-            ops.start_with({}),
-            ops.map(lambda s: set(s.keys())))
 
-    def process(self) -> None:
-        self._activeInputs.on_next(keyboard.activeInputs)
+def _is_active(event: SCA_InputEvent) -> bool:
+    status = event.status
 
-    def dispose(self) -> None:
-        super().dispose()
-
-        self.execute_safely(self._activeInputs.dispose)
+    return KX_INPUT_ACTIVE in status or KX_INPUT_JUST_ACTIVATED in status
 
 
 class BlenderImage(Image):
 
-    def __init__(self, source: BLImage) -> None:
+    def __init__(self, source: BLImage, surface: Optional[ImageSurface] = None) -> None:
         if source is None:
             raise ValueError("Argument 'source' is required.")
 
         super().__init__()
 
-        (width, height) = source.size
-
-        self._size = Dimension(width, height)
         self._source = source
 
-        pixels = source.pixels[:]
-
-        channels = 4
-        length = width * height
-
-        def load_image() -> Iterable[int]:
-            for i in range(0, length):
-                offset = i * channels
-
-                r = pixels[offset]
-                g = pixels[offset + 1]
-                b = pixels[offset + 2]
-                a = pixels[offset + 3]
-
-                yield int(b * 255)
-                yield int(g * 255)
-                yield int(r * 255)
-                yield int(a * 255)
-
-        data = bytearray(load_image())
-
-        pattern = ImageSurface.create_for_data(data, FORMAT_ARGB32, width, height)
-
-        self._surface = ImageSurface(FORMAT_ARGB32, width, height)
-
-        ctx = Graphics(self._surface)
-
-        m = Matrix()
-        m.translate(0, height)
-        m.scale(1, -1)
-
-        ctx.set_matrix(m)
-        ctx.set_source_surface(pattern)
-        ctx.paint()
-
-        self.surface.flush()
-
-        pattern.finish()
+        # Reading the size of a Blender image decodes the file, so we take it from the surface instead.
+        self._surface = surface if surface is not None else surface_from_pixels(source)
+        self._size = Dimension(self._surface.get_width(), self._surface.get_height())
 
     @property
     def source(self) -> BLImage:
@@ -335,8 +310,17 @@ class BlenderImage(Image):
 
 class BlenderImageRegistry(ImageRegistry[BlenderImage]):
 
-    def __init__(self, error_handler: ErrorHandler) -> None:
-        super().__init__(error_handler)
+    def __init__(
+            self,
+            error_handler: ErrorHandler,
+            budget: Optional[int] = None,
+            disk_cache: Optional[ImageCache] = None) -> None:
+        super().__init__(error_handler, budget, disk_cache=disk_cache)
+
+    @property
+    def thread_safe(self) -> bool:
+        # Blender's data API can only be used from the main thread.
+        return False
 
     def create(self, key: str) -> Maybe[BlenderImage]:
         if key is None:
@@ -346,10 +330,13 @@ class BlenderImageRegistry(ImageRegistry[BlenderImage]):
             # noinspection PyTypeChecker
             return Some(BlenderImage(bpy.data.images[key]))
         except KeyError:
-            if Path(bpy.path.abspath(key)).exists():
+            path = Path(bpy.path.abspath(key))
+
+            if path.exists():
                 images = cast(BlendDataImages, bpy.data.images)
                 image = images.load(key, check_existing=False)
 
-                return Some(BlenderImage(image))
+                # Blender reads the pixels lazily, so the file won't be decoded at all if we have it in the cache.
+                return Some(BlenderImage(image, self.load_surface(path, lambda: surface_from_pixels(image))))
 
         return Nothing
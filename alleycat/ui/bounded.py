@@ -17,7 +17,7 @@ class Bounded(ABC):
 
     size: RV[Dimension] = bounds.as_view().map(lambda _, b: b.size)
 
-    offset: RV[Point]
+    offset: Point
 
     def move_to(self, location: Point) -> None:
         self.bounds = self.bounds.move_to(location)
@@ -1,9 +1,12 @@
 from abc import ABC
 from itertools import chain
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Tuple
 
+import rx
 from alleycat.reactive import RP, functions as rv
-from returns.maybe import Maybe
+from returns.maybe import Maybe, Nothing
+from rx import Observable, operators as ops
+from rx.disposable import Disposable
 
 from alleycat.ui import Component, ComponentUI, Context, Dimension, Image, Insets
 
@@ -22,9 +25,56 @@ class Canvas(Component):
             visible: bool = True) -> None:
         self.image = Maybe.from_optional(image)
         self.padding = padding
+        self.cached = True
+
+        self._image_request: Optional[Disposable] = None
 
         super().__init__(context, visible)
 
+        images = context.toolkit.images
+
+        # Keep the image in the registry from being evicted while it's shown by this canvas.
+        def update_pin(change: Tuple[Maybe[Image], Maybe[Image]]) -> None:
+            (previous, current) = change
+
+            current.map(images.pin)
+            previous.map(images.unpin)
+
+        self.observe("image") \
+            .pipe(ops.start_with(Nothing), ops.pairwise(), ops.take_until(self.on_dispose)) \
+            .subscribe(update_pin, on_error=self.error_handler)
+
+    def load_image(self, key: str, placeholder: Maybe[Image] = Nothing) -> None:
+        if key is None:
+            raise ValueError("Argument 'key' is required.")
+
+        if placeholder is None:
+            raise ValueError("Argument 'placeholder' is required.")
+
+        if self._image_request is not None:
+            self._image_request.dispose()
+
+        # noinspection PyTypeChecker
+        self.image = placeholder
+
+        def on_load(image: Maybe[Image]) -> None:
+            self._image_request = None
+
+            # noinspection PyTypeChecker
+            self.image = placeholder if image == Nothing else image
+
+        self._image_request = self.context.toolkit.images.get_async(key) \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(on_load, on_error=self.error_handler)
+
+    def dispose(self) -> None:
+        if self._image_request is not None:
+            self._image_request.dispose()
+
+        self.image.map(self.context.toolkit.images.unpin)
+
+        super().dispose()
+
     @property
     def style_fallback_prefixes(self) -> Iterable[str]:
         return chain(["Canvas"], super().style_fallback_prefixes)
@@ -39,6 +89,9 @@ class CanvasUI(ComponentUI[Canvas], ABC):
     def padding(self, component: Canvas) -> Insets:
         return component.padding
 
+    def on_repaint(self, component: Canvas) -> Observable:
+        return rx.merge(super().on_repaint(component), component.observe("padding"))
+
     def preferred_size(self, component: Canvas) -> Dimension:
         (width, height) = component.image.map(lambda i: i.size.tuple).value_or((0, 0))
         (top, right, bottom, left) = self.padding(component).tuple
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Mapping, TYPE_CHECKING, TypeVar
+from typing import Any, Generic, Mapping, Optional, TYPE_CHECKING, Tuple, TypeVar, Union
 
 import rx
 from alleycat.reactive import RP, RV, ReactiveObject, functions as rv
-from cairocffi import Context as Graphics
+from cairocffi import CONTENT_COLOR_ALPHA, Context as Graphics, RecordingSurface
 from returns.maybe import Maybe, Nothing
 from rx import Observable, operators as ops
 
 from alleycat.ui import Bounded, Bounds, Context, ContextAware, Dimension, Drawable, EventDispatcher, Input, \
-    MouseEventHandler, Point, PositionalEvent, StyleResolver
+    MouseEventHandler, Point, PositionalEvent, StyleResolver, ThemeChangeEvent
 
 if TYPE_CHECKING:
-    from alleycat.ui import Container, LookAndFeel
+    from alleycat.ui import Container, LookAndFeel, StyleChangeEvent
 
 
 class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, ContextAware, ReactiveObject):
@@ -21,12 +21,7 @@ class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, Con
 
     parent: RP[Maybe[Container]] = rv.from_value(Nothing)
 
-    offset: RV[Point] = parent.as_view().map(
-        lambda _, parent: parent.map(
-            lambda p: rx.combine_latest(
-                p.observe("offset"), p.observe("location")).pipe(ops.map(lambda v: v[0] + v[1]))
-        ).or_else_call(lambda: rx.of(Point(0, 0)))
-    ).pipe(lambda _: (ops.exclusive(),))
+    cached: RP[bool] = rv.from_value(False)
 
     _minimum_size: RP[Dimension] = rv.from_value(Dimension(0, 0))
 
@@ -63,6 +58,10 @@ class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, Con
 
         self._context = context
         self._valid = False
+        self._offset = Point(0, 0)
+        self._offset_generation = -1
+        self._painted_area: Optional[Bounds] = None
+        self._render_cache: Optional[RecordingSurface] = None
         self._ui = self.create_ui()
 
         assert self._ui is not None
@@ -71,15 +70,51 @@ class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, Con
 
         self.validate()
 
+        rx.merge(self.observe("location").pipe(ops.distinct_until_changed()), self.observe("parent")) \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.context.invalidate_offsets(), on_error=self.error_handler)
+
         self.ui \
             .on_invalidate(self) \
             .pipe(ops.take_until(self.on_dispose)) \
             .subscribe(lambda _: self.invalidate(), on_error=self.error_handler)
 
+        def redraw(_) -> None:
+            # The recorded image has to be dropped before the repaint, so the next draw doesn't replay it.
+            self.invalidate_render_cache()
+            self.repaint()
+
+        rx.merge(self.ui.on_repaint(self), self.on_inherited_style_change) \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(redraw, on_error=self.error_handler)
+
+        def move(_) -> None:
+            self.repaint()
+            self.parent.map(lambda p: p.index_child(self))
+
+        self.observe("bounds") \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(move, on_error=self.error_handler)
+
+        rx.merge(self.observe("cached"), self.observe("size").pipe(ops.distinct_until_changed())) \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.invalidate_render_cache(), on_error=self.error_handler)
+
     @property
     def context(self) -> Context:
         return self._context
 
+    @property
+    def offset(self) -> Point:
+        generation = self.context.offset_generation
+
+        # Offsets are only recalculated when any component has been moved since we last read it.
+        if self._offset_generation != generation:
+            self._offset = self.parent.map(lambda p: p.offset + p.location).value_or(Point(0, 0))
+            self._offset_generation = generation
+
+        return self._offset
+
     @property
     def ui(self) -> ComponentUI:
         return self._ui
@@ -116,14 +151,39 @@ class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, Con
     def invalidate(self) -> None:
         self._valid = False
 
-        self.parent.map(lambda p: p.invalidate())
+        self.context.mark_frame_dirty()
+        self.parent.map(lambda p: self.context.run_or_defer((p, "invalidate"), p.invalidate))
+
+    @property
+    def painted_area(self) -> Maybe[Bounds]:
+        return Maybe.from_optional(self._painted_area)
+
+    def repaint(self) -> None:
+        if self._painted_area is not None:
+            self.repaint_area(self._painted_area)
+
+        if self.visible:
+            self.repaint_area(self.ui.clip_bounds(self))
+
+    def repaint_area(self, area: Bounds) -> None:
+        if area is None:
+            raise ValueError("Argument 'area' is required.")
+
+        if self.parent == Nothing:
+            self.context.repaint(area)
+        else:
+            self.parent.unwrap().repaint_child(area)
 
     def draw(self, g: Graphics) -> None:
         if self.visible:
             g.save()
 
+            clip_bounds = self.ui.clip_bounds(self)
+
             (dx, dy) = self.parent.map(lambda p: p.location).value_or(Point(0, 0))
-            (cx, cy, cw, ch) = self.ui.clip_bounds(self).tuple
+            (cx, cy, cw, ch) = clip_bounds.tuple
+
+            self._painted_area = clip_bounds
 
             g.translate(dx, dy)
             g.rectangle(cx, cy, cw, ch)
@@ -138,7 +198,56 @@ class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, Con
             g.restore()
 
     def draw_component(self, g: Graphics) -> None:
-        self.ui.draw(g, self)
+        if not self.cached:
+            self.ui.draw(g, self)
+            return
+
+        (x, y) = self.location.tuple
+
+        if self._render_cache is None:
+            # Record in local coordinates, so that we can replay it when the component is moved.
+            surface = RecordingSurface(CONTENT_COLOR_ALPHA, None)
+
+            rg = self.context.create_graphics(surface)
+            rg.translate(-x, -y)
+
+            self.ui.draw(rg, self)
+
+            self._render_cache = surface
+
+        g.set_source_surface(self._render_cache, x, y)
+        g.paint()
+
+    @property
+    def render_cache(self) -> Maybe[RecordingSurface]:
+        return Maybe.from_optional(self._render_cache)
+
+    def invalidate_render_cache(self) -> None:
+        if self._render_cache is not None:
+            self._render_cache.finish()
+            self._render_cache = None
+
+    def _notify_style_change(self, event: Union[StyleChangeEvent, ThemeChangeEvent]) -> None:
+        # Resolved styles should reflect the change right away, even if the notification itself is deferred.
+        self.invalidate_resolved_styles(event)
+
+        notify = super()._notify_style_change
+
+        def run() -> None:
+            if not self.disposed:
+                notify(event)
+
+        self.context.run_or_defer((self, "style", *_style_change_key(event)), run)
+
+    def notify_inherited_style_change(self, event: Union[StyleChangeEvent, ThemeChangeEvent]) -> None:
+        if event is None:
+            raise ValueError("Argument 'event' is required.")
+
+        self.invalidate_resolved_styles(event)
+
+        notify = super().notify_inherited_style_change
+
+        self.context.run_or_defer((self, "inherited_style", *_style_change_key(event)), lambda: notify(event))
 
     def position_of(self, event: PositionalEvent) -> Point:
         if event is None:
@@ -155,14 +264,29 @@ class Component(Drawable, StyleResolver, MouseEventHandler, EventDispatcher, Con
         # noinspection PyTypeChecker
         return self.parent
 
+    def dispose(self) -> None:
+        if self._painted_area is not None:
+            self.repaint_area(self._painted_area)
+
+        super().dispose()
+
+        self.invalidate_render_cache()
+
     def __repr__(self) -> Any:
         return str({"id": id(self), "type": type(self).__name__})
 
 
+def _style_change_key(event: Union[StyleChangeEvent, ThemeChangeEvent]) -> Tuple[Any, ...]:
+    # Theme changes can't replace each other since each of them may contain different keys.
+    return (type(event), id(event)) if isinstance(event, ThemeChangeEvent) else (type(event), event.key)
+
+
 T = TypeVar("T", bound=Component, contravariant=True)
 
 
 class ComponentUI(Generic[T], ABC):
+    # A shareable UI keeps no state of its own, so a single instance can serve all components of the same type.
+    shareable: bool = False
 
     def __init__(self) -> None:
         super().__init__()
@@ -181,6 +305,9 @@ class ComponentUI(Generic[T], ABC):
     def on_invalidate(self, component: T) -> Observable:
         return component.observe("visible")
 
+    def on_repaint(self, component: T) -> Observable:
+        return rx.merge(self.on_invalidate(component), component.on_style_change)
+
     @abstractmethod
     def draw(self, g: Graphics, component: T) -> None:
         pass
@@ -1,13 +1,15 @@
 from abc import ABC
-from typing import Iterator, Optional, Sequence, TypeVar, cast
+from typing import Callable, Dict, Iterable, Optional, Sequence, TypeVar, cast
 
 import rx
 from alleycat.reactive import RV, functions as rv
 from cairocffi import Context as Graphics
 from returns.maybe import Maybe, Nothing, Some
 from rx import Observable, operators as ops
+from rx.disposable import Disposable
 
-from alleycat.ui import Bounds, Component, ComponentUI, Context, Dimension, Layout, Point
+from alleycat.ui import Bounds, ChildrenChange, Component, ComponentUI, Context, Dimension, Layout, Point, \
+    SpatialIndex
 
 
 class Container(Component):
@@ -20,20 +22,37 @@ class Container(Component):
         self._layout_pending = True
         self._layout_running = False
 
+        self._child_index = SpatialIndex[Component]()
+        self._child_order: Dict[Component, int] = dict()
+        self._next_child_order = 0
+
         # noinspection PyTypeChecker
-        self.children = self.layout.observe("children").pipe(
-            ops.map(lambda children: tuple(map(lambda c: c.component, children))))
+        self.children = self.layout.observe("children").pipe(ops.map(lambda _: self.layout.components))
 
         super().__init__(context, visible)
 
+        self._update_child_index(ChildrenChange(self.layout.components, ()))
+
+        self.on_children_change \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(self._update_child_index, on_error=self.error_handler)
+
         self.observe("size") \
             .pipe(ops.filter(lambda _: self.visible), ops.distinct_until_changed()) \
             .subscribe(lambda _: self.request_layout(), on_error=self.error_handler)
 
+        self.observe("visible") \
+            .pipe(ops.filter(lambda v: v and self._layout_pending), ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.request_layout(), on_error=self.error_handler)
+
     @property
     def layout(self) -> Layout:
         return self._layout
 
+    @property
+    def on_children_change(self) -> Observable:
+        return self.layout.on_children_change
+
     def validate(self, force: bool = False) -> None:
         if self.visible and (not self.valid or force):
             self.request_layout()
@@ -53,7 +72,12 @@ class Container(Component):
         return self._layout_pending or not self.valid
 
     def request_layout(self) -> None:
-        self._layout_pending = True
+        def request() -> None:
+            self._layout_pending = True
+
+            self.context.schedule_layout(self)
+
+        self.context.run_or_defer((self, "request_layout"), request)
 
     def perform_layout(self) -> None:
         self._layout_running = True
@@ -66,24 +90,56 @@ class Container(Component):
         self._layout_pending = False
         self._layout_running = False
 
+        # Layouts of hidden children are dropped from the schedule, so we request them again once we are shown.
+        # noinspection PyTypeChecker
+        for child in self.children:
+            if isinstance(child, Container) and child.visible and child._layout_pending:
+                child.request_layout()
+
+    def repaint_child(self, area: Bounds) -> None:
+        if area is None:
+            raise ValueError("Argument 'area' is required.")
+
+        self.repaint_area(area.move_by(self.location))
+
+    def index_child(self, child: Component) -> None:
+        if child is None:
+            raise ValueError("Argument 'child' is required.")
+
+        if child in self._child_order:
+            self._child_index.update(child, child.bounds)
+
+    def _update_child_index(self, change: ChildrenChange) -> None:
+        for child in change.removed:
+            self._child_index.remove(child)
+            self._child_order.pop(child, None)
+
+        # Order values only need to be increasing, and layouts always append new children to the end.
+        for child in change.added:
+            self._child_index.update(child, child.bounds)
+
+            self._child_order[child] = self._next_child_order
+            self._next_child_order += 1
+
     def component_at(self, location: Point) -> Maybe[Component]:
         if location is None:
             raise ValueError("Argument 'location' is required.")
 
         if self.bounds.contains(location):
-            try:
-                # noinspection PyTypeChecker
-                children: Iterator[Component] = reversed(self.children)
+            position = location - self.location
 
-                child = next(c for c in children if c.bounds.contains(location - self.location))
+            candidates = self._child_index.query(position)
 
-                if isinstance(child, Container):
-                    return child.component_at(location - self.location)
-                else:
-                    return Some(child)
-            except StopIteration:
+            if len(candidates) == 0:
                 return Some(self)
 
+            child = max(candidates, key=self._child_order.__getitem__)
+
+            if isinstance(child, Container):
+                return child.component_at(position)
+            else:
+                return Some(child)
+
         return Nothing
 
     def add(self, child: Component, *args, **kwargs) -> None:
@@ -93,16 +149,35 @@ class Container(Component):
 
         child.parent = Some(self)
 
+    def add_all(self, children: Iterable[Component], *args, **kwargs) -> None:
+        if children is None:
+            raise ValueError("Argument 'children' is required.")
+
+        added = tuple(children)
+
+        for child in added:
+            child.parent.map(lambda p: None if p is self else p.remove(child))
+
+        self.layout.add_all(added, *args, **kwargs)
+
+        for child in added:
+            child.parent = Some(self)
+
     def remove(self, child: Component) -> None:
         self.layout.remove(child)
 
         child.parent = Nothing
 
-    def draw(self, g: Graphics) -> None:
-        if self.layout_pending:
-            self.perform_layout()
+    def remove_all(self, children: Iterable[Component]) -> None:
+        if children is None:
+            raise ValueError("Argument 'children' is required.")
+
+        removed = tuple(children)
+
+        self.layout.remove_all(removed)
 
-        super().draw(g)
+        for child in removed:
+            child.parent = Nothing
 
     def draw_component(self, g: Graphics) -> None:
         super().draw_component(g)
@@ -121,15 +196,27 @@ class Container(Component):
         g.rectangle(cx, cy, cw, ch)
         g.clip()
 
+        (x1, y1, x2, y2) = g.clip_extents()
+
+        # Children are positioned relative to this container, so we convert the clip area to match their bounds.
+        area = Bounds(x1, y1, x2 - x1, y2 - y1).move_by(-self.location)
+
+        culled = 0
+
         try:
             # noinspection PyTypeChecker
             for child in self.children:
-                child.draw(g)
+                if child.visible and (child.ui.clip_bounds(child) & area) == Nothing:
+                    culled += 1
+                else:
+                    child.draw(g)
         except BaseException as e:
             self.error_handler(e)
 
         g.restore()
 
+        self.context.record_culled(culled)
+
     def dispose(self) -> None:
         # noinspection PyTypeChecker
         for child in self.children:
@@ -140,6 +227,48 @@ class Container(Component):
         super().dispose()
 
 
+def _observe_children(container: Container, selector: Callable[[Component], Observable]) -> Observable:
+    if container is None:
+        raise ValueError("Argument 'container' is required.")
+
+    if selector is None:
+        raise ValueError("Argument 'selector' is required.")
+
+    def subscribe(observer, scheduler=None) -> Disposable:
+        subscriptions: Dict[Component, Disposable] = dict()
+
+        # Only subscribe to the children which have been added, and dispose the ones which have been removed.
+        def on_children_change(change: ChildrenChange) -> None:
+            for child in change.removed:
+                subscription = subscriptions.pop(child, None)
+
+                if subscription is not None:
+                    subscription.dispose()
+
+            for child in change.added:
+                if child not in subscriptions:
+                    subscriptions[child] = selector(child).subscribe(
+                        observer.on_next, observer.on_error, scheduler=scheduler)
+
+        # noinspection PyTypeChecker
+        on_children_change(ChildrenChange(container.children, ()))
+
+        source = container.on_children_change.subscribe(
+            on_children_change, observer.on_error, observer.on_completed, scheduler=scheduler)
+
+        def dispose() -> None:
+            source.dispose()
+
+            for subscription in subscriptions.values():
+                subscription.dispose()
+
+            subscriptions.clear()
+
+        return Disposable(dispose)
+
+    return rx.create(subscribe)
+
+
 T = TypeVar("T", bound=Container, contravariant=True)
 
 
@@ -162,16 +291,14 @@ class ContainerUI(ComponentUI[T], ABC):
         other_changes = super().on_invalidate(component)
         children_changes = component.observe("children")
 
+        # We can skip the current values, since adding or removing a child already emits a 'children' change.
         def child_bounds_changes(child: Component):
             return rx.merge(
-                child.observe("bounds"),
-                child.observe("preferred_size"),
-                child.observe("minimum_size"))
-
-        children_bounds_changes = children_changes.pipe(
-            ops.map(lambda children: map(child_bounds_changes, children)),
-            ops.map(lambda b: rx.merge(*b)),
-            ops.switch_latest(),
+                child.observe("bounds").pipe(ops.skip(1)),
+                child.observe("preferred_size").pipe(ops.skip(1)),
+                child.observe("minimum_size").pipe(ops.skip(1)))
+
+        children_bounds_changes = _observe_children(component, child_bounds_changes).pipe(
             ops.map(lambda _: None))
 
         return rx.merge(
@@ -180,5 +307,9 @@ class ContainerUI(ComponentUI[T], ABC):
             children_bounds_changes,
             component.layout.on_constraints_change)
 
+    def on_repaint(self, component: T) -> Observable:
+        # Children repaint their own areas, so we don't need to watch their geometry here.
+        return rx.merge(component.observe("visible"), component.observe("children"), component.on_style_change)
+
     def post_draw(self, g: Graphics, component: T) -> None:
         pass
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from heapq import heapify, heappop, heappush
+from itertools import count
 from pathlib import Path
-from typing import Any, Dict, Generic, Mapping, Optional, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, Dict, Generic, Hashable, Iterator, List, Mapping, Optional, Sequence, Set, \
+    TYPE_CHECKING, Tuple, TypeVar
 
 from alleycat.reactive import RV, ReactiveObject, functions as rv
 from cairocffi import ANTIALIAS_BEST, ANTIALIAS_SUBPIXEL, Context as Graphics, FontOptions, HINT_STYLE_FULL, \
     OPERATOR_CLEAR, Surface
-from returns.maybe import Maybe
+from returns.maybe import Maybe, Nothing
 from rx import operators as ops
 
-from alleycat.ui import Dimension, ErrorHandler, ErrorHandlerSupport, EventDispatcher, EventLoopAware, Input, \
-    InputLookup, Point
+from alleycat.ui import Bounds, DamageRegion, Dimension, ErrorHandler, ErrorHandlerSupport, EventDispatcher, \
+    EventLoopAware, Input, InputLookup, Point
 
 if TYPE_CHECKING:
-    from alleycat.ui import LookAndFeel, Toolkit, WindowManager
+    from alleycat.ui import Component, Container, LookAndFeel, Toolkit, WindowManager
 
 
 class Context(EventLoopAware, ReactiveObject, InputLookup, ErrorHandlerSupport, ABC):
@@ -56,9 +60,32 @@ class Context(EventLoopAware, ReactiveObject, InputLookup, ErrorHandlerSupport,
         self._inputs = {i.id: i for i in inputs}
         self._pollers = [i for i in inputs if isinstance(i, EventLoopAware)]
 
+        self._damage = DamageRegion()
+        self._drawn_areas: Sequence[Bounds] = ()
+        self._frame_dirty = True
+        self._offset_generation = 0
+
+        self._batch_depth = 0
+        self._deferred: Dict[Hashable, Callable[[], None]] = dict()
+
+        self._pending_layouts: Dict[Container, None] = dict()
+        self._layout_queue: Optional[List[Tuple[int, int, Container]]] = None
+        self._layout_sequence = count()
+        self._layouts_deferred = False
+        self._layout_passes = 0
+        self._culled_children = 0
+
         # noinspection PyTypeChecker
         self.surface = self.observe("window_size").pipe(ops.map(self.toolkit.create_surface))
 
+        self.observe("window_size") \
+            .pipe(ops.map(lambda s: Bounds(0, 0, s.width, s.height))) \
+            .subscribe(self.repaint, on_error=self.error_handler)
+
+        self.window_manager.observe("windows") \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.mark_frame_dirty(), on_error=self.error_handler)
+
         old_surface = self.observe("surface").pipe(
             ops.pairwise(),
             ops.map(lambda s: s[0]),
@@ -90,6 +117,149 @@ class Context(EventLoopAware, ReactiveObject, InputLookup, ErrorHandlerSupport,
     def error_handler(self) -> ErrorHandler:
         return self._error_handler
 
+    @property
+    def damage(self) -> DamageRegion:
+        return self._damage
+
+    @property
+    def drawn_areas(self) -> Sequence[Bounds]:
+        return self._drawn_areas
+
+    @property
+    def offset_generation(self) -> int:
+        return self._offset_generation
+
+    def invalidate_offsets(self) -> None:
+        self._offset_generation += 1
+
+    @property
+    def frame_dirty(self) -> bool:
+        return self._frame_dirty or not self.damage.empty
+
+    def mark_frame_dirty(self) -> None:
+        self._frame_dirty = True
+
+    @property
+    def batching(self) -> bool:
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            try:
+                if self._batch_depth == 1:
+                    self._flush_deferred()
+            finally:
+                self._batch_depth -= 1
+
+            if self._batch_depth == 0:
+                self.window_manager.validate()
+
+    def run_or_defer(self, key: Hashable, action: Callable[[], None]) -> None:
+        if key is None:
+            raise ValueError("Argument 'key' is required.")
+
+        if action is None:
+            raise ValueError("Argument 'action' is required.")
+
+        if self.batching:
+            # A later action with the same key replaces the earlier one, but keeps its original position.
+            self._deferred[key] = action
+        else:
+            action()
+
+    def _flush_deferred(self) -> None:
+        done: Set[Hashable] = set()
+
+        # Deferred actions may defer more actions, which are also run once for each key before the batch ends.
+        while len(self._deferred) > 0:
+            key = next(iter(self._deferred))
+            action = self._deferred.pop(key)
+
+            if key in done:
+                continue
+
+            done.add(key)
+
+            self.execute_safely(action)
+
+    @property
+    def layout_passes(self) -> int:
+        return self._layout_passes
+
+    def schedule_layout(self, container: Container) -> None:
+        if container is None:
+            raise ValueError("Argument 'container' is required.")
+
+        if container not in self._pending_layouts:
+            self._pending_layouts[container] = None
+
+            if self._layout_queue is not None:
+                heappush(self._layout_queue, (_depth_of(container), next(self._layout_sequence), container))
+
+        self.mark_frame_dirty()
+
+    def perform_layouts(self) -> None:
+        queue = [(_depth_of(c), next(self._layout_sequence), c) for c in self._pending_layouts]
+
+        heapify(queue)
+
+        self._layout_queue = queue
+        self._layouts_deferred = False
+
+        done: Set[Container] = set()
+
+        try:
+            # Parents are laid out before their children, since they can change the size of the latter.
+            while len(queue) > 0:
+                (_, _, container) = heappop(queue)
+
+                if container not in self._pending_layouts:
+                    continue
+
+                if container.disposed:
+                    del self._pending_layouts[container]
+                    continue
+
+                # Hidden containers request another layout when they (or their parents) become visible again.
+                if not _showing(container):
+                    del self._pending_layouts[container]
+                    continue
+
+                # Each container is laid out at most once for each frame, so we defer any further requests.
+                if container in done:
+                    self._layouts_deferred = True
+                    continue
+
+                del self._pending_layouts[container]
+
+                done.add(container)
+
+                container.perform_layout()
+
+                self._layout_passes += 1
+        finally:
+            self._layout_queue = None
+
+    @property
+    def culled_children(self) -> int:
+        return self._culled_children
+
+    def record_culled(self, count: int) -> None:
+        self._culled_children += count
+
+    def repaint(self, area: Optional[Bounds] = None) -> None:
+        if area is None:
+            (width, height) = self.window_size.tuple
+
+            area = Bounds(0, 0, width, height)
+
+        self._damage.add(area)
+
     # noinspection PyMethodMayBeStatic
     def create_graphics(self, surface: Surface):
         if surface is None:
@@ -104,6 +274,7 @@ class Context(EventLoopAware, ReactiveObject, InputLookup, ErrorHandlerSupport,
 
     def process(self) -> None:
         self.execute_safely(self.process_inputs)
+        self.execute_safely(self.toolkit.images.process)
         self.execute_safely(self.process_draw)
 
     def process_inputs(self) -> None:
@@ -111,22 +282,49 @@ class Context(EventLoopAware, ReactiveObject, InputLookup, ErrorHandlerSupport,
             self.execute_safely(poller.process)
 
     def process_draw(self) -> None:
-        (width, height) = self.window_size.tuple
+        self._layout_passes = 0
+        self._culled_children = 0
+        self._drawn_areas = ()
+
+        if not self.frame_dirty:
+            return
 
-        g: Graphics = self.graphics
+        # Pending layouts may damage more areas, so we need to perform them before we start drawing.
+        self.window_manager.validate()
+        self.perform_layouts()
+
+        self._frame_dirty = self._layouts_deferred
+
+        if not self.damage.empty:
+            self._drawn_areas = self.damage.drain()
+
+            self.draw_areas(self.graphics, self._drawn_areas)
+
+        self.surface.flush()
+
+    def draw_areas(self, g: Graphics, areas: Sequence[Bounds]) -> None:
+        if areas is None:
+            raise ValueError("Argument 'areas' is required.")
+
+        g.save()
+
+        for (x, y, w, h) in areas:
+            g.rectangle(x, y, w, h)
+
+        g.clip()
 
         op = g.get_operator()
 
-        g.rectangle(0, 0, width, height)
         g.set_source_rgba(0, 0, 0, 0)
         g.set_operator(OPERATOR_CLEAR)
-        g.fill()
+        g.paint()
 
         g.set_operator(op)
 
-        self.window_manager.draw(g)
-
-        self.surface.flush()
+        try:
+            self.window_manager.draw(g)
+        finally:
+            g.restore()
 
     def dispatcher_at(self, location: Point) -> Maybe[EventDispatcher]:
         if location is None:
@@ -143,6 +341,24 @@ class Context(EventLoopAware, ReactiveObject, InputLookup, ErrorHandlerSupport,
             self.execute_safely(i.dispose)
 
 
+def _depth_of(component: Component) -> int:
+    depth = 0
+    parent = component.parent
+
+    while parent is not Nothing:
+        depth += 1
+        parent = parent.unwrap().parent
+
+    return depth
+
+
+def _showing(component: Component) -> bool:
+    if not component.visible:
+        return False
+
+    return component.parent.map(_showing).value_or(True)
+
+
 T = TypeVar("T", bound=Context, covariant=True)
 
 
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from functools import reduce
+from math import ceil, floor
+from typing import Iterator, List, Sequence
+
+from returns.maybe import Maybe, Nothing, Some
+
+from alleycat.ui import Bounds
+
+
+class DamageRegion:
+
+    def __init__(self, max_areas: int = 16) -> None:
+        if max_areas < 1:
+            raise ValueError("Argument 'max_areas' must be a positive number.")
+
+        super().__init__()
+
+        self._max_areas = max_areas
+        self._areas: List[Bounds] = []
+
+    @property
+    def max_areas(self) -> int:
+        return self._max_areas
+
+    @property
+    def areas(self) -> Sequence[Bounds]:
+        return tuple(self._areas)
+
+    @property
+    def empty(self) -> bool:
+        return len(self._areas) == 0
+
+    @property
+    def bounds(self) -> Maybe[Bounds]:
+        return Some(reduce(_union, self._areas)) if len(self._areas) > 0 else Nothing
+
+    def add(self, area: Bounds) -> None:
+        if area is None:
+            raise ValueError("Argument 'area' is required.")
+
+        # Snap to the pixel grid so that a partially covered pixel is always cleared and redrawn as a whole.
+        (x1, y1) = (floor(area.x), floor(area.y))
+        (x2, y2) = (ceil(area.x + area.width), ceil(area.y + area.height))
+
+        if x2 <= x1 or y2 <= y1:
+            return
+
+        merged = Bounds(x1, y1, x2 - x1, y2 - y1)
+
+        while True:
+            candidate = next((a for a in self._areas if _should_merge(a, merged)), None)
+
+            if candidate is None:
+                break
+
+            self._areas.remove(candidate)
+
+            merged = _union(candidate, merged)
+
+        self._areas.append(merged)
+
+        if len(self._areas) > self.max_areas:
+            self._areas = [reduce(_union, self._areas)]
+
+    def drain(self) -> Sequence[Bounds]:
+        areas = self.areas
+
+        self._areas.clear()
+
+        return areas
+
+    def clear(self) -> None:
+        self._areas.clear()
+
+    def __iter__(self) -> Iterator[Bounds]:
+        return iter(self.areas)
+
+    def __len__(self) -> int:
+        return len(self._areas)
+
+
+def _area(bounds: Bounds) -> float:
+    return bounds.width * bounds.height
+
+
+def _union(b1: Bounds, b2: Bounds) -> Bounds:
+    x = min(b1.x, b2.x)
+    y = min(b1.y, b2.y)
+
+    return Bounds(x, y, max(b1.x + b1.width, b2.x + b2.width) - x, max(b1.y + b1.height, b2.y + b2.height) - y)
+
+
+def _should_merge(b1: Bounds, b2: Bounds) -> bool:
+    return _area(_union(b1, b2)) <= _area(b1) + _area(b2)
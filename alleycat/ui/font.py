@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from collections import OrderedDict
+from typing import Tuple, TypeVar
 
 import cairocffi
 from cairocffi import FontFace, SVGSurface, ToyFontFace
@@ -27,9 +28,18 @@ class FontRegistry(Registry[T], ABC):
 
 class ToyFontRegistry(FontRegistry[ToyFontFace]):
 
-    def __init__(self, error_handler: ErrorHandler) -> None:
+    def __init__(self, error_handler: ErrorHandler, extents_cache_size: int = 1000) -> None:
+        if extents_cache_size < 0:
+            raise ValueError("Argument 'extents_cache_size' should be zero or a positive number.")
+
         super().__init__(error_handler)
 
+        self._extents_cache_size = extents_cache_size
+        self._extents_cache: OrderedDict[Tuple[str, str, int, int, float], Dimension] = OrderedDict()
+
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         self._fallback_font = ToyFontFace("Sans")
         self._fonts = {"Sans": self.fallback_font}
 
@@ -40,6 +50,18 @@ class ToyFontRegistry(FontRegistry[ToyFontFace]):
     def fallback_font(self) -> ToyFontFace:
         return self._fallback_font
 
+    @property
+    def extents_cache_size(self) -> int:
+        return self._extents_cache_size
+
+    @property
+    def cache_hits(self) -> int:
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        return self._cache_misses
+
     def create(self, name: str) -> Maybe[T]:
         return Some(ToyFontFace(name))
 
@@ -50,14 +72,40 @@ class ToyFontRegistry(FontRegistry[ToyFontFace]):
         if size <= 0:
             raise ValueError("Argument 'size' is must be a positive number.")
 
+        key = (text, font.get_family(), font.get_slant(), font.get_weight(), size)
+
+        if key in self._extents_cache:
+            self._cache_hits += 1
+            self._extents_cache.move_to_end(key)
+
+            return self._extents_cache[key]
+
+        self._cache_misses += 1
+
         self._context.set_font_size(size)
         self._context.set_font_face(font)
 
         (x_bearing, y_bearing, width, height, x_advance, y_advance) = self._context.text_extents(text)
 
-        return Dimension(x_advance, height)
+        extent = Dimension(x_advance, height)
+
+        if self.extents_cache_size > 0:
+            self._extents_cache[key] = extent
+
+            if len(self._extents_cache) > self.extents_cache_size:
+                self._extents_cache.popitem(last=False)
+
+        return extent
+
+    def clear_extents_cache(self) -> None:
+        self._extents_cache.clear()
+
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def dispose(self) -> None:
+        self.clear_extents_cache()
+
         self._surface.finish()
 
         super().dispose()
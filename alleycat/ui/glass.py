@@ -7,8 +7,8 @@ from returns.maybe import Maybe, Nothing
 from rx import Observable, operators as ops
 
 from alleycat.ui import Bounds, Button, Canvas, CanvasUI, Component, ComponentUI, Container, ContainerUI, Dimension, \
-    FontChangeEvent, Frame, FrameUI, Insets, InsetsChangeEvent, Label, LabelButton, LabelUI, \
-    LookAndFeel, Panel, RGBA, TextAlign, Toolkit, Window, WindowUI
+    Event, FontChangeEvent, Frame, FrameUI, Insets, InsetsChangeEvent, Label, LabelButton, LabelUI, \
+    LookAndFeel, Panel, RGBA, TextAlign, Theme, ThemeChangeEvent, Toolkit, Window, WindowUI
 
 T = TypeVar("T", bound=Component, contravariant=True)
 
@@ -25,23 +25,29 @@ class GlassLookAndFeel(LookAndFeel):
         active_color = RGBA(0.3, 0.7, 0.3, 1)
         highlight_color = RGBA(0.9, 0.8, 0.5, 1)
 
-        self.set_font("text", toolkit.fonts.fallback_font)
-
-        self.set_color(with_prefix(StyleKeys.Background, "Window"), RGBA(0, 0, 0, 0.8))
-        self.set_color(with_prefix(StyleKeys.Border, "Window"), active_color)
-        self.set_color(with_prefix(StyleKeys.Background, "Overlay"), RGBA(0, 0, 0, 0))
-        self.set_color(with_prefix(StyleKeys.Border, "Overlay"), RGBA(0, 0, 0, 0))
-        self.set_color(with_prefix(StyleKeys.Border, "Button"), active_color)
-        self.set_color(with_prefix(StyleKeys.BorderHover, "Button"), highlight_color)
-        self.set_color(with_prefix(StyleKeys.BackgroundActive, "Button"), active_color)
-        self.set_color(with_prefix(StyleKeys.BorderActive, "Button"), active_color)
-
-        self.set_color(StyleKeys.Text, RGBA(0.8, 0.8, 0.8, 1))
-        self.set_color(with_prefix(StyleKeys.TextHover, "Button"), highlight_color)
-        self.set_color(with_prefix(StyleKeys.TextActive, "Button"), RGBA(0, 0, 0, 1))
-
-        self.set_insets(StyleKeys.Padding, Insets(10, 10, 10, 10))
-        self.set_insets(with_prefix(StyleKeys.Padding, "Overlay"), Insets(0, 0, 0, 0))
+        self._default_theme = Theme(
+            colors={
+                with_prefix(StyleKeys.Background, "Window"): RGBA(0, 0, 0, 0.8),
+                with_prefix(StyleKeys.Border, "Window"): active_color,
+                with_prefix(StyleKeys.Background, "Overlay"): RGBA(0, 0, 0, 0),
+                with_prefix(StyleKeys.Border, "Overlay"): RGBA(0, 0, 0, 0),
+                with_prefix(StyleKeys.Border, "Button"): active_color,
+                with_prefix(StyleKeys.BorderHover, "Button"): highlight_color,
+                with_prefix(StyleKeys.BackgroundActive, "Button"): active_color,
+                with_prefix(StyleKeys.BorderActive, "Button"): active_color,
+                StyleKeys.Text: RGBA(0.8, 0.8, 0.8, 1),
+                with_prefix(StyleKeys.TextHover, "Button"): highlight_color,
+                with_prefix(StyleKeys.TextActive, "Button"): RGBA(0, 0, 0, 1)
+            },
+            fonts={
+                "text": toolkit.fonts.fallback_font
+            },
+            insets={
+                StyleKeys.Padding: Insets(10, 10, 10, 10),
+                with_prefix(StyleKeys.Padding, "Overlay"): Insets(0, 0, 0, 0)
+            })
+
+        self.apply_theme(self.default_theme)
 
         self.register_ui(Window, GlassWindowUI)
         self.register_ui(Frame, GlassFrameUI)
@@ -51,6 +57,10 @@ class GlassLookAndFeel(LookAndFeel):
         self.register_ui(Label, GlassLabelUI)
         self.register_ui(Canvas, GlassCanvasUI)
 
+    @property
+    def default_theme(self) -> Theme:
+        return self._default_theme
+
     @property
     def default_ui(self) -> ComponentUI[Component]:
         return GlassComponentUI()
@@ -58,6 +68,7 @@ class GlassLookAndFeel(LookAndFeel):
 
 # noinspection PyMethodMayBeStatic
 class GlassComponentUI(ComponentUI[T], Generic[T]):
+    shareable = True
 
     def __init__(self) -> None:
         super().__init__()
@@ -68,7 +79,10 @@ class GlassComponentUI(ComponentUI[T], Generic[T]):
         return super().clip_bounds(component) + Insets(border, border, border, border)
 
     def on_style_change(self, component: T) -> Observable:
-        return rx.merge(component.on_style_change, component.context.look_and_feel.on_style_change)
+        def expand(event: Event) -> Observable:
+            return rx.from_iterable(event.events) if isinstance(event, ThemeChangeEvent) else rx.of(event)
+
+        return rx.merge(component.on_style_change, component.on_inherited_style_change).pipe(ops.flat_map(expand))
 
     def draw(self, g: Graphics, component: T) -> None:
         assert g is not None
@@ -232,10 +246,7 @@ class GlassLabelUI(GlassComponentUI[Label], LabelUI):
         color.map(lambda c: self.draw_text(g, component, font, c))
 
     def draw_text(self, g: Graphics, component: Label, font: FontFace, color: RGBA) -> None:
-        text = component.text
-        size = component.text_size
-
-        extents = component.context.toolkit.fonts.text_extent(text, font, size)
+        extents = self.extents(component)
         padding = component.resolve_insets(StyleKeys.Padding).value_or(Insets(0, 0, 0, 0))
 
         (x, y, w, h) = component.bounds.tuple
@@ -244,22 +255,24 @@ class GlassLabelUI(GlassComponentUI[Label], LabelUI):
         rv = self._ratio_for_align[component.text_vertical_align]
 
         tx = (w - extents.width - padding.left - padding.right) * rh + x + padding.left
-        ty = (h - extents.height - padding.top - padding.bottom) * rv + extents.height + y + padding.top
-
-        g.set_font_face(font)
-        g.set_font_size(size)
+        ty = (h - extents.height - padding.top - padding.bottom) * rv + y + padding.top
 
         # FIXME: Temporary workaround until we get a better way of handling text shadows.
         if component.shadow:
-            g.move_to(tx + 1, ty + 1)
-
             g.set_source_rgba(0, 0, 0, 0.8)
-            g.show_text(text)
 
-        g.move_to(tx, ty)
+            self.show_text(g, component, font, tx + 1, ty + 1)
 
         g.set_source_rgba(color.r, color.g, color.b, color.a)
-        g.show_text(text)
+
+        self.show_text(g, component, font, tx, ty)
+
+    def show_text(self, g: Graphics, component: Label, font: FontFace, x: float, y: float) -> None:
+        g.set_font_face(font)
+        g.set_font_size(component.text_size)
+
+        g.move_to(x, y + self.extents(component).height)
+        g.show_text(component.text)
 
 
 # noinspection PyMethodMayBeStatic
@@ -274,6 +287,9 @@ class GlassButtonUI(GlassComponentUI[Button]):
     def border_color(self, component: T) -> Maybe[RGBA]:
         return self.resolve_color(component, StyleKeys.Border)
 
+    def on_repaint(self, component: Button) -> Observable:
+        return rx.merge(super().on_repaint(component), component.observe("hover"), component.observe("active"))
+
     def resolve_color(self, component: LabelButton, key: str) -> Maybe[RGBA]:
         color: Maybe[RGBA] = Nothing
 
@@ -1,8 +1,19 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeVar, Union
 
-from cairocffi import Surface
+import rx
+from cairocffi import CairoError, FORMAT_ARGB32, ImageSurface, Surface
+from returns.maybe import Maybe, Nothing, Some
+from rx import Observable
 from rx.disposable import Disposable
+from rx.subject import AsyncSubject
 
 from alleycat.ui import Dimension, ErrorHandler, Registry
 
@@ -28,10 +39,279 @@ class Image(Disposable, ABC):
         super().dispose()
 
 
+class ImageCache:
+    # Magic, version, width, height and stride, padded so that the pixel data stays aligned.
+    _header = struct.Struct("<4sIIII")
+    _header_size = 64
+
+    _magic = b"ACIC"
+    _version = 1
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        if directory is None:
+            raise ValueError("Argument 'directory' is required.")
+
+        super().__init__()
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def entry_for(self, path: Union[str, Path]) -> Maybe[Path]:
+        if path is None:
+            raise ValueError("Argument 'path' is required.")
+
+        try:
+            source = Path(path).resolve()
+            stat = source.stat()
+        except OSError:
+            return Nothing
+
+        # A modified source file gets a different entry, while the prefix lets us find the stale ones.
+        return Some(self.directory / f"{self._prefix_for(source)}-{stat.st_mtime_ns:x}-{stat.st_size:x}.argb")
+
+    @staticmethod
+    def _prefix_for(source: Path) -> str:
+        return hashlib.sha1(str(source).encode("utf-8")).hexdigest()
+
+    def load(self, path: Union[str, Path]) -> Maybe[ImageSurface]:
+        if path is None:
+            raise ValueError("Argument 'path' is required.")
+
+        entry = self.entry_for(path)
+
+        if entry == Nothing or not entry.unwrap().exists():
+            return Nothing
+
+        try:
+            with open(entry.unwrap(), "rb") as file:
+                # Copy-on-write mapping shares the pages with other processes, while Cairo still gets a writable buffer.
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            return Nothing
+
+        def invalid() -> Maybe[ImageSurface]:
+            data.close()
+
+            return Nothing
+
+        if len(data) < self._header_size:
+            return invalid()
+
+        (magic, version, width, height, stride) = self._header.unpack_from(data)
+
+        if magic != self._magic or version != self._version:
+            return invalid()
+
+        if stride < width * 4 or stride % 4 != 0 or len(data) < self._header_size + stride * height:
+            return invalid()
+
+        pixels = memoryview(data)[self._header_size:self._header_size + stride * height]
+
+        try:
+            return Some(ImageSurface.create_for_data(pixels, FORMAT_ARGB32, width, height, stride))
+        except (CairoError, ValueError):
+            pixels.release()
+
+            return invalid()
+
+    def store(self, path: Union[str, Path], surface: ImageSurface) -> None:
+        if path is None:
+            raise ValueError("Argument 'path' is required.")
+
+        if surface is None:
+            raise ValueError("Argument 'surface' is required.")
+
+        if surface.get_format() != FORMAT_ARGB32:
+            return
+
+        entry = self.entry_for(path)
+
+        if entry == Nothing:
+            return
+
+        surface.flush()
+
+        (width, height, stride) = (surface.get_width(), surface.get_height(), surface.get_stride())
+
+        header = self._header.pack(self._magic, self._version, width, height, stride)
+
+        (handle, temp_path) = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        # Write to a temporary file first, so that other processes never see a partially written entry.
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(header.ljust(self._header_size, b"\0"))
+                file.write(surface.get_data()[:stride * height])
+
+            os.replace(temp_path, entry.unwrap())
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        prefix = entry.unwrap().name.split("-")[0]
+
+        # Entries for the previous versions of the same file would never be used again.
+        for stale in self.directory.glob(f"{prefix}-*.argb"):
+            if stale != entry.unwrap():
+                try:
+                    stale.unlink(missing_ok=True)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        for entry in self.directory.glob("*.argb"):
+            entry.unlink(missing_ok=True)
+
+
 T = TypeVar("T", bound=Image)
 
 
 class ImageRegistry(Registry[T], ABC):
 
-    def __init__(self, error_handler: ErrorHandler) -> None:
-        super().__init__(error_handler)
+    def __init__(
+            self,
+            error_handler: ErrorHandler,
+            budget: Optional[int] = None,
+            max_workers: int = 2,
+            disk_cache: Optional[ImageCache] = None,
+            executor: Optional[Executor] = None) -> None:
+        if max_workers < 1:
+            raise ValueError("Argument 'max_workers' should be a positive number.")
+
+        super().__init__(error_handler, budget)
+
+        self._disk_cache = disk_cache
+        self._max_workers = max_workers
+        self._executor = executor
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._requests: Dict[str, Tuple[Future, AsyncSubject]] = dict()
+
+    @property
+    def thread_safe(self) -> bool:
+        return True
+
+    @property
+    def pending(self) -> int:
+        return len(self._requests)
+
+    @property
+    def disk_cache(self) -> Maybe[ImageCache]:
+        return Maybe.from_optional(self._disk_cache)
+
+    def load_surface(self, path: Union[str, Path], decoder: Callable[[], ImageSurface]) -> ImageSurface:
+        if path is None:
+            raise ValueError("Argument 'path' is required.")
+
+        if decoder is None:
+            raise ValueError("Argument 'decoder' is required.")
+
+        if self._disk_cache is None:
+            return decoder()
+
+        cached = self._disk_cache.load(path)
+
+        if cached != Nothing:
+            return cached.unwrap()
+
+        surface = decoder()
+
+        self.execute_safely(lambda: self._disk_cache.store(path, surface))
+
+        return surface
+
+    def item_size(self, item: T) -> int:
+        (width, height) = item.size.tuple
+
+        return int(width * height * 4)
+
+    def prefetch(self, keys: Iterable[str]) -> None:
+        if keys is None:
+            raise ValueError("Argument 'keys' is required.")
+
+        for key in keys:
+            if key not in self:
+                self._request(key)
+
+    def get_async(self, key: str) -> Observable:
+        if key is None:
+            raise ValueError("Argument 'key' is required.")
+
+        if key in self:
+            return rx.of(Maybe.from_optional(self[key]))
+
+        return self._request(key)
+
+    def _request(self, key: str) -> Observable:
+        if key in self._requests:
+            return self._requests[key][1]
+
+        if self.thread_safe:
+            # We only create our own pool when no executor has been given, and only once it's actually needed.
+            if self._executor is None:
+                self._pool = ThreadPoolExecutor(self._max_workers, thread_name_prefix="alleycat-images")
+                self._executor = self._pool
+
+            future = self._executor.submit(self.create, key)
+        else:
+            future = Future()
+
+        subject = AsyncSubject()
+
+        self._requests[key] = (future, subject)
+
+        return subject
+
+    def process(self) -> None:
+        if len(self._requests) == 0:
+            return
+
+        for (key, (future, subject)) in list(self._requests.items()):
+            loaded_here = False
+
+            if not future.done():
+                if self.thread_safe:
+                    continue
+
+                # Registries which can't create items in other threads load a single item per frame instead.
+                try:
+                    future.set_result(self.create(key))
+                except BaseException as e:
+                    future.set_exception(e)
+
+                loaded_here = True
+
+            del self._requests[key]
+
+            try:
+                result: Maybe[T] = future.result()
+            except BaseException as e:
+                self.error_handler(e)
+                result = Nothing
+
+            # The item might have been loaded synchronously while we were waiting for the result.
+            if key in self:
+                result.map(lambda i: None if i is self[key] else self.execute_safely(i.dispose))
+            else:
+                result.map(lambda i: self.__setitem__(key, i))
+
+            subject.on_next(Maybe.from_optional(self[key] if key in self else None))
+            subject.on_completed()
+
+            if loaded_here:
+                break
+
+    def dispose(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+        for (future, subject) in self._requests.values():
+            future.cancel()
+            subject.on_completed()
+
+        self._requests.clear()
+
+        super().dispose()
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from abc import ABC
+from abc import ABC, abstractmethod
 from enum import Enum
 from itertools import chain
-from typing import Mapping, Set, cast
+from typing import AbstractSet, Mapping, Set, cast
 
-from alleycat.reactive import RV
+import rx
+from alleycat.reactive import RV, functions as rv
 from rx import Observable, operators as ops
+from rx.subject import Subject
 
-from alleycat.ui import Context, Input, InputLookup
+from alleycat.ui import Context, EventLoopAware, Input, InputLookup
 
 
 class KeyState(Enum):
@@ -32,16 +34,23 @@ class KeyInput(Input, ABC):
 
             return dict(chain(hold, pressed, released))
 
-        self._states = self.observe("pressed").pipe(
+        changes = self.observe("pressed").pipe(
             ops.start_with(set()),
             ops.pairwise(),
-            ops.map(lambda s: to_state(s[0], s[1])),
-            ops.share())
+            ops.map(lambda s: to_state(s[0], s[1])))
+
+        holds = rx.defer(lambda _: self.on_hold).pipe(ops.map(lambda keys: dict.fromkeys(keys, KeyState.Hold)))
+
+        self._states = rx.merge(changes, holds).pipe(ops.share())
 
     @property
     def id(self) -> str:
         return self.ID
 
+    @property
+    def on_hold(self) -> Observable:
+        return rx.empty()
+
     @staticmethod
     def input(lookup: InputLookup) -> KeyInput:
         if lookup is None:
@@ -64,3 +73,42 @@ class KeyInput(Input, ABC):
         return self.on_key_state_change(key_code).pipe(
             ops.filter(lambda s: s == KeyState.Released),
             ops.map(lambda _: key_code))
+
+
+class PollingKeyInput(KeyInput, EventLoopAware, ABC):
+    pressed: RV[Set[int]] = rv.new_view()
+
+    def __init__(self, context: Context) -> None:
+        super().__init__(context)
+
+        self._pressed = Subject()
+        self._held = Subject()
+
+        self._last_pressed: Set[int] = set()
+
+        # noinspection PyTypeChecker
+        self.pressed = self._pressed.pipe(ops.start_with(set()))
+
+    @abstractmethod
+    def poll(self) -> AbstractSet[int]:
+        pass
+
+    @property
+    def on_hold(self) -> Observable:
+        return self._held
+
+    def process(self) -> None:
+        keys = self.poll()
+
+        # The pressed keys are only emitted when they change, but those still held down are reported on every tick.
+        if keys != self._last_pressed:
+            self._last_pressed = set(keys)
+            self._pressed.on_next(self._last_pressed)
+        elif len(keys) > 0:
+            self._held.on_next(self._last_pressed)
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        self.execute_safely(self._pressed.dispose)
+        self.execute_safely(self._held.dispose)
@@ -3,8 +3,10 @@ from enum import Enum
 from itertools import chain
 from typing import Iterable
 
+import rx
 from alleycat.reactive import RP, functions as rv
 from cairocffi import FontFace
+from rx import Observable
 
 from alleycat.ui import Component, ComponentUI, Context, Dimension
 
@@ -44,6 +46,7 @@ class Label(Component):
         self.text_vertical_align = text_vertical_align
         self.text_size = text_size
         self.shadow = shadow
+        self.cached = True
 
         super().__init__(context, visible)
 
@@ -61,6 +64,13 @@ class LabelUI(ComponentUI[Label], ABC):
     def font(self, component: Label) -> FontFace:
         pass
 
+    def on_repaint(self, component: Label) -> Observable:
+        return rx.merge(
+            super().on_repaint(component),
+            component.observe("text_align"),
+            component.observe("text_vertical_align"),
+            component.observe("shadow"))
+
     def extents(self, component: Label) -> Dimension:
         text = component.text
         size = component.text_size
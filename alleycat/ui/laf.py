@@ -2,9 +2,13 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from functools import cmp_to_key
-from typing import TypeVar, Type, Callable, List, Tuple
+from typing import TypeVar, Type, Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING, Union
+from weakref import WeakSet
 
-from alleycat.ui import StyleLookup, Component, Toolkit, ComponentUI
+from alleycat.ui import StyleLookup, Component, Toolkit, ComponentUI, ThemeChangeEvent
+
+if TYPE_CHECKING:
+    from alleycat.ui import StyleChangeEvent, StyleResolver
 
 T = TypeVar("T", bound=Component, contravariant=True)
 
@@ -19,6 +23,9 @@ class LookAndFeel(StyleLookup, ABC):
 
         self._toolkit = toolkit
         self._ui_factories: List[Tuple[Type, Callable[[], ComponentUI]]] = list()
+        self._ui_factory_cache: Dict[Type, Optional[Callable[[], ComponentUI]]] = dict()
+        self._shared_uis: Dict[Type, ComponentUI] = dict()
+        self._style_dependents: Dict[str, WeakSet[StyleResolver]] = dict()
 
     @property
     def toolkit(self) -> Toolkit:
@@ -28,11 +35,35 @@ class LookAndFeel(StyleLookup, ABC):
         if component is None:
             raise ValueError("Argument 'component' is required.")
 
-        for factory in self._ui_factories:
-            if isinstance(component, factory[0]):
-                return factory[1]()
+        component_type = type(component)
+
+        if component_type in self._shared_uis:
+            return self._shared_uis[component_type]
+
+        factory = self.ui_factory(component_type)
+
+        ui = self.default_ui if factory is None else factory()
 
-        return self.default_ui
+        if ui.shareable:
+            self._shared_uis[component_type] = ui
+
+        return ui
+
+    def ui_factory(self, component_type: Type) -> Optional[Callable[[], ComponentUI]]:
+        if component_type is None:
+            raise ValueError("Argument 'component_type' is required.")
+
+        try:
+            return self._ui_factory_cache[component_type]
+        except KeyError:
+            pass
+
+        # Factories are sorted from the most specific type, so the first match is the closest one in the MRO.
+        factory = next((f for (t, f) in self._ui_factories if issubclass(component_type, t)), None)
+
+        self._ui_factory_cache[component_type] = factory
+
+        return factory
 
     def register_ui(self, component_type: Type, factory: Callable[[], ComponentUI]) -> None:
         if factory is None:
@@ -54,12 +85,66 @@ class LookAndFeel(StyleLookup, ABC):
 
         self._ui_factories = sorted(factories, key=cmp_to_key(comparator))
 
+        self._invalidate_ui_cache()
+
     def deregister_ui(self, component_type: Type) -> None:
         if component_type is None:
             raise ValueError("Argument 'component_type' is required.")
 
         self._ui_factories = [i for i in self._ui_factories if i[0] != component_type]
 
+        self._invalidate_ui_cache()
+
+    def _invalidate_ui_cache(self) -> None:
+        self._ui_factory_cache.clear()
+        self._shared_uis.clear()
+
+    def add_style_dependency(self, key: str, resolver: StyleResolver) -> None:
+        if key is None:
+            raise ValueError("Argument 'key' is required.")
+
+        if resolver is None:
+            raise ValueError("Argument 'resolver' is required.")
+
+        self._style_dependents.setdefault(key, WeakSet()).add(resolver)
+
+    def remove_style_dependencies(self, keys: Iterable[str], resolver: StyleResolver) -> None:
+        if keys is None:
+            raise ValueError("Argument 'keys' is required.")
+
+        if resolver is None:
+            raise ValueError("Argument 'resolver' is required.")
+
+        for key in keys:
+            if key in self._style_dependents:
+                self._style_dependents[key].discard(resolver)
+
+    def style_dependents(self, key: str) -> Iterable[StyleResolver]:
+        if key is None:
+            raise ValueError("Argument 'key' is required.")
+
+        return tuple(self._style_dependents.get(key, ()))
+
+    def _notify_style_change(self, event: Union[StyleChangeEvent, ThemeChangeEvent]) -> None:
+        super()._notify_style_change(event)
+
+        if not isinstance(event, ThemeChangeEvent):
+            # Only the resolvers which have looked up the key before can be affected by the change.
+            for resolver in self.style_dependents(event.key):
+                resolver.notify_inherited_style_change(event)
+
+            return
+
+        changes: Dict[StyleResolver, List[StyleChangeEvent]] = dict()
+
+        for change in event.events:
+            for resolver in self.style_dependents(change.key):
+                changes.setdefault(resolver, []).append(change)
+
+        # Each resolver receives a single notification which only contains the changes relevant to it.
+        for (resolver, events) in changes.items():
+            resolver.notify_inherited_style_change(ThemeChangeEvent(self, tuple(events)))
+
     @property
     @abstractmethod
     def default_ui(self) -> ComponentUI[Component]:
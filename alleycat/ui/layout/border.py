@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from enum import Enum
 from functools import reduce
-from typing import Any, Callable, Mapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, Sequence
 
 from alleycat.reactive import ReactiveObject
 from returns.maybe import Maybe, Nothing, Some
@@ -77,13 +77,30 @@ class BorderLayout(Layout):
         area.component = Some(child)
         area.padding = padding
 
+    def add_all(self, children: Iterable[Component], *args, **kwargs) -> None:
+        if children is None:
+            raise ValueError("Argument 'children' is required.")
+
+        # Each region can only hold a single component, so there is little to gain from adding them at once.
+        for child in children:
+            self.add(child, *args, **kwargs)
+
     def remove(self, child: Component) -> None:
-        super().remove(child)
+        if child is None:
+            raise ValueError("Argument 'child' is required.")
+
+        self.remove_all((child,))
+
+    def remove_all(self, children: Iterable[Component]) -> None:
+        if children is None:
+            raise ValueError("Argument 'children' is required.")
+
+        removed = tuple(children)
 
-        c = Some(child)
+        super().remove_all(removed)
 
         for area in self.areas.values():
-            if area.component == c:
+            if area.component.map(lambda c: c in removed).value_or(False):
                 area.component = Nothing
 
     def perform(self, bounds: Bounds) -> None:
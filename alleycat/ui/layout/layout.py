@@ -2,22 +2,26 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from itertools import chain
-from typing import Any, Mapping, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 import rx
 from alleycat.reactive import RP, RV, ReactiveObject, functions as rv
 from rx import Observable
+from rx.subject import Subject
 
 from alleycat.ui import Bounds, Component, Dimension
 
-
 class Layout(ReactiveObject, ABC):
     _children: RP[Sequence[LayoutItem]] = rv.from_value(())
 
     children: RV[Sequence[LayoutItem]] = _children.as_view()
 
     def __init__(self) -> None:
+        self._items: Dict[Component, LayoutItem] = dict()
+        self._components: Sequence[Component] = ()
+
+        self._children_change = Subject()
+
         super().__init__()
 
     @property
@@ -30,22 +34,77 @@ class Layout(ReactiveObject, ABC):
     def preferred_size(self) -> Dimension:
         pass
 
+    @property
+    def components(self) -> Sequence[Component]:
+        return self._components
+
+    @property
+    def on_children_change(self) -> Observable:
+        return self._children_change
+
     def add(self, child: Component, *args, **kwargs) -> None:
         if child is None:
             raise ValueError("Argument 'child' is required.")
 
-        existing = filter(lambda c: c.component != child, self._children)
-        item = LayoutItem(child, args, kwargs)
+        moved = self._put(child, args, kwargs)
 
-        # noinspection PyTypeChecker
-        self._children = tuple(chain(existing, (item,)))
+        self._update_children((child,), (child,) if moved else ())
+
+    def add_all(self, children: Iterable[Component], *args, **kwargs) -> None:
+        if children is None:
+            raise ValueError("Argument 'children' is required.")
+
+        added = tuple(children)
+        moved: List[Component] = []
+
+        for child in added:
+            if self._put(child, args, kwargs):
+                moved.append(child)
+
+        self._update_children(added, tuple(moved))
 
     def remove(self, child: Component) -> None:
         if child is None:
             raise ValueError("Argument 'child' is required.")
 
+        if self._items.pop(child, None) is not None:
+            self._update_children((), (child,))
+
+    def remove_all(self, children: Iterable[Component]) -> None:
+        if children is None:
+            raise ValueError("Argument 'children' is required.")
+
+        removed: List[Component] = []
+
+        for child in children:
+            if self._items.pop(child, None) is not None:
+                removed.append(child)
+
+        if len(removed) > 0:
+            self._update_children((), tuple(removed))
+
+    def __contains__(self, child: object) -> bool:
+        return child in self._items
+
+    def _put(self, child: Component, args: Tuple[Any, ...], kwargs: Mapping[str, Any]) -> bool:
+        if child is None:
+            raise ValueError("Argument 'child' is required.")
+
+        # Adding an existing child again moves it to the end.
+        existing = self._items.pop(child, None) is not None
+
+        self._items[child] = LayoutItem(child, args, kwargs)
+
+        return existing
+
+    def _update_children(self, added: Sequence[Component], removed: Sequence[Component]) -> None:
+        self._components = tuple(self._items.keys())
+
+        # Observers which only need to know what has changed can follow the delta instead of comparing the snapshots.
+        self._children_change.on_next(ChildrenChange(added, removed))
+
         # noinspection PyTypeChecker
-        self._children = tuple(filter(lambda c: c.component != child, self._children))
+        self._children = tuple(self._items.values())
 
     @property
     def on_constraints_change(self) -> Observable:
@@ -55,6 +114,18 @@ class Layout(ReactiveObject, ABC):
     def perform(self, bounds: Bounds) -> None:
         pass
 
+    def dispose(self) -> None:
+        self._children_change.on_completed()
+
+        super().dispose()
+
+
+@dataclass(frozen=True)
+class ChildrenChange:
+    added: Sequence[Component]
+
+    removed: Sequence[Component]
+
 
 @dataclass(frozen=True)
 class LayoutItem:
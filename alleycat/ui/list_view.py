@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from itertools import chain
+from math import ceil
+from typing import Any, Callable, Iterable, List, Optional, Sequence
+
+import rx
+from alleycat.reactive import RP, functions as rv
+from rx import Observable, operators as ops
+
+from alleycat.ui import Bounds, Component, Context, Dimension, Insets, Layout, MouseInput, Panel
+from alleycat.ui.layout import BoxAlign
+
+
+class ListView(Panel):
+    items: RP[Sequence[Any]] = rv.new_property()
+
+    row_height: RP[float] = rv.new_property()
+
+    spacing: RP[float] = rv.new_property()
+
+    padding: RP[Insets] = rv.new_property()
+
+    align: RP[BoxAlign] = rv.new_property()
+
+    scroll_offset: RP[float] = rv.from_value(0.)
+
+    # noinspection PyTypeChecker
+    def __init__(
+            self,
+            context: Context,
+            row_factory: Callable[[Context], Component],
+            row_binder: Callable[[Component, Any], None],
+            items: Sequence[Any] = (),
+            row_height: float = 20,
+            spacing: float = 0,
+            padding: Insets = Insets(0, 0, 0, 0),
+            align: BoxAlign = BoxAlign.Stretch,
+            visible: bool = True) -> None:
+        if row_factory is None:
+            raise ValueError("Argument 'row_factory' is required.")
+
+        if row_binder is None:
+            raise ValueError("Argument 'row_binder' is required.")
+
+        if items is None:
+            raise ValueError("Argument 'items' is required.")
+
+        if row_height <= 0:
+            raise ValueError("Argument 'row_height' should be a positive number.")
+
+        if spacing < 0:
+            raise ValueError("Argument 'spacing' should be zero or a positive number.")
+
+        self.items = items
+        self.row_height = row_height
+        self.spacing = spacing
+        self.padding = padding
+        self.align = align
+
+        self._row_factory = row_factory
+        self._row_binder = row_binder
+
+        self._rows: List[Component] = []
+        self._bindings: List[Optional[int]] = []
+        self._first = 0
+
+        super().__init__(context, _ListViewLayout(self), visible)
+
+        self.observe("items") \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self._clear_bindings(), on_error=self.error_handler)
+
+        # The offset is clamped again while we arrange the rows, which doesn't need another layout.
+        self.observe("scroll_offset") \
+            .pipe(
+                ops.distinct_until_changed(),
+                ops.filter(lambda _: not self._layout_running),
+                ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.request_layout(), on_error=self.error_handler)
+
+        mouse = MouseInput.input(context)
+
+        mouse.on_mouse_wheel \
+            .pipe(ops.filter(lambda _: self.visible and self in mouse.hovered), ops.take_until(self.on_dispose)) \
+            .subscribe(lambda lines: self.scroll_by(lines * self.row_stride), on_error=self.error_handler)
+
+    @property
+    def rows(self) -> Sequence[Component]:
+        return tuple(self._rows)
+
+    @property
+    def row_stride(self) -> float:
+        return self.row_height + self.spacing
+
+    @property
+    def max_scroll_offset(self) -> float:
+        (top, _, bottom, _) = self.padding.tuple
+
+        height = max(self.bounds.height - top - bottom, 0)
+
+        return max(len(self.items) * self.row_stride - self.spacing - height, 0)
+
+    @property
+    def visible_range(self) -> range:
+        return range(self._first, min(self._first + len(self._rows), len(self.items)))
+
+    # noinspection PyTypeChecker
+    def scroll_to(self, offset: float) -> None:
+        self.scroll_offset = min(max(offset, 0), self.max_scroll_offset)
+
+    def scroll_by(self, delta: float) -> None:
+        self.scroll_to(self.scroll_offset + delta)
+
+    def scroll_to_item(self, index: int) -> None:
+        self.scroll_to(index * self.row_stride)
+
+    def arrange_rows(self, bounds: Bounds) -> None:
+        if bounds is None:
+            raise ValueError("Argument 'bounds' is required.")
+
+        (top, right, bottom, left) = self.padding.tuple
+
+        area = Bounds(
+            bounds.x + left,
+            bounds.y + top,
+            max(bounds.width - left - right, 0),
+            max(bounds.height - top - bottom, 0))
+
+        items = self.items
+        count = len(items)
+
+        stride = self.row_stride
+        offset = min(max(self.scroll_offset, 0), self.max_scroll_offset)
+
+        # Changing the items or the bounds may leave the current offset out of range.
+        if offset != self.scroll_offset:
+            self.scroll_offset = offset
+
+        first = int(offset // stride)
+
+        self._first = first
+
+        # We keep enough rows to fill the area even when the first one is partially scrolled out of view.
+        capacity = ceil(area.height / stride) + 1 if area.height > 0 else 0
+
+        self._resize_pool(min(capacity, count))
+
+        for (i, row) in enumerate(self._rows):
+            index = first + i
+
+            visible = index < count
+
+            if row.visible != visible:
+                row.visible = visible
+
+            if not visible:
+                continue
+
+            if self._bindings[i] != index:
+                self._row_binder(row, items[index])
+                self._bindings[i] = index
+
+            row_bounds = self._row_bounds(row, area, area.y + index * stride - offset)
+
+            if row.bounds != row_bounds:
+                row.bounds = row_bounds
+
+    def _row_bounds(self, row: Component, area: Bounds, y: float) -> Bounds:
+        align = self.align
+        height = self.row_height
+
+        if align == BoxAlign.Stretch:
+            return Bounds(area.x, y, area.width, height)
+
+        width = min(row.preferred_size.width, area.width)
+
+        if align == BoxAlign.Begin:
+            return Bounds(area.x, y, width, height)
+        elif align == BoxAlign.End:
+            return Bounds(area.x + area.width - width, y, width, height)
+
+        return Bounds(area.x + (area.width - width) / 2., y, width, height)
+
+    def _resize_pool(self, size: int) -> None:
+        rows = self._rows
+
+        if size > len(rows):
+            created = [self._row_factory(self.context) for _ in range(size - len(rows))]
+
+            rows.extend(created)
+
+            self._bindings.extend([None] * len(created))
+            self.add_all(created)
+        elif size < len(rows):
+            removed = rows[size:]
+
+            del rows[size:]
+            del self._bindings[size:]
+
+            self.remove_all(removed)
+
+            for row in removed:
+                self.execute_safely(row.dispose)
+
+    def _clear_bindings(self) -> None:
+        self._bindings = [None] * len(self._rows)
+
+    @property
+    def style_fallback_prefixes(self) -> Iterable[str]:
+        return chain(["ListView"], super().style_fallback_prefixes)
+
+
+class _ListViewLayout(Layout):
+
+    def __init__(self, view: ListView) -> None:
+        super().__init__()
+
+        self._view = view
+
+    @property
+    def minimum_size(self) -> Dimension:
+        (top, right, bottom, left) = self._view.padding.tuple
+
+        return Dimension(left + right, top + bottom)
+
+    @property
+    def preferred_size(self) -> Dimension:
+        view = self._view
+
+        (top, right, bottom, left) = view.padding.tuple
+
+        width = max((r.preferred_size.width for r in view.rows), default=0)
+        height = max(len(view.items) * view.row_stride - view.spacing, 0)
+
+        return Dimension(width + left + right, height + top + bottom)
+
+    @property
+    def on_constraints_change(self) -> Observable:
+        view = self._view
+
+        return rx.merge(
+            super().on_constraints_change,
+            view.observe("items"),
+            view.observe("row_height"),
+            view.observe("spacing"),
+            view.observe("padding"),
+            view.observe("align"))
+
+    def perform(self, bounds: Bounds) -> None:
+        self._view.arrange_rows(bounds)
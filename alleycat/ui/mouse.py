@@ -3,15 +3,16 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import IntFlag
-from typing import Any, Sequence, cast
+from typing import Any, List, Optional, Sequence, Tuple, cast
 
 import rx
-from alleycat.reactive import RP, RV, functions as rv
+from alleycat.reactive import RP, RV, ReactiveObject, functions as rv
+from returns.maybe import Nothing
 from rx import Observable, operators as ops
 from rx.subject import Subject
 
-from alleycat.ui import Bounded, Context, Event, EventHandler, Input, InputLookup, Point, PositionalEvent, \
-    PropagatingEvent
+from alleycat.ui import Bounded, Context, Event, EventDispatcher, EventHandler, EventLoopAware, Input, InputLookup, \
+    Point, PositionalEvent, PropagatingEvent
 
 
 class MouseButton(IntFlag):
@@ -120,26 +121,11 @@ class MouseEventHandler(Bounded, EventHandler, ABC):
 
     @property
     def on_mouse_over(self) -> Observable:
-        position = MouseInput.input(self).observe("position")
-        local_pos = position.pipe(ops.map(lambda p: p - self.offset))
-
-        return self.on_mouse_move.pipe(
-            ops.map(lambda e: e.position),
-            ops.map(lambda p: rx.concat(rx.of(p), rx.never().pipe(
-                ops.take_until(local_pos.pipe(ops.filter(lambda l: not self.bounds.contains(l))))))),
-            ops.exclusive(),
-            ops.map(lambda p: MouseOverEvent(self, p)))
+        return self.events.pipe(ops.filter(lambda e: isinstance(e, MouseOverEvent)))
 
     @property
     def on_mouse_out(self) -> Observable:
-        position = MouseInput.input(self).observe("position")
-
-        return self.on_mouse_over.pipe(
-            ops.map(lambda e: position.pipe(
-                ops.filter(lambda p: not self.bounds.contains(p - self.offset)),
-                ops.take(1))),
-            ops.exclusive(),
-            ops.map(lambda p: MouseOutEvent(self, p)))
+        return self.events.pipe(ops.filter(lambda e: isinstance(e, MouseOutEvent)))
 
     @property
     def on_drag_start(self) -> Observable:
@@ -222,6 +208,12 @@ class MouseInput(Input, ABC):
     def __init__(self, context: Context):
         super().__init__(context)
 
+        self._hovered: Tuple[EventDispatcher, ...] = ()
+
+        self._hover_tracker = self.observe("position") \
+            .pipe(ops.distinct_until_changed(), ops.take_until(self.on_dispose)) \
+            .subscribe(self._update_hover, on_error=self.error_handler)
+
         def dispatch(event: PositionalEvent) -> None:
             self.context.dispatcher_at(event.position).map(lambda d: d.dispatch_event(event))
 
@@ -233,6 +225,33 @@ class MouseInput(Input, ABC):
     def id(self) -> str:
         return self.ID
 
+    @property
+    def hovered(self) -> Sequence[EventDispatcher]:
+        return self._hovered
+
+    def _update_hover(self, position: Point) -> None:
+        path: List[EventDispatcher] = []
+
+        target = self.context.dispatcher_at(position)
+
+        while target != Nothing:
+            dispatcher = target.unwrap()
+            path.append(dispatcher)
+            target = dispatcher.parent_dispatcher
+
+        previous = self._hovered
+
+        self._hovered = tuple(path)
+
+        # We only need to notify those which have actually entered or left the hovered path.
+        for dispatcher in previous:
+            if dispatcher not in path and not (isinstance(dispatcher, ReactiveObject) and dispatcher.disposed):
+                dispatcher.dispatch_event(MouseOutEvent(dispatcher, position))
+
+        for dispatcher in reversed(path):
+            if dispatcher not in previous:
+                dispatcher.dispatch_event(MouseOverEvent(dispatcher, position))
+
     @staticmethod
     def input(lookup: InputLookup) -> MouseInput:
         if lookup is None:
@@ -295,6 +314,9 @@ class MouseInput(Input, ABC):
         super().dispose()
 
         self.execute_safely(self._dispatchers.dispose)
+        self.execute_safely(self._hover_tracker.dispose)
+
+        self._hovered = ()
 
 
 class FakeMouseInput(MouseInput):
@@ -351,3 +373,67 @@ class FakeMouseInput(MouseInput):
         self.execute_safely(self._scroll.dispose)
 
         super().dispose()
+
+
+class PollingMouseInput(MouseInput, EventLoopAware, ABC):
+    position: RV[Point] = rv.new_view()
+
+    buttons: RV[int] = rv.new_view()
+
+    def __init__(self, context: Context) -> None:
+        super().__init__(context)
+
+        self._position = Subject()
+        self._buttons = Subject()
+        self._wheel = Subject()
+
+        self._last_position: Optional[Point] = None
+        self._last_buttons = 0
+
+        # noinspection PyTypeChecker
+        self.position = self._position
+
+        # noinspection PyTypeChecker
+        self.buttons = self._buttons.pipe(ops.start_with(0), ops.share())
+
+    @abstractmethod
+    def poll_position(self) -> Point:
+        pass
+
+    @abstractmethod
+    def poll_buttons(self) -> int:
+        pass
+
+    @abstractmethod
+    def poll_wheel(self) -> float:
+        pass
+
+    @property
+    def on_mouse_wheel(self) -> Observable:
+        return self._wheel
+
+    def process(self) -> None:
+        # We compare the state with that of the previous tick, so nothing is emitted while the mouse is idle.
+        position = self.poll_position()
+
+        if position != self._last_position:
+            self._last_position = position
+            self._position.on_next(position)
+
+        buttons = self.poll_buttons()
+
+        if buttons != self._last_buttons:
+            self._last_buttons = buttons
+            self._buttons.on_next(buttons)
+
+        wheel = self.poll_wheel()
+
+        if wheel != 0:
+            self._wheel.on_next(wheel)
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        self.execute_safely(self._position.dispose)
+        self.execute_safely(self._buttons.dispose)
+        self.execute_safely(self._wheel.dispose)
@@ -0,0 +1,152 @@
+from typing import Optional, Tuple, cast
+
+import pangocairocffi
+from cairocffi import Context as Graphics, FONT_SLANT_ITALIC, FONT_SLANT_OBLIQUE, FONT_WEIGHT_BOLD, FORMAT_ARGB32, \
+    FontOptions, ImageSurface, ToyFontFace
+from pangocffi import FontDescription, Layout, Style, Weight, units_from_double, units_to_double
+from returns.maybe import Maybe, Some
+
+from alleycat.ui import Dimension, ErrorHandler, FontRegistry, Label, LabelButton, Toolkit
+from alleycat.ui.glass import GlassLabelButtonUI, GlassLabelUI, GlassLookAndFeel
+
+
+class PangoFontRegistry(FontRegistry[ToyFontFace]):
+
+    def __init__(self, error_handler: ErrorHandler, font_options: Optional[FontOptions] = None) -> None:
+        super().__init__(error_handler)
+
+        self._fallback_font = ToyFontFace("Sans")
+
+        # Measure text on a raster surface, so that the metrics match what we draw on the screen.
+        self._surface = ImageSurface(FORMAT_ARGB32, 1, 1)
+        self._context = Graphics(self._surface)
+
+        if font_options is not None:
+            self._context.set_font_options(font_options)
+
+        self._layout = pangocairocffi.create_layout(self._context)
+
+    @property
+    def fallback_font(self) -> ToyFontFace:
+        return self._fallback_font
+
+    def create(self, name: str) -> Maybe[ToyFontFace]:
+        return Some(ToyFontFace(name))
+
+    # noinspection PyMethodMayBeStatic
+    def font_description(self, font: ToyFontFace, size: float) -> FontDescription:
+        if font is None:
+            raise ValueError("Argument 'font' is required.")
+
+        if size <= 0:
+            raise ValueError("Argument 'size' is must be a positive number.")
+
+        slant = font.get_slant()
+
+        description = FontDescription()
+
+        description.set_family(font.get_family())
+        description.set_style(
+            Style.ITALIC if slant == FONT_SLANT_ITALIC else Style.OBLIQUE if slant == FONT_SLANT_OBLIQUE
+            else Style.NORMAL)
+        description.set_weight(Weight.BOLD if font.get_weight() == FONT_WEIGHT_BOLD else Weight.NORMAL)
+        description.set_absolute_size(units_from_double(size))
+
+        return description
+
+    def create_layout(self, text: str, font: ToyFontFace, size: float) -> Layout:
+        if text is None:
+            raise ValueError("Argument 'text' is required.")
+
+        layout = pangocairocffi.create_layout(self._context)
+
+        layout.set_font_description(self.font_description(font, size))
+        layout.set_text(text)
+
+        return layout
+
+    def layout_extent(self, layout: Layout) -> Dimension:
+        if layout is None:
+            raise ValueError("Argument 'layout' is required.")
+
+        (_, extents) = layout.get_extents()
+
+        return Dimension(units_to_double(extents.width), units_to_double(extents.height))
+
+    def text_extent(self, text: str, font: ToyFontFace, size: float) -> Dimension:
+        if text is None:
+            raise ValueError("Argument 'text' is required.")
+
+        self._layout.set_font_description(self.font_description(font, size))
+        self._layout.set_text(text)
+
+        return self.layout_extent(self._layout)
+
+    def dispose(self) -> None:
+        self._surface.finish()
+
+        super().dispose()
+
+
+class GlassPangoLabelUI(GlassLabelUI):
+    # Each label keeps its own shaped text layout.
+    shareable = False
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._layout: Optional[Layout] = None
+        self._layout_key: Optional[Tuple[str, str, int, int, float]] = None
+
+    def text_layout(self, component: Label) -> Layout:
+        fonts = cast(PangoFontRegistry, component.context.toolkit.fonts)
+
+        text = component.text
+        size = component.text_size
+        font = self.font(component)
+
+        key = (text, font.get_family(), font.get_slant(), font.get_weight(), size)
+
+        # Only shape the text again when it's necessary, so we can use the same layout for measuring and drawing.
+        if self._layout is None or self._layout_key is None:
+            self._layout = fonts.create_layout(text, font, size)
+        elif key[1:] != self._layout_key[1:]:
+            self._layout.set_font_description(fonts.font_description(font, size))
+            self._layout.set_text(text)
+        elif text != self._layout_key[0]:
+            self._layout.set_text(text)
+
+        self._layout_key = key
+
+        return self._layout
+
+    def extents(self, component: Label) -> Dimension:
+        fonts = cast(PangoFontRegistry, component.context.toolkit.fonts)
+
+        return fonts.layout_extent(self.text_layout(component))
+
+    def show_text(self, g: Graphics, component: Label, font: ToyFontFace, x: float, y: float) -> None:
+        layout = self.text_layout(component)
+
+        # The layout was created for the measuring context, so it has to pick up the font options and transformation
+        # of the one we draw on.
+        pangocairocffi.update_layout(g, layout)
+
+        g.move_to(x, y)
+
+        pangocairocffi.show_layout(g, layout)
+
+
+class GlassPangoLabelButtonUI(GlassLabelButtonUI, GlassPangoLabelUI):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+
+class GlassPangoLookAndFeel(GlassLookAndFeel):
+
+    def __init__(self, toolkit: Toolkit) -> None:
+        super().__init__(toolkit)
+
+        self.register_ui(LabelButton, GlassPangoLabelButtonUI)
+        self.register_ui(Label, GlassPangoLabelUI)
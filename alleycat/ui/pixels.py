@@ -0,0 +1,46 @@
+import sys
+from typing import Any, Protocol, Sequence
+
+import numpy as np
+from cairocffi import FORMAT_ARGB32, ImageSurface
+
+# Cairo stores ARGB32 pixels as native-endian 32-bit integers, so the byte order depends on the platform.
+_CHANNEL_ORDER = [2, 1, 0, 3] if sys.byteorder == "little" else [3, 0, 1, 2]
+
+
+class PixelSource(Protocol):
+
+    @property
+    def size(self) -> Sequence[int]:
+        ...
+
+    @property
+    def pixels(self) -> Any:
+        ...
+
+
+def surface_from_pixels(source: PixelSource) -> ImageSurface:
+    if source is None:
+        raise ValueError("Argument 'source' is required.")
+
+    (width, height) = source.size
+
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+
+    source.pixels.foreach_get(pixels)
+
+    surface = ImageSurface(FORMAT_ARGB32, width, height)
+    surface.flush()
+
+    stride = surface.get_stride()
+
+    target = np.ndarray((height, stride // 4, 4), dtype=np.uint8, buffer=surface.get_data())
+
+    # Rows of Blender images start from the bottom, so we flip them while converting RGBA floats to ARGB32.
+    rgba = np.clip(pixels.reshape((height, width, 4))[::-1] * 255, 0, 255).astype(np.uint8)
+
+    target[:, :width] = rgba[:, :, _CHANNEL_ORDER]
+
+    surface.mark_dirty()
+
+    return surface
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Generic, Iterator, Optional, TypeVar
 
-from returns.maybe import Maybe
+from returns.maybe import Maybe, Nothing, Some
 from rx.disposable import Disposable
 
 from alleycat.ui import ErrorHandler, ErrorHandlerSupport
@@ -11,19 +12,98 @@ T = TypeVar("T")
 
 class Registry(Generic[T], ErrorHandlerSupport, Disposable, ABC):
 
-    def __init__(self, error_handler: ErrorHandler) -> None:
+    def __init__(self, error_handler: ErrorHandler, budget: Optional[int] = None) -> None:
         if error_handler is None:
             raise ValueError("Argument 'error_handler' is required.")
 
+        if budget is not None and budget < 0:
+            raise ValueError("Argument 'budget' should be zero or a positive number.")
+
         super().__init__()
 
-        self._cache: Dict[str, T] = dict()
+        self._cache: OrderedDict[str, T] = OrderedDict()
+        self._sizes: Dict[str, int] = dict()
+        self._keys: Dict[int, str] = dict()
+        self._pins: Dict[str, int] = dict()
+        self._memory_usage = 0
+        self._budget = budget
         self._error_handler = error_handler
 
     @abstractmethod
     def create(self, name: str) -> Maybe[T]:
         pass
 
+    @property
+    def budget(self) -> Optional[int]:
+        return self._budget
+
+    @property
+    def memory_usage(self) -> int:
+        return self._memory_usage
+
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def item_size(self, item: T) -> int:
+        return 0
+
+    def key_of(self, item: T) -> Maybe[str]:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        key = self._keys.get(id(item))
+
+        # An id can be reused after the item is gone, so we make sure the registry still holds the same item.
+        return Some(key) if key is not None and self._cache.get(key) is item else Nothing
+
+    def pin(self, item: T) -> None:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        # Items which don't belong to this registry can't be evicted anyway, so we simply ignore them.
+        key = self.key_of(item).value_or(None)
+
+        if key is not None:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, item: T) -> None:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        key = self.key_of(item).value_or(None)
+
+        if key is None or key not in self._pins:
+            return
+
+        count = self._pins[key] - 1
+
+        if count > 0:
+            self._pins[key] = count
+        else:
+            del self._pins[key]
+
+            self.evict()
+
+    def pinned(self, item: T) -> bool:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        return self.key_of(item).map(lambda k: k in self._pins).value_or(False)
+
+    def evict(self) -> None:
+        self._evict()
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        if self._budget is None or self._memory_usage <= self._budget:
+            return
+
+        # Items are kept in the order they were last used, so we can start from the least recently used one.
+        candidates = [k for k in self._cache.keys() if k not in self._pins and k != keep]
+
+        for key in candidates:
+            if self._memory_usage <= self._budget:
+                break
+
+            del self[key]
+
     def __len__(self) -> int:
         return len(self._cache)
 
@@ -35,6 +115,8 @@ class Registry(Generic[T], ErrorHandlerSupport, Disposable, ABC):
             raise ValueError("Argument 'key' is required.")
 
         if key in self._cache:
+            self._cache.move_to_end(key)
+
             return self._cache[key]
         else:
             image = self.create(key).value_or(None)
@@ -51,7 +133,15 @@ class Registry(Generic[T], ErrorHandlerSupport, Disposable, ABC):
         del self[key]
 
         if value:
+            size = self.item_size(value)
+
             self._cache[key] = value
+            self._keys[id(value)] = key
+            self._sizes[key] = size
+            self._memory_usage += size
+
+            # The new item is about to be handed out, so we shouldn't dispose it right away.
+            self._evict(keep=key)
 
     def __delitem__(self, key: str) -> None:
         if key is None:
@@ -64,6 +154,11 @@ class Registry(Generic[T], ErrorHandlerSupport, Disposable, ABC):
                 self.execute_safely(item.dispose)
 
             del self._cache[key]
+
+            self._keys.pop(id(item), None)
+            self._pins.pop(key, None)
+
+            self._memory_usage -= self._sizes.pop(key, 0)
         except KeyError:
             pass
 
@@ -83,5 +178,10 @@ class Registry(Generic[T], ErrorHandlerSupport, Disposable, ABC):
                 self.execute_safely(i.dispose)
 
         self._cache.clear()
+        self._sizes.clear()
+        self._keys.clear()
+        self._pins.clear()
+
+        self._memory_usage = 0
 
         super().dispose()
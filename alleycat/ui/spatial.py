@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from math import floor
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from returns.maybe import Maybe, Nothing, Some
+
+from alleycat.ui import Bounds, Point
+
+T = TypeVar("T", bound=Hashable)
+
+Cell = Tuple[int, int]
+
+
+class SpatialIndex(Generic[T]):
+
+    def __init__(self, cell_size: float = 64, max_cells: int = 256) -> None:
+        if cell_size <= 0:
+            raise ValueError("Argument 'cell_size' must be a positive number.")
+
+        if max_cells < 1:
+            raise ValueError("Argument 'max_cells' must be a positive number.")
+
+        super().__init__()
+
+        self._cell_size = cell_size
+        self._max_cells = max_cells
+
+        self._cells: Dict[Cell, Set[T]] = dict()
+        self._items: Dict[T, Tuple[Bounds, Optional[List[Cell]]]] = dict()
+
+        # Items which would take too many cells are kept separately and tested on every query.
+        self._large_items: Set[T] = set()
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @property
+    def max_cells(self) -> int:
+        return self._max_cells
+
+    def bounds_of(self, item: T) -> Maybe[Bounds]:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        return Some(self._items[item][0]) if item in self._items else Nothing
+
+    def update(self, item: T, bounds: Bounds) -> None:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        if bounds is None:
+            raise ValueError("Argument 'bounds' is required.")
+
+        cells = self._cells_for(bounds)
+
+        if item in self._items:
+            if self._items[item][1] == cells:
+                self._items[item] = (bounds, cells)
+                return
+
+            self.remove(item)
+
+        self._items[item] = (bounds, cells)
+
+        if cells is None:
+            self._large_items.add(item)
+        else:
+            for cell in cells:
+                self._cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item: T) -> None:
+        if item is None:
+            raise ValueError("Argument 'item' is required.")
+
+        if item not in self._items:
+            return
+
+        (_, cells) = self._items.pop(item)
+
+        if cells is None:
+            self._large_items.remove(item)
+            return
+
+        for cell in cells:
+            items = self._cells[cell]
+            items.discard(item)
+
+            if len(items) == 0:
+                del self._cells[cell]
+
+    def query(self, point: Point) -> Set[T]:
+        if point is None:
+            raise ValueError("Argument 'point' is required.")
+
+        cell = (floor(point.x / self.cell_size), floor(point.y / self.cell_size))
+
+        candidates = self._cells.get(cell, set()) | self._large_items
+
+        return {i for i in candidates if self._items[i][0].contains(point)}
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._items.clear()
+        self._large_items.clear()
+
+    def _cells_for(self, bounds: Bounds) -> Optional[List[Cell]]:
+        size = self.cell_size
+
+        (x1, y1) = (floor(bounds.x / size), floor(bounds.y / size))
+        (x2, y2) = (floor((bounds.x + bounds.width) / size), floor((bounds.y + bounds.height) / size))
+
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > self.max_cells:
+            return None
+
+        return [(x, y) for x in range(x1, x2 + 1) for y in range(y1, y2 + 1)]
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items.keys())
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, TypeVar, Generic, Any, Iterable, TYPE_CHECKING, Callable
+from typing import Dict, TypeVar, Generic, Any, Iterable, List, Mapping, TYPE_CHECKING, Callable, Optional, Set, \
+    Tuple, Type, Union
 
 from cairocffi import FontFace
 from returns.maybe import Maybe, Some, Nothing
@@ -14,7 +15,7 @@ from rx.subject import Subject
 from alleycat.ui import RGBA, Event, Insets
 
 if TYPE_CHECKING:
-    from alleycat.ui import LookAndFeel
+    from alleycat.ui import LookAndFeel, Theme
 
 
 class StyleLookup(Disposable):
@@ -45,7 +46,7 @@ class StyleLookup(Disposable):
             raise ValueError("Argument 'color' is required.")
 
         self._colors[key] = color
-        self._on_style_change.on_next(ColorChangeEvent(self, key, Some(color)))
+        self._notify_style_change(ColorChangeEvent(self, key, Some(color)))
 
     def clear_color(self, key: str) -> None:
         if key is None:
@@ -54,7 +55,7 @@ class StyleLookup(Disposable):
         try:
             del self._colors[key]
 
-            self._on_style_change.on_next(ColorChangeEvent(self, key, Nothing))
+            self._notify_style_change(ColorChangeEvent(self, key, Nothing))
         except KeyError:
             pass
 
@@ -72,7 +73,7 @@ class StyleLookup(Disposable):
             raise ValueError("Argument 'font' is required.")
 
         self._fonts[key] = font
-        self._on_style_change.on_next(FontChangeEvent(self, key, Some(font)))
+        self._notify_style_change(FontChangeEvent(self, key, Some(font)))
 
     def clear_font(self, key: str) -> None:
         if key is None:
@@ -81,7 +82,7 @@ class StyleLookup(Disposable):
         try:
             del self._fonts[key]
 
-            self._on_style_change.on_next(FontChangeEvent(self, key, Nothing))
+            self._notify_style_change(FontChangeEvent(self, key, Nothing))
         except KeyError:
             pass
 
@@ -99,7 +100,7 @@ class StyleLookup(Disposable):
             raise ValueError("Argument 'insets' is required.")
 
         self._insets[key] = insets
-        self._on_style_change.on_next(InsetsChangeEvent(self, key, Some(insets)))
+        self._notify_style_change(InsetsChangeEvent(self, key, Some(insets)))
 
     def clear_insets(self, key: str) -> None:
         if key is None:
@@ -108,10 +109,39 @@ class StyleLookup(Disposable):
         try:
             del self._insets[key]
 
-            self._on_style_change.on_next(InsetsChangeEvent(self, key, Nothing))
+            self._notify_style_change(InsetsChangeEvent(self, key, Nothing))
         except KeyError:
             pass
 
+    def apply_theme(self, theme: Theme, replace: bool = False) -> None:
+        if theme is None:
+            raise ValueError("Argument 'theme' is required.")
+
+        events: List[StyleChangeEvent] = []
+
+        def update(table: Dict[str, Any], values: Mapping[str, Any], event_type: Type[StyleChangeEvent]) -> None:
+            removed = [k for k in table.keys() if k not in values] if replace else []
+
+            for key in removed:
+                del table[key]
+                events.append(event_type(self, key, Nothing))
+
+            for (key, value) in values.items():
+                if table.get(key) != value:
+                    table[key] = value
+                    events.append(event_type(self, key, Some(value)))
+
+        update(self._colors, theme.colors, ColorChangeEvent)
+        update(self._fonts, theme.fonts, FontChangeEvent)
+        update(self._insets, theme.insets, InsetsChangeEvent)
+
+        # Notify all the changes at once, so that listeners won't have to handle each key separately.
+        if len(events) > 0:
+            self._notify_style_change(ThemeChangeEvent(self, tuple(events)))
+
+    def _notify_style_change(self, event: Union[StyleChangeEvent, ThemeChangeEvent]) -> None:
+        self._on_style_change.on_next(event)
+
     def dispose(self) -> None:
         super().dispose()
 
@@ -124,6 +154,10 @@ S = TypeVar("S")
 
 class StyleResolver(StyleLookup, ABC):
     def __init__(self):
+        self._resolved_styles: Dict[Tuple[str, str], Maybe[Any]] = dict()
+        self._style_dependencies: Set[str] = set()
+        self._on_inherited_style_change = Subject()
+
         super().__init__()
 
     @property
@@ -131,6 +165,10 @@ class StyleResolver(StyleLookup, ABC):
     def look_and_feel(self) -> LookAndFeel:
         pass
 
+    @property
+    def on_inherited_style_change(self) -> Observable:
+        return self._on_inherited_style_change.pipe(ops.distinct_until_changed())
+
     @property
     def style_fallback_prefixes(self) -> Iterable[str]:
         yield from ()
@@ -145,28 +183,82 @@ class StyleResolver(StyleLookup, ABC):
         yield key
 
     def resolve_color(self, key: str) -> Maybe[RGBA]:
-        return self._resolve_style(key, lambda l, k: l.get_color(k))
+        return self._resolve_style("color", key, lambda l, k: l.get_color(k))
 
     def resolve_font(self, key: str) -> Maybe[FontFace]:
-        return self._resolve_style(key, lambda l, k: l.get_font(k))
+        return self._resolve_style("font", key, lambda l, k: l.get_font(k))
 
     def resolve_insets(self, key: str) -> Maybe[Insets]:
-        return self._resolve_style(key, lambda l, k: l.get_insets(k))
+        return self._resolve_style("insets", key, lambda l, k: l.get_insets(k))
 
-    def _resolve_style(self, key: str, resolver: Callable[[StyleLookup, str], Maybe[S]]) -> Maybe[S]:
+    def invalidate_resolved_styles(self, event: Optional[Union[StyleChangeEvent, ThemeChangeEvent]] = None) -> None:
+        if event is None:
+            self._resolved_styles.clear()
+            return
+
+        changes = event.keys if isinstance(event, ThemeChangeEvent) else {event.key}
+
+        # A changed key affects the cached value of the same key, and also of any key it can be a fallback for.
+        stale = [k for k in self._resolved_styles.keys()
+                 if any(c.endswith(k[1]) and c in self.style_fallback_keys(k[1]) for c in changes)]
+
+        for key in stale:
+            del self._resolved_styles[key]
+
+    def notify_inherited_style_change(self, event: Union[StyleChangeEvent, ThemeChangeEvent]) -> None:
+        if event is None:
+            raise ValueError("Argument 'event' is required.")
+
+        self.invalidate_resolved_styles(event)
+
+        self._on_inherited_style_change.on_next(event)
+
+    def _notify_style_change(self, event: Union[StyleChangeEvent, ThemeChangeEvent]) -> None:
+        self.invalidate_resolved_styles(event)
+
+        super()._notify_style_change(event)
+
+    def _resolve_style(self, kind: str, key: str, resolver: Callable[[StyleLookup, str], Maybe[S]]) -> Maybe[S]:
+        try:
+            return self._resolved_styles[(kind, key)]
+        except KeyError:
+            pass
+
+        value = self._lookup_style(key, resolver)
+
+        self._resolved_styles[(kind, key)] = value
+
+        return value
+
+    def _lookup_style(self, key: str, resolver: Callable[[StyleLookup, str], Maybe[S]]) -> Maybe[S]:
         value = resolver(self, key)
 
         if value is not Nothing:
             return value
 
+        look_and_feel = self.look_and_feel
+
         for k in self.style_fallback_keys(key):
-            value = resolver(self.look_and_feel, k)
+            # Let the look and feel know we depend on the key, so it can notify us only when it's relevant to us.
+            if k not in self._style_dependencies:
+                look_and_feel.add_style_dependency(k, self)
+                self._style_dependencies.add(k)
+
+            value = resolver(look_and_feel, k)
 
             if value is not Nothing:
                 return value
 
         return Nothing
 
+    def dispose(self) -> None:
+        self.look_and_feel.remove_style_dependencies(self._style_dependencies, self)
+        self._style_dependencies.clear()
+
+        super().dispose()
+
+        self._on_inherited_style_change.dispose()
+
 
 @dataclass(frozen=True)  # type:ignore
 class StyleChangeEvent(Event, Generic[T], ABC):
@@ -197,3 +289,15 @@ class InsetsChangeEvent(StyleChangeEvent[Insets]):
 
     def with_source(self, source: Any) -> Event:
         return InsetsChangeEvent(source, self.key, self.value)
+
+
+@dataclass(frozen=True)
+class ThemeChangeEvent(Event):
+    events: Tuple[StyleChangeEvent, ...]
+
+    @property
+    def keys(self) -> Set[str]:
+        return {e.key for e in self.events}
+
+    def with_source(self, source: Any) -> Event:
+        return ThemeChangeEvent(source, self.events)
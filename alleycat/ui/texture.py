@@ -0,0 +1,132 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from cairocffi import ImageSurface
+from returns.maybe import Nothing
+from rx.disposable import Disposable
+
+from alleycat.ui import Bounds, Dimension
+
+
+class GLBackend(ABC):
+
+    @abstractmethod
+    def create_texture(self) -> int:
+        pass
+
+    @abstractmethod
+    def delete_texture(self, texture: int) -> None:
+        pass
+
+    @abstractmethod
+    def bind_texture(self, texture: int) -> None:
+        pass
+
+    @abstractmethod
+    def allocate_texture(self, width: int, height: int) -> None:
+        pass
+
+    @abstractmethod
+    def create_buffer(self, size: int) -> Any:
+        pass
+
+    @abstractmethod
+    def buffer_data(self, buffer: Any) -> memoryview:
+        pass
+
+    @abstractmethod
+    def upload(self, buffer: Any, row_length: int, area: Bounds) -> None:
+        pass
+
+
+class SurfaceTexture(Disposable):
+
+    def __init__(self, backend: GLBackend) -> None:
+        if backend is None:
+            raise ValueError("Argument 'backend' is required.")
+
+        super().__init__()
+
+        self._backend = backend
+        self._texture = backend.create_texture()
+        self._size: Optional[Dimension] = None
+        self._buffer: Any = None
+        self._staging: Optional[np.ndarray] = None
+        self._uploaded_bytes = 0
+
+    @property
+    def texture(self) -> int:
+        return self._texture
+
+    @property
+    def size(self) -> Optional[Dimension]:
+        return self._size
+
+    @property
+    def uploaded_bytes(self) -> int:
+        return self._uploaded_bytes
+
+    def bind(self) -> None:
+        self._backend.bind_texture(self.texture)
+
+    def update(self, surface: ImageSurface, areas: Sequence[Bounds]) -> None:
+        if surface is None:
+            raise ValueError("Argument 'surface' is required.")
+
+        if areas is None:
+            raise ValueError("Argument 'areas' is required.")
+
+        backend = self._backend
+
+        (width, height) = (surface.get_width(), surface.get_height())
+
+        stride = surface.get_stride()
+        size = Dimension(width, height)
+
+        self.bind()
+
+        # Texture storage and the staging buffer only need to be allocated again when the resolution changes.
+        if self._size != size:
+            backend.allocate_texture(width, height)
+
+            self._buffer = backend.create_buffer(stride * height)
+            self._size = size
+
+            # Copying through NumPy views moves each area in bulk, instead of one element at a time.
+            self._staging = np.ndarray((height, stride), dtype=np.uint8, buffer=backend.buffer_data(self._buffer))
+
+            areas = (Bounds(0, 0, width, height),)
+
+        surface.flush()
+
+        source = np.ndarray((height, stride), dtype=np.uint8, buffer=surface.get_data())
+        target = self._staging
+
+        full = Bounds(0, 0, width, height)
+
+        uploaded = 0
+
+        for area in areas:
+            clipped = area & full
+
+            if clipped == Nothing:
+                continue
+
+            (x, y, w, h) = map(int, clipped.unwrap().tuple)
+
+            target[y:y + h, x * 4:(x + w) * 4] = source[y:y + h, x * 4:(x + w) * 4]
+
+            backend.upload(self._buffer, stride // 4, Bounds(x, y, w, h))
+
+            uploaded += w * h * 4
+
+        self._uploaded_bytes = uploaded
+
+    def dispose(self) -> None:
+        self._backend.delete_texture(self.texture)
+
+        self._buffer = None
+        self._staging = None
+
+        super().dispose()
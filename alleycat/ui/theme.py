@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping, Union
+
+from cairocffi import FontFace
+
+from alleycat.ui import FontRegistry, Insets, RGBA
+
+
+@dataclass(frozen=True)
+class Theme:
+    colors: Mapping[str, RGBA] = field(default_factory=dict)
+
+    fonts: Mapping[str, FontFace] = field(default_factory=dict)
+
+    insets: Mapping[str, Insets] = field(default_factory=dict)
+
+    def merge(self, other: Theme) -> Theme:
+        if other is None:
+            raise ValueError("Argument 'other' is required.")
+
+        return Theme(
+            {**self.colors, **other.colors},
+            {**self.fonts, **other.fonts},
+            {**self.insets, **other.insets})
+
+    @staticmethod
+    def from_dict(source: Mapping[str, Any], fonts: FontRegistry) -> Theme:
+        if source is None:
+            raise ValueError("Argument 'source' is required.")
+
+        if fonts is None:
+            raise ValueError("Argument 'fonts' is required.")
+
+        unknown = set(source.keys()) - {"colors", "fonts", "insets"}
+
+        if len(unknown) > 0:
+            raise ValueError(f"Unknown theme section(s): {', '.join(sorted(unknown))}.")
+
+        def font(key: str, name: str) -> FontFace:
+            value = fonts[name]
+
+            if value is None:
+                raise ValueError(f"Unable to find font '{name}' for key '{key}'.")
+
+            return value
+
+        return Theme(
+            {k: _parse_color(k, v) for (k, v) in source.get("colors", {}).items()},
+            {k: font(k, v) for (k, v) in source.get("fonts", {}).items()},
+            {k: _parse_insets(k, v) for (k, v) in source.get("insets", {}).items()})
+
+    @staticmethod
+    def from_json(source: str, fonts: FontRegistry) -> Theme:
+        if source is None:
+            raise ValueError("Argument 'source' is required.")
+
+        return Theme.from_dict(json.loads(source), fonts)
+
+    @staticmethod
+    def load(path: Union[str, Path], fonts: FontRegistry) -> Theme:
+        if path is None:
+            raise ValueError("Argument 'path' is required.")
+
+        return Theme.from_json(Path(path).read_text(encoding="utf-8"), fonts)
+
+
+def _parse_color(key: str, value: Any) -> RGBA:
+    if isinstance(value, str) and value.startswith("#") and len(value) in (7, 9):
+        channels = [int(value[i:i + 2], 16) / 255. for i in range(1, len(value), 2)]
+
+        return RGBA.from_tuple((*channels, 1.) if len(channels) == 3 else tuple(channels))
+    elif isinstance(value, (list, tuple)) and len(value) in (3, 4):
+        return RGBA.from_tuple((*value, 1.) if len(value) == 3 else tuple(value))
+
+    raise ValueError(f"Invalid color value for key '{key}': {value!r}.")
+
+
+def _parse_insets(key: str, value: Any) -> Insets:
+    if isinstance(value, (int, float)):
+        return Insets(value, value, value, value)
+    elif isinstance(value, (list, tuple)) and len(value) == 4:
+        return Insets.from_tuple(tuple(value))
+
+    raise ValueError(f"Invalid insets value for key '{key}': {value!r}.")
@@ -2,30 +2,129 @@ from __future__ import annotations
 
 from abc import ABC
 from itertools import chain
-from typing import Iterable, Iterator, Optional, Sequence, Tuple, TypeVar
+from math import ceil, floor
+from typing import Dict, Iterable, Optional, Sequence, Tuple, TypeVar
 
 import rx
 from alleycat.reactive import RV, ReactiveObject, functions as rv
-from cairocffi import Context as Graphics
+from cairocffi import Context as Graphics, FORMAT_ARGB32, ImageSurface, OPERATOR_CLEAR, \
+    OPERATOR_OVER
 from returns.maybe import Maybe, Nothing, Some
 from rx import operators as ops
 from rx.subject import Subject
 
-from alleycat.ui import Container, ContainerUI, Context, Drawable, ErrorHandler, ErrorHandlerSupport, Event, \
-    Layout, Point, PropagatingEvent
+from alleycat.ui import Bounds, Container, ContainerUI, Context, DamageRegion, Drawable, ErrorHandler, \
+    ErrorHandlerSupport, Event, Layout, Point, PropagatingEvent, SpatialIndex
 
 
 class Window(Container, ABC):
 
     def __init__(self, context: Context, layout: Optional[Layout] = None, visible: bool = True) -> None:
+        self._cache: Optional[ImageSurface] = None
+        self._cache_offset = Point(0, 0)
+        self._cache_damage = DamageRegion()
+
         super().__init__(context, layout, visible)
 
+        rx.merge(
+            self.ui.on_repaint(self),
+            self.observe("size").pipe(ops.distinct_until_changed()),
+            self.on_inherited_style_change) \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.invalidate_cache(), on_error=self.error_handler)
+
+        self.observe("bounds") \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(lambda _: self.context.window_manager.index_window(self), on_error=self.error_handler)
+
         context.window_manager.add(self)
 
     @property
     def style_fallback_prefixes(self) -> Iterable[str]:
         return chain(["Window"], super().style_fallback_prefixes)
 
+    @property
+    def cache(self) -> Maybe[ImageSurface]:
+        return Maybe.from_optional(self._cache)
+
+    @property
+    def cache_damage(self) -> DamageRegion:
+        return self._cache_damage
+
+    def invalidate_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.finish()
+            self._cache = None
+
+        self._cache_damage.clear()
+
+    def repaint_child(self, area: Bounds) -> None:
+        if area is None:
+            raise ValueError("Argument 'area' is required.")
+
+        if self._cache is not None:
+            self._cache_damage.add(area.move_by(-self._cache_offset))
+
+        super().repaint_child(area)
+
+    def draw(self, g: Graphics) -> None:
+        if not self.visible:
+            return
+
+        clip_bounds = self.ui.clip_bounds(self)
+
+        (x, y) = (floor(clip_bounds.x), floor(clip_bounds.y))
+        (width, height) = (ceil(clip_bounds.x + clip_bounds.width) - x, ceil(clip_bounds.y + clip_bounds.height) - y)
+
+        if width <= 0 or height <= 0:
+            return
+
+        offset = Point(x, y) - self.location
+
+        # The cached image can only be reused if the window has been moved by whole pixels.
+        if self._cache is None or \
+                self._cache_offset != offset or \
+                self._cache.get_width() != width or \
+                self._cache.get_height() != height:
+            self.invalidate_cache()
+
+            self._cache = ImageSurface(FORMAT_ARGB32, width, height)
+            self._cache_offset = offset
+
+            self._rasterize((Bounds(0, 0, width, height),), x, y)
+        elif not self._cache_damage.empty:
+            self._rasterize(self._cache_damage.drain(), x, y)
+
+        g.save()
+
+        try:
+            g.set_source_surface(self._cache, x, y)
+            g.paint()
+        finally:
+            g.restore()
+
+        # The cached image may have been composited without drawing the window itself, so we have to track the area
+        # here to make sure the next repaint clears the right part of the screen.
+        self._painted_area = Bounds(x, y, width, height)
+
+    def _rasterize(self, areas: Sequence[Bounds], x: float, y: float) -> None:
+        g = self.context.create_graphics(self._cache)
+
+        for (ax, ay, aw, ah) in areas:
+            g.rectangle(ax, ay, aw, ah)
+
+        g.clip()
+
+        g.set_operator(OPERATOR_CLEAR)
+        g.paint()
+
+        g.set_operator(OPERATOR_OVER)
+        g.translate(-x, -y)
+
+        super().draw(g)
+
+        self._cache.flush()
+
     def dispatch_event(self, event: Event) -> None:
         if isinstance(event, PropagatingEvent):
             event.stop_propagation()
@@ -37,6 +136,8 @@ class Window(Container, ABC):
 
         super().dispose()
 
+        self.invalidate_cache()
+
 
 T = TypeVar("T", bound=Window, contravariant=True)
 
@@ -76,6 +177,14 @@ class WindowManager(Drawable, ErrorHandlerSupport, ReactiveObject):
         self.windows = changed_window.pipe(
             ops.scan(on_window_change, ()), ops.start_with(()), ops.distinct_until_changed())
 
+        self._window_index = SpatialIndex[Window]()
+        self._window_order: Dict[Window, int] = dict()
+        self._next_window_order = 0
+
+        self.observe("windows") \
+            .pipe(ops.take_until(self.on_dispose)) \
+            .subscribe(self._update_window_index, on_error=self.error_handler)
+
     def add(self, window: Window) -> None:
         if window is None:
             raise ValueError("Argument 'window' is required.")
@@ -86,20 +195,58 @@ class WindowManager(Drawable, ErrorHandlerSupport, ReactiveObject):
         if window is None:
             raise ValueError("Argument 'window' is required.")
 
+        window.repaint()
+
         self._removed_window.on_next(window)
 
+    def index_window(self, window: Window) -> None:
+        if window is None:
+            raise ValueError("Argument 'window' is required.")
+
+        if window in self._window_order:
+            self._window_index.update(window, window.bounds)
+
+    def _update_window_index(self, windows: Sequence[Window]) -> None:
+        order = self._window_order
+        current = set(windows)
+
+        for window in [w for w in order.keys() if w not in current]:
+            self._window_index.remove(window)
+
+            del order[window]
+
+        added = [w for w in windows if w not in order]
+
+        for window in added:
+            self._window_index.update(window, window.bounds)
+
+        kept = len(windows) - len(added)
+
+        # Order values only need to be increasing, so new windows at the end don't require renumbering the others.
+        if tuple(order.keys()) == tuple(windows[:kept]):
+            for window in added:
+                order[window] = self._next_window_order
+                self._next_window_order += 1
+        else:
+            self._window_order = {w: i for (i, w) in enumerate(windows)}
+            self._next_window_order = len(windows)
+
     def window_at(self, location: Point) -> Maybe[Window]:
         if location is None:
             raise ValueError("Argument 'location' is required.")
 
-        try:
-            # noinspection PyTypeChecker
-            children: Iterator[Window] = reversed(self.windows)
+        candidates = self._window_index.query(location)
 
-            return Some(next(c for c in children if c.bounds.contains(location)))
-        except StopIteration:
+        if len(candidates) == 0:
             return Nothing
 
+        return Some(max(candidates, key=self._window_order.__getitem__))
+
+    def validate(self) -> None:
+        # noinspection PyTypeChecker
+        for window in self.windows:
+            window.validate()
+
     def draw(self, g: Graphics) -> None:
         # noinspection PyTypeChecker
         for window in self.windows:
@@ -13,7 +13,8 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/mysticfall/alleycat-ui",
     packages=find_namespace_packages(include=["alleycat.*"]),
-    install_requires=["alleycat-reactive==0.4.7", "returns==0.15.0", "rx==3.1.1", "pangocairocffi==0.5.0"],
+    install_requires=[
+        "alleycat-reactive==0.4.7", "returns==0.15.0", "rx==3.1.1", "pangocairocffi==0.5.0", "pangocffi==0.10.0"],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3 or later (GPLv3+)",
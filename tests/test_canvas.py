@@ -1,11 +1,12 @@
 import unittest
 from pathlib import Path
 
+from cairocffi import FORMAT_ARGB32, ImageSurface
 from returns.maybe import Some
 
 from alleycat.ui import Bounds, Canvas, Dimension, Frame, Insets, RGBA, StyleLookup
 from alleycat.ui.glass import StyleKeys
-from ui import UITestCase
+from ui import TestImage as FixtureImage, UITestCase
 
 Tolerance: float = 3
 
@@ -108,6 +109,35 @@ class CanvasTest(UITestCase):
         assert_padding(Dimension(64, 64), Insets(0, 0, 0, 0))
         assert_padding(Dimension(64, 64), Insets(10, 5, 3, 15))
 
+    def test_load_image(self):
+        images = self.context.toolkit.images
+
+        placeholder = FixtureImage(ImageSurface(FORMAT_ARGB32, 8, 8))
+
+        canvas = Canvas(self.context)
+        canvas.load_image(FixturePath, Some(placeholder))
+
+        self.assertEqual(Some(placeholder), canvas.image)
+        self.assertEqual(1, images.pending)
+        self.assertFalse(FixturePath in images)
+
+        self.context.process()
+
+        self.assertEqual(0, images.pending)
+        self.assertTrue(FixturePath in images)
+        self.assertIs(images[FixturePath], canvas.image.unwrap())
+
+        canvas.load_image("non-existent.png", Some(placeholder))
+
+        images.prefetch(["non-existent.png", FixturePath])
+
+        self.assertEqual(1, images.pending)
+
+        self.context.process()
+
+        self.assertEqual(0, images.pending)
+        self.assertEqual(Some(placeholder), canvas.image)
+
 
 if __name__ == '__main__':
     unittest.main()
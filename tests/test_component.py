@@ -46,6 +46,29 @@ class ComponentTest(UITestCase):
 
         self.assertEqual(Point(20, 40), component.offset)
 
+    def test_offset_generation(self):
+        parent = Container(self.context)
+        parent.bounds = Bounds(10, 20, 80, 60)
+
+        component = Component(self.context)
+        component.bounds = Bounds(5, 5, 10, 10)
+
+        parent.add(component)
+
+        generation = self.context.offset_generation
+
+        self.assertEqual(Point(10, 20), component.offset)
+        self.assertEqual(generation, self.context.offset_generation)
+
+        parent.bounds = parent.bounds.copy(width=100)
+
+        self.assertEqual(generation, self.context.offset_generation)
+
+        parent.bounds = parent.bounds.copy(x=20)
+
+        self.assertGreater(self.context.offset_generation, generation)
+        self.assertEqual(Point(20, 20), component.offset)
+
     def test_position_of(self):
         parent = Container(self.context)
         parent.bounds = Bounds(10, 20, 80, 60)
@@ -91,6 +114,98 @@ class ComponentTest(UITestCase):
         laf.set_color("color", RGBA(1, 1, 1, 1))
         self.assertEqual(RGBA(0, 1, 0, 1), fixture.resolve_color("color").unwrap())
 
+    def test_resolved_style_cache(self):
+        class Fixture(Component):
+            @property
+            def style_fallback_prefixes(self) -> Iterable[str]:
+                yield "Type"
+
+        fixture = Fixture(self.context)
+
+        laf = self.context.look_and_feel
+        laf.set_color("Type.color", RGBA(1, 0, 0, 1))
+
+        lookups = []
+
+        get_color = laf.get_color
+
+        def lookup(key: str):
+            lookups.append(key)
+            return get_color(key)
+
+        laf.get_color = lookup
+
+        self.assertEqual(RGBA(1, 0, 0, 1), fixture.resolve_color("color").unwrap())
+        self.assertEqual(RGBA(1, 0, 0, 1), fixture.resolve_color("color").unwrap())
+        self.assertEqual(Nothing, fixture.resolve_color("color:hover"))
+        self.assertEqual(Nothing, fixture.resolve_color("color:hover"))
+
+        self.assertEqual(["Type.color", "Type.color:hover", "color:hover"], lookups)
+
+        lookups.clear()
+
+        laf.set_color("Other.color", RGBA(0, 0, 1, 1))
+
+        self.assertEqual(RGBA(1, 0, 0, 1), fixture.resolve_color("color").unwrap())
+        self.assertEqual(0, len(lookups))
+
+        laf.set_color("Type.color:hover", RGBA(0, 0, 1, 1))
+
+        self.assertEqual(RGBA(1, 0, 0, 1), fixture.resolve_color("color").unwrap())
+        self.assertEqual(RGBA(0, 0, 1, 1), fixture.resolve_color("color:hover").unwrap())
+        self.assertEqual(["Type.color:hover"], lookups)
+
+        with self.context.batch():
+            fixture.set_color("color", RGBA(0, 1, 0, 1))
+
+            self.assertEqual(RGBA(0, 1, 0, 1), fixture.resolve_color("color").unwrap())
+
+        fixture.clear_color("color")
+
+        self.assertEqual(RGBA(1, 0, 0, 1), fixture.resolve_color("color").unwrap())
+
+        laf.clear_color("Type.color")
+
+        self.assertEqual(Nothing, fixture.resolve_color("color"))
+
+    def test_style_dependencies(self):
+        class Fixture(Component):
+            @property
+            def style_fallback_prefixes(self) -> Iterable[str]:
+                yield "Type"
+
+        laf = self.context.look_and_feel
+
+        fixture = Fixture(self.context)
+        other = Fixture(self.context)
+
+        laf.set_color("Type.color", RGBA(1, 0, 0, 1))
+
+        fixture.resolve_color("color")
+        fixture.resolve_color("highlight")
+
+        self.assertEqual((fixture,), laf.style_dependents("Type.color"))
+        self.assertEqual((), laf.style_dependents("color"))
+        self.assertEqual((fixture,), laf.style_dependents("highlight"))
+
+        changes = []
+        other_changes = []
+
+        fixture.on_inherited_style_change.subscribe(changes.append)
+        other.on_inherited_style_change.subscribe(other_changes.append)
+
+        laf.set_color("color", RGBA(0, 1, 0, 1))
+        laf.set_color("Type.color", RGBA(0, 0, 1, 1))
+        laf.set_color("highlight", RGBA(0, 0, 1, 1))
+
+        self.assertEqual(["Type.color", "highlight"], [e.key for e in changes])
+        self.assertEqual(0, len(other_changes))
+        self.assertEqual(RGBA(0, 0, 1, 1), fixture.resolve_color("color").unwrap())
+
+        fixture.dispose()
+
+        self.assertEqual((), laf.style_dependents("Type.color"))
+
     def test_validation(self):
         minimum_size = Dimension(10, 10)
         preferred_size = Dimension(20, 20)
@@ -1,9 +1,10 @@
 import unittest
+from unittest.mock import patch
 
 from alleycat.reactive import functions as rv
 from returns.maybe import Nothing, Some
 
-from alleycat.ui import Bounds, Component, Container, Dimension, Frame, Panel, Point
+from alleycat.ui import Bounds, Component, Container, Dimension, Frame, Panel, Point, SpatialIndex
 from alleycat.ui.layout import AbsoluteLayout
 from ui import UITestCase
 
@@ -37,6 +38,145 @@ class ContainerTest(UITestCase):
 
         self.assertEqual((child2,), container.children)
 
+    def test_add_all(self):
+        container = Container(self.context)
+        other = Container(self.context)
+
+        children = [Panel(self.context) for _ in range(5)]
+
+        other.add(children[0])
+
+        changes = []
+        deltas = []
+
+        container.observe("children").subscribe(changes.append)
+        container.on_children_change.subscribe(lambda c: deltas.append((tuple(c.added), tuple(c.removed))))
+
+        changes.clear()
+
+        container.add_all(children)
+
+        self.assertEqual([tuple(children)], changes)
+        self.assertEqual([(tuple(children), ())], deltas)
+        self.assertEqual((), other.children)
+
+        self.assertTrue(all(c.parent == Some(container) for c in children))
+        self.assertTrue(all(c in container.layout for c in children))
+
+        changes.clear()
+        deltas.clear()
+
+        container.add_all(children[:2])
+
+        self.assertEqual([tuple(children[2:] + children[:2])], changes)
+        self.assertEqual([(tuple(children[:2]), tuple(children[:2]))], deltas)
+
+        changes.clear()
+        deltas.clear()
+
+        container.remove_all(children[1:3])
+
+        self.assertEqual([(children[3], children[4], children[0])], changes)
+        self.assertEqual([((), (children[1], children[2]))], deltas)
+
+        changes.clear()
+        deltas.clear()
+
+        container.remove_all(children[1:3])
+
+        self.assertEqual([], changes)
+        self.assertEqual([], deltas)
+
+        self.assertEqual(Nothing, children[1].parent)
+        self.assertEqual(Nothing, children[2].parent)
+
+        self.assertFalse(children[1] in container.layout)
+        self.assertTrue(children[0] in container.layout)
+
+        self.assertRaises(ValueError, lambda: container.add_all(None))
+        self.assertRaises(ValueError, lambda: container.remove_all(None))
+
+    def test_culled_children(self):
+        window = Frame(self.context)
+        window.bounds = Bounds(0, 0, 100, 100)
+
+        panel = Panel(self.context)
+        panel.bounds = Bounds(10, 10, 60, 60)
+
+        inside = Panel(self.context)
+        inside.bounds = Bounds(10, 10, 20, 20)
+
+        partial = Panel(self.context)
+        partial.bounds = Bounds(50, 50, 20, 20)
+
+        outside = Panel(self.context)
+        outside.bounds = Bounds(80, 0, 20, 20)
+
+        hidden = Panel(self.context, visible=False)
+        hidden.bounds = Bounds(100, 100, 20, 20)
+
+        window.add(panel)
+        panel.add_all((inside, partial, outside, hidden))
+
+        outside.add(Panel(self.context))
+
+        self.context.process()
+
+        # Culling skips the whole subtree, so only the direct child of the panel is counted.
+        self.assertEqual(1, self.context.culled_children)
+
+        self.assertNotEqual(Nothing, inside.painted_area)
+        self.assertNotEqual(Nothing, partial.painted_area)
+        self.assertEqual(Nothing, outside.painted_area)
+
+        inside.repaint()
+
+        self.context.process()
+
+        self.assertEqual(2, self.context.culled_children)
+
+        self.context.process()
+
+        self.assertEqual(0, self.context.culled_children)
+
+    def test_component_at_with_overlapping_children(self):
+        parent = Container(self.context)
+        parent.bounds = Bounds(10, 10, 200, 200)
+
+        child1 = Panel(self.context)
+        child1.bounds = Bounds(0, 0, 100, 100)
+
+        child2 = Panel(self.context)
+        child2.bounds = Bounds(50, 50, 100, 100)
+
+        parent.add(child1)
+        parent.add(child2)
+
+        self.assertEqual(Some(child1), parent.component_at(Point(20, 20)))
+        self.assertEqual(Some(child2), parent.component_at(Point(70, 70)))
+        self.assertEqual(Some(parent), parent.component_at(Point(200, 200)))
+
+        child2.bounds = Bounds(150, 150, 50, 50)
+
+        self.assertEqual(Some(child1), parent.component_at(Point(70, 70)))
+        self.assertEqual(Some(child2), parent.component_at(Point(200, 200)))
+
+        parent.remove(child2)
+        parent.add(child2)
+
+        self.assertEqual(Some(child2), parent.component_at(Point(200, 200)))
+
+        child2.bounds = Bounds(0, 0, 50, 50)
+
+        self.assertEqual(Some(child2), parent.component_at(Point(20, 20)))
+
+        parent.remove(child2)
+
+        child2.bounds = Bounds(0, 0, 200, 200)
+
+        self.assertEqual(Some(child1), parent.component_at(Point(20, 20)))
+        self.assertEqual(Some(parent), parent.component_at(Point(200, 200)))
+
     def test_component_at_with_hierarchy(self):
         parent = Container(self.context)
         parent.bounds = Bounds(0, 0, 200, 200)
@@ -209,6 +349,73 @@ class ContainerTest(UITestCase):
 
         self.assertEqual(False, container.valid)
 
+        container.validate()
+        child.bounds = Bounds(20, 20, 30, 30)
+
+        self.assertEqual(True, container.valid)
+
+    def test_child_subscriptions(self):
+        container = Panel(self.context)
+
+        children = [Panel(self.context) for _ in range(3)]
+
+        changes = []
+
+        container.ui.on_invalidate(container).subscribe(changes.append)
+
+        for child in children:
+            container.add(child)
+
+        changes.clear()
+
+        children[1].bounds = Bounds(10, 10, 20, 20)
+
+        self.assertEqual(1, len(changes))
+
+        container.remove(children[1])
+        changes.clear()
+
+        children[1].bounds = Bounds(20, 20, 20, 20)
+        children[2].bounds = Bounds(20, 20, 20, 20)
+
+        self.assertEqual(1, len(changes))
+
+    def test_child_index(self):
+        container = Panel(self.context)
+        container.bounds = Bounds(0, 0, 100, 100)
+
+        children = [Panel(self.context) for _ in range(4)]
+
+        for child in children:
+            child.bounds = Bounds(10, 10, 20, 20)
+            container.add(child)
+
+        self.assertEqual(Some(children[3]), container.component_at(Point(15, 15)))
+
+        update = SpatialIndex.update
+
+        with patch.object(SpatialIndex, "update", autospec=True, side_effect=update) as indexed:
+            extra = Panel(self.context)
+            extra.bounds = Bounds(10, 10, 20, 20)
+
+            container.add(extra)
+
+            self.assertEqual([extra], [c.args[1] for c in indexed.call_args_list])
+            self.assertEqual(Some(extra), container.component_at(Point(15, 15)))
+
+            indexed.reset_mock()
+
+            container.remove(extra)
+            container.remove(children[3])
+
+            self.assertEqual([], indexed.call_args_list)
+            self.assertEqual(Some(children[2]), container.component_at(Point(15, 15)))
+
+            container.add(children[0])
+
+            self.assertEqual([children[0]], [c.args[1] for c in indexed.call_args_list])
+            self.assertEqual(Some(children[0]), container.component_at(Point(15, 15)))
+
 
 if __name__ == '__main__':
     unittest.main()
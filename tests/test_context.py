@@ -1,7 +1,12 @@
+import gc
 import unittest
+import weakref
 from typing import Sequence
 
-from alleycat.ui import Context, Dimension, FakeMouseInput, Input, MouseInput
+from alleycat.ui import Bounds, Context, Dimension, FakeMouseInput, Frame, Input, Insets, Label, MouseInput, Panel, \
+    RGBA
+from alleycat.ui.glass import StyleKeys
+from alleycat.ui.layout import StackLayout
 from ui import FixtureContext, FixtureToolkit
 
 
@@ -23,6 +28,208 @@ class ContextTest(unittest.TestCase):
         self.assertIsNotNone(mouse_input)
         self.assertIs(TestMouseInput, type(mouse_input))
 
+    def test_frame_dirty(self):
+        context = FixtureContext(Dimension(100, 100), FixtureToolkit())
+
+        self.assertTrue(context.frame_dirty)
+
+        context.process()
+
+        self.assertFalse(context.frame_dirty)
+
+        layout = StackLayout()
+
+        window = Frame(context, layout)
+        window.bounds = Bounds(10, 10, 80, 80)
+
+        self.assertTrue(context.frame_dirty)
+
+        context.process()
+
+        self.assertFalse(context.frame_dirty)
+
+        calls = []
+
+        draw = context.window_manager.draw
+
+        def draw_windows(g):
+            calls.append(g)
+            draw(g)
+
+        context.window_manager.draw = draw_windows
+
+        context.process()
+
+        self.assertEqual(0, len(calls))
+
+        panel = Panel(context)
+
+        window.add(panel)
+
+        self.assertTrue(context.frame_dirty)
+
+        context.process()
+
+        self.assertFalse(context.frame_dirty)
+        self.assertEqual(1, len(calls))
+
+        panel.set_color(StyleKeys.Background, RGBA(1, 0, 0, 1))
+
+        self.assertTrue(context.frame_dirty)
+
+        context.process()
+
+        layout.padding = Insets(10, 10, 10, 10)
+
+        self.assertTrue(context.damage.empty)
+        self.assertTrue(context.frame_dirty)
+
+        context.process()
+
+        self.assertEqual(Bounds(10, 10, 60, 60), panel.bounds)
+        self.assertFalse(context.frame_dirty)
+        self.assertEqual(3, len(calls))
+
+    def test_layout_passes(self):
+        context = FixtureContext(Dimension(100, 100), FixtureToolkit())
+
+        order = []
+
+        class RecordingPanel(Panel):
+            def perform_layout(self) -> None:
+                order.append(self)
+
+                super().perform_layout()
+
+        window = Frame(context, StackLayout())
+        window.bounds = Bounds(0, 0, 100, 100)
+
+        outer = RecordingPanel(context, StackLayout())
+        inner = RecordingPanel(context, StackLayout())
+
+        window.add(outer)
+        outer.add(inner)
+        inner.add(Label(context, text="AlleyCat"))
+
+        context.process()
+
+        self.assertEqual(3, context.layout_passes)
+        self.assertEqual([outer, inner], order)
+        self.assertEqual(Bounds(0, 0, 100, 100), inner.bounds)
+
+        context.process()
+
+        self.assertEqual(0, context.layout_passes)
+
+        order.clear()
+
+        inner.request_layout()
+        outer.request_layout()
+
+        context.process()
+
+        self.assertEqual(2, context.layout_passes)
+        self.assertEqual([outer, inner], order)
+
+        order.clear()
+
+        outer.visible = False
+
+        context.process()
+
+        inner.request_layout()
+
+        context.process()
+
+        self.assertEqual(0, len(order))
+
+        outer.visible = True
+
+        context.process()
+
+        self.assertEqual([outer, inner], order)
+
+        hidden = Panel(context, StackLayout(), visible=False)
+        hidden.request_layout()
+
+        context.process()
+
+        reference = weakref.ref(hidden)
+
+        del hidden
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_batch(self):
+        def update_labels(batch: bool):
+            context = FixtureContext(Dimension(100, 100), FixtureToolkit())
+
+            invalidations = []
+
+            class CountingFrame(Frame):
+                def invalidate(self) -> None:
+                    invalidations.append(self)
+
+                    super().invalidate()
+
+            window = CountingFrame(context, StackLayout())
+            window.bounds = Bounds(0, 0, 100, 100)
+
+            panel = Panel(context)
+            labels = [Label(context) for _ in range(3)]
+
+            for label in labels:
+                panel.add(label)
+
+            window.add(panel)
+
+            context.process()
+
+            events = []
+
+            labels[0].on_style_change.subscribe(events.append)
+
+            invalidations.clear()
+
+            def update():
+                for (i, label) in enumerate(labels):
+                    label.text = f"Label {i}"
+                    label.text_size = 20
+
+                labels[0].set_color(StyleKeys.Text, RGBA(1, 0, 0, 1))
+                labels[0].set_color(StyleKeys.Text, RGBA(0, 1, 0, 1))
+
+            if batch:
+                with context.batch():
+                    self.assertTrue(context.batching)
+
+                    update()
+
+                    self.assertEqual(0, len(invalidations))
+                    self.assertEqual(0, len(events))
+
+                    self.assertTrue(panel.valid)
+                    self.assertFalse(labels[0].valid)
+
+                self.assertFalse(context.batching)
+
+                self.assertEqual(1, len(events))
+                self.assertEqual(RGBA(0, 1, 0, 1), events[0].value.unwrap())
+
+                self.assertTrue(window.valid)
+                self.assertTrue(all(label.valid for label in labels))
+            else:
+                update()
+
+                self.assertEqual(2, len(events))
+
+            context.process()
+
+            return len(invalidations)
+
+        self.assertLess(update_labels(batch=True), update_labels(batch=False))
+
 
 if __name__ == '__main__':
     unittest.main()
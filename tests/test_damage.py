@@ -0,0 +1,119 @@
+import unittest
+
+from returns.maybe import Nothing, Some
+
+from alleycat.ui import Bounds, DamageRegion, Frame, Panel, RGBA
+from alleycat.ui.glass import StyleKeys
+from ui import UITestCase
+
+
+class DamageRegionTest(unittest.TestCase):
+
+    def test_add(self):
+        region = DamageRegion()
+
+        self.assertTrue(region.empty)
+        self.assertEqual(Nothing, region.bounds)
+
+        region.add(Bounds(0, 0, 10, 10))
+        region.add(Bounds(20, 20, 10, 10))
+
+        self.assertFalse(region.empty)
+        self.assertEqual({Bounds(0, 0, 10, 10), Bounds(20, 20, 10, 10)}, set(region.areas))
+        self.assertEqual(Some(Bounds(0, 0, 30, 30)), region.bounds)
+
+        region.add(Bounds(2, 2, 5, 5))
+
+        self.assertEqual({Bounds(0, 0, 10, 10), Bounds(20, 20, 10, 10)}, set(region.areas))
+
+        region.add(Bounds(10, 0, 10, 10))
+
+        self.assertEqual({Bounds(0, 0, 20, 10), Bounds(20, 20, 10, 10)}, set(region.areas))
+
+        region.add(Bounds(50, 50, 0, 10))
+
+        self.assertEqual(2, len(region))
+
+    def test_pixel_alignment(self):
+        region = DamageRegion()
+
+        region.add(Bounds(40.5, 40.2, 10, 10))
+
+        self.assertEqual((Bounds(40, 40, 11, 11),), region.areas)
+
+    def test_max_areas(self):
+        region = DamageRegion(max_areas=2)
+
+        region.add(Bounds(0, 0, 10, 10))
+        region.add(Bounds(20, 0, 10, 10))
+
+        self.assertEqual(2, len(region))
+
+        region.add(Bounds(0, 20, 10, 10))
+
+        self.assertEqual((Bounds(0, 0, 30, 30),), region.areas)
+
+    def test_drain(self):
+        region = DamageRegion()
+
+        region.add(Bounds(0, 0, 10, 10))
+
+        self.assertEqual((Bounds(0, 0, 10, 10),), region.drain())
+        self.assertTrue(region.empty)
+
+
+# noinspection DuplicatedCode
+class DamageTrackingTest(UITestCase):
+
+    def test_repaint(self):
+        damage = self.context.damage
+
+        window = Frame(self.context)
+        window.bounds = Bounds(20, 20, 60, 60)
+
+        panel = Panel(self.context)
+        panel.bounds = Bounds(10, 10, 20, 20)
+
+        window.add(panel)
+
+        self.context.process()
+
+        self.assertTrue(damage.empty)
+        self.assertEqual(Some(Bounds(9, 9, 22, 22)), panel.painted_area)
+
+        panel.set_color(StyleKeys.Background, RGBA(1, 0, 0, 1))
+
+        self.assertEqual((Bounds(29, 29, 22, 22),), damage.areas)
+
+        self.context.process()
+
+        self.assertTrue(damage.empty)
+
+        panel.bounds = Bounds(30, 10, 20, 20)
+
+        self.assertEqual((Bounds(29, 29, 42, 22),), damage.areas)
+
+        self.context.process()
+
+        panel.visible = False
+
+        self.assertEqual((Bounds(49, 29, 22, 22),), damage.areas)
+
+    def test_repaint_on_style_change(self):
+        window = Frame(self.context)
+
+        window.bounds = Bounds(10, 10, 40, 40)
+
+        self.context.process()
+
+        self.context.look_and_feel.set_color("Label.text", RGBA(0, 0, 1, 1))
+
+        self.assertTrue(self.context.damage.empty)
+
+        self.context.look_and_feel.set_color("Window.background", RGBA(0, 0, 1, 1))
+
+        self.assertEqual((Bounds(9, 9, 42, 42),), self.context.damage.areas)
+
+
+if __name__ == '__main__':
+    unittest.main()
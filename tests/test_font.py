@@ -0,0 +1,78 @@
+import unittest
+
+from cairocffi import FONT_WEIGHT_BOLD, ToyFontFace
+
+from alleycat.ui import Dimension, ToyFontRegistry
+
+
+class ToyFontRegistryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        def fail(e: BaseException) -> None:
+            raise e
+
+        self.registry = ToyFontRegistry(fail, extents_cache_size=2)
+
+    def tearDown(self) -> None:
+        self.registry.dispose()
+
+        super().tearDown()
+
+    def test_text_extent(self):
+        font = self.registry.fallback_font
+
+        extent = self.registry.text_extent("AlleyCat", font, 12)
+
+        self.assertIsInstance(extent, Dimension)
+        self.assertGreater(extent.width, 0)
+        self.assertGreater(extent.height, 0)
+
+        self.assertEqual(extent, self.registry.text_extent("AlleyCat", ToyFontFace("Sans"), 12))
+
+        bold = self.registry.text_extent("AlleyCat", ToyFontFace("Sans", weight=FONT_WEIGHT_BOLD), 12)
+        larger = self.registry.text_extent("AlleyCat", font, 24)
+
+        self.assertGreater(bold.width, extent.width)
+        self.assertGreater(larger.width, extent.width)
+
+        self.assertRaises(ValueError, lambda: self.registry.text_extent(None, font, 12))
+        self.assertRaises(ValueError, lambda: self.registry.text_extent("AlleyCat", font, 0))
+
+    def test_extents_cache(self):
+        font = self.registry.fallback_font
+
+        self.assertEqual(2, self.registry.extents_cache_size)
+
+        extent = self.registry.text_extent("AlleyCat", font, 12)
+
+        self.assertEqual((0, 1), (self.registry.cache_hits, self.registry.cache_misses))
+
+        self.assertEqual(extent, self.registry.text_extent("AlleyCat", ToyFontFace("Sans"), 12))
+        self.assertEqual((1, 1), (self.registry.cache_hits, self.registry.cache_misses))
+
+        self.registry.text_extent("AlleyCat", font, 14)
+        self.registry.text_extent("AlleyCat", font, 12)
+
+        self.assertEqual((2, 2), (self.registry.cache_hits, self.registry.cache_misses))
+
+        self.registry.text_extent("Text", font, 12)
+        self.registry.text_extent("AlleyCat", font, 14)
+
+        self.assertEqual((2, 4), (self.registry.cache_hits, self.registry.cache_misses))
+
+        self.registry.clear_extents_cache()
+
+        self.assertEqual((0, 0), (self.registry.cache_hits, self.registry.cache_misses))
+
+        self.registry.text_extent("Text", font, 12)
+
+        self.assertEqual((0, 1), (self.registry.cache_hits, self.registry.cache_misses))
+
+    def test_validation(self):
+        self.assertRaises(ValueError, lambda: ToyFontRegistry(lambda _: None, extents_cache_size=-1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from cairocffi import ImageSurface
+from returns.maybe import Nothing
+
+from alleycat.ui import ImageCache
+from ui import FixtureImageRegistry
+
+FixturePath: Path = Path(__file__).parent.joinpath("fixtures/cat.png")
+
+
+class ImageCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.directory = Path(tempfile.mkdtemp())
+
+        self.source = self.directory / "cat.png"
+
+        shutil.copy(FixturePath, self.source)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+        super().tearDown()
+
+    def test_load(self):
+        cache = ImageCache(self.directory / "cache")
+
+        decoded = []
+
+        def decode() -> ImageSurface:
+            decoded.append(self.source)
+
+            return ImageSurface.create_from_png(str(self.source))
+
+        registry = FixtureImageRegistry(lambda e: None, disk_cache=cache)
+
+        self.assertEqual(Nothing, cache.load(self.source))
+
+        surface = registry.load_surface(self.source, decode)
+
+        self.assertEqual(1, len(decoded))
+        self.assertEqual(1, len(list(cache.directory.glob("*.argb"))))
+
+        cached = ImageCache(self.directory / "cache").load(self.source).unwrap()
+
+        self.assertEqual(surface.get_width(), cached.get_width())
+        self.assertEqual(surface.get_height(), cached.get_height())
+        self.assertEqual(bytes(surface.get_data()), bytes(cached.get_data()))
+
+        registry.load_surface(self.source, decode)
+
+        self.assertEqual(1, len(decoded))
+
+        stat = self.source.stat()
+
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(Nothing, cache.load(self.source))
+
+        registry.load_surface(self.source, decode)
+
+        self.assertEqual(2, len(decoded))
+        self.assertEqual([cache.entry_for(self.source).unwrap()], list(cache.directory.glob("*.argb")))
+
+        cache.clear()
+
+        self.assertEqual(0, len(list(cache.directory.glob("*.argb"))))
+
+    def test_registry(self):
+        cache = ImageCache(self.directory / "cache")
+
+        image = FixtureImageRegistry(lambda e: None, disk_cache=cache)[str(self.source)]
+
+        cached = FixtureImageRegistry(lambda e: None, disk_cache=cache)[str(self.source)]
+
+        self.assertEqual(image.size, cached.size)
+        self.assertEqual(bytes(image.surface.get_data()), bytes(cached.surface.get_data()))
+
+    def test_invalid_entry(self):
+        cache = ImageCache(self.directory / "cache")
+
+        cache.entry_for(self.source).unwrap().write_bytes(b"invalid")
+
+        self.assertEqual(Nothing, cache.load(self.source))
+        self.assertEqual(Nothing, cache.entry_for(self.directory / "missing.png"))
+
+    def test_invalid_header(self):
+        cache = ImageCache(self.directory / "cache")
+
+        def write_entry(width: int, height: int, stride: int) -> None:
+            header = struct.pack("<4sIIII", b"ACIC", 1, width, height, stride).ljust(64, b"\0")
+
+            cache.entry_for(self.source).unwrap().write_bytes(header + bytes(max(stride, 64) * height))
+
+        write_entry(16, 16, 32)
+
+        self.assertEqual(Nothing, cache.load(self.source))
+
+        write_entry(16, 16, 66)
+
+        self.assertEqual(Nothing, cache.load(self.source))
+
+        write_entry(16, 16, 64)
+
+        self.assertEqual((16, 16), cache.load(self.source).map(lambda s: (s.get_width(), s.get_height())).unwrap())
+
+
+if __name__ == '__main__':
+    unittest.main()
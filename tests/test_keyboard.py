@@ -0,0 +1,120 @@
+import unittest
+from typing import AbstractSet, Set
+
+from alleycat.ui import Context, KeyState, PollingKeyInput
+from ui import UITestCase
+
+
+class PolledKeyInput(PollingKeyInput):
+
+    def __init__(self, context: Context) -> None:
+        super().__init__(context)
+
+        self.keys: Set[int] = set()
+
+    def poll(self) -> AbstractSet[int]:
+        return self.keys
+
+
+class KeyInputTest(UITestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.keyboard = PolledKeyInput(self.context)
+
+    def tearDown(self) -> None:
+        self.keyboard.dispose()
+
+        super().tearDown()
+
+    def test_pressed(self):
+        pressed = []
+
+        self.keyboard.observe("pressed").subscribe(pressed.append)
+
+        self.keyboard.process()
+        self.keyboard.process()
+
+        self.assertEqual([set()], pressed)
+
+        self.keyboard.keys = {1}
+
+        self.keyboard.process()
+        self.keyboard.process()
+        self.keyboard.process()
+
+        self.assertEqual([set(), {1}], pressed)
+
+        self.keyboard.keys = {1, 2}
+
+        self.keyboard.process()
+        self.keyboard.process()
+
+        self.assertEqual([set(), {1}, {1, 2}], pressed)
+
+        self.keyboard.keys = set()
+
+        self.keyboard.process()
+        self.keyboard.process()
+
+        self.assertEqual([set(), {1}, {1, 2}, set()], pressed)
+
+    def test_key_state_change(self):
+        states = []
+
+        self.keyboard.on_key_state_change(1).subscribe(states.append)
+
+        self.keyboard.process()
+
+        self.assertEqual([], states)
+
+        self.keyboard.keys = {1}
+
+        self.keyboard.process()
+
+        self.assertEqual([KeyState.Pressed], states)
+
+        self.keyboard.process()
+        self.keyboard.process()
+
+        self.assertEqual([KeyState.Pressed, KeyState.Hold, KeyState.Hold], states)
+
+        self.keyboard.keys = {1, 2}
+
+        self.keyboard.process()
+
+        self.assertEqual([KeyState.Pressed, KeyState.Hold, KeyState.Hold, KeyState.Hold], states)
+
+        states.clear()
+
+        self.keyboard.keys = {2}
+
+        self.keyboard.process()
+        self.keyboard.process()
+
+        self.assertEqual([KeyState.Released], states)
+
+    def test_key_press_and_release(self):
+        presses = []
+        releases = []
+
+        self.keyboard.on_key_press(1).subscribe(presses.append)
+        self.keyboard.on_key_release(1).subscribe(releases.append)
+
+        self.keyboard.keys = {1}
+
+        for _ in range(3):
+            self.keyboard.process()
+
+        self.keyboard.keys = set()
+
+        for _ in range(3):
+            self.keyboard.process()
+
+        self.assertEqual([1], presses)
+        self.assertEqual([1], releases)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -73,6 +73,71 @@ class LabelTest(UITestCase):
                 self.context.process()
                 self.assertImage(test_name, self.context, tolerance=Tolerance)
 
+    def test_render_cache(self):
+        window = Frame(self.context)
+        window.bounds = Bounds(0, 0, 100, 100)
+
+        label = Label(self.context, text="AlleyCat")
+        label.bounds = Bounds(10, 10, 80, 30)
+
+        window.add(label)
+
+        self.assertEqual(True, label.cached)
+        self.assertEqual(False, window.cached)
+        self.assertEqual(Nothing, label.render_cache)
+
+        self.context.process()
+
+        cache = label.render_cache.unwrap()
+
+        label.bounds = Bounds(20, 40, 80, 30)
+
+        self.context.process()
+
+        self.assertIs(cache, label.render_cache.unwrap())
+
+        cached_image = bytes(self.context.surface.get_data())
+
+        label.cached = False
+        label.repaint()
+
+        self.context.process()
+
+        self.assertEqual(cached_image, bytes(self.context.surface.get_data()))
+
+        label.cached = True
+        label.repaint()
+
+        self.context.process()
+
+        cache = label.render_cache.unwrap()
+
+        label.text = "Text"
+
+        self.assertEqual(Nothing, label.render_cache)
+
+        self.context.process()
+
+        cache = label.render_cache.unwrap()
+
+        label.set_color(StyleKeys.Text, RGBA(1, 0, 0, 1))
+
+        self.assertEqual(Nothing, label.render_cache)
+
+        self.context.process()
+
+        self.assertIsNot(cache, label.render_cache.unwrap())
+
+        label.bounds = Bounds(20, 40, 60, 30)
+
+        self.assertEqual(Nothing, label.render_cache)
+
+        label.cached = False
+
+        self.context.process()
+
+        self.assertEqual(Nothing, label.render_cache)
+
     def test_validation(self):
         laf = self.context.look_and_feel
         fonts = self.context.toolkit.fonts
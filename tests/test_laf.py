@@ -68,6 +68,32 @@ class LookAndFeelTest(UITestCase):
         self.assertFalse(isinstance(create_panel_ui(), GlassPanelUI))
         self.assertTrue(isinstance(create_component_ui(), GlassComponentUI))
 
+    def test_shared_ui(self):
+        laf = self.context.look_and_feel
+
+        class CustomPanel(Panel):
+            pass
+
+        class CustomPanelUI(GlassPanelUI):
+            shareable = False
+
+        self.assertIs(Label(self.context).ui, Label(self.context).ui)
+        self.assertIs(Panel(self.context).ui, Panel(self.context).ui)
+        self.assertIsNot(Panel(self.context).ui, CustomPanel(self.context).ui)
+
+        self.assertIs(laf.ui_factory(Panel), laf.ui_factory(CustomPanel))
+
+        laf.register_ui(CustomPanel, CustomPanelUI)
+
+        self.assertIs(CustomPanelUI, laf.ui_factory(CustomPanel))
+        self.assertIsInstance(CustomPanel(self.context).ui, CustomPanelUI)
+        self.assertIsNot(CustomPanel(self.context).ui, CustomPanel(self.context).ui)
+
+        laf.deregister_ui(CustomPanel)
+
+        self.assertIsInstance(CustomPanel(self.context).ui, GlassPanelUI)
+        self.assertNotIsInstance(CustomPanel(self.context).ui, CustomPanelUI)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,173 @@
+import unittest
+from typing import Any
+
+from alleycat.ui import Bounds, Component, Context, Frame, Insets, Label, ListView, Point
+from alleycat.ui.layout import BoxAlign, StackLayout
+from ui import UITestCase
+
+
+class ListViewTest(UITestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.created = []
+
+        def create_row(context: Context) -> Component:
+            row = Label(context)
+
+            self.created.append(row)
+
+            return row
+
+        def bind_row(row: Component, item: Any) -> None:
+            row.text = item
+
+        self.window = Frame(self.context, StackLayout())
+        self.window.bounds = Bounds(0, 0, 100, 100)
+
+        self.items = [f"Item {i}" for i in range(100_000)]
+
+        self.view = ListView(self.context, create_row, bind_row, self.items, row_height=20)
+
+        self.window.add(self.view)
+
+    def test_rows(self):
+        self.context.process()
+
+        view = self.view
+
+        self.assertEqual(6, len(view.rows))
+        self.assertEqual(6, len(self.created))
+        self.assertEqual(range(0, 6), view.visible_range)
+
+        self.assertEqual(["Item 0", "Item 1", "Item 2", "Item 3", "Item 4", "Item 5"], [r.text for r in view.rows])
+        self.assertEqual(Bounds(0, 20, 100, 20), view.rows[1].bounds)
+
+        view.scroll_to(10_010)
+
+        self.context.process()
+
+        self.assertEqual(range(500, 506), view.visible_range)
+        self.assertEqual("Item 500", view.rows[0].text)
+        self.assertEqual(Bounds(0, -10, 100, 20), view.rows[0].bounds)
+        self.assertEqual(6, len(self.created))
+
+        view.scroll_to(10_000_000)
+
+        self.assertEqual(len(self.items) * 20 - 100, view.scroll_offset)
+
+        self.context.process()
+
+        self.assertEqual(range(99_995, 100_000), view.visible_range)
+        self.assertEqual("Item 99999", view.rows[4].text)
+        self.assertEqual(Bounds(0, 80, 100, 20), view.rows[4].bounds)
+        self.assertFalse(view.rows[5].visible)
+
+        view.scroll_to(-10)
+
+        self.assertEqual(0, view.scroll_offset)
+
+    def test_resize(self):
+        self.context.process()
+
+        self.window.bounds = Bounds(0, 0, 100, 50)
+
+        self.context.process()
+
+        self.assertEqual(tuple(self.created[:4]), self.view.rows)
+        self.assertEqual(tuple(self.created[:4]), self.view.children)
+
+        self.window.bounds = Bounds(0, 0, 100, 200)
+
+        self.context.process()
+
+        self.assertEqual(11, len(self.view.rows))
+        self.assertEqual(13, len(self.created))
+
+    def test_items(self):
+        self.context.process()
+
+        self.view.items = ["A", "B"]
+
+        self.context.process()
+
+        self.assertEqual(2, len(self.view.rows))
+        self.assertEqual(["A", "B"], [r.text for r in self.view.rows])
+        self.assertEqual(0, self.view.max_scroll_offset)
+
+        self.view.items = ()
+
+        self.context.process()
+
+        self.assertEqual(0, len(self.view.rows))
+        self.assertEqual(range(0, 0), self.view.visible_range)
+
+    def test_shrink_items(self):
+        self.context.process()
+
+        view = self.view
+
+        view.scroll_to_item(1000)
+
+        self.context.process()
+
+        view.items = [f"Item {i}" for i in range(10)]
+
+        self.context.process()
+
+        self.assertEqual(100, view.max_scroll_offset)
+        self.assertEqual(100, view.scroll_offset)
+        self.assertEqual(range(5, 10), view.visible_range)
+        self.assertEqual(["Item 5", "Item 6", "Item 7", "Item 8", "Item 9"], [r.text for r in view.rows[:5]])
+
+        view.items = self.items
+
+        self.context.process()
+
+        self.assertEqual(100, view.scroll_offset)
+        self.assertEqual(range(5, 11), view.visible_range)
+
+        self.window.bounds = Bounds(0, 0, 100, 200)
+        view.items = [f"Item {i}" for i in range(5)]
+
+        self.context.process()
+
+        self.assertEqual(0, view.scroll_offset)
+        self.assertEqual(range(0, 5), view.visible_range)
+
+    def test_layout(self):
+        self.view.spacing = 5
+        self.view.padding = Insets(10, 10, 10, 10)
+        self.view.align = BoxAlign.Begin
+
+        self.context.process()
+
+        row = self.view.rows[1]
+
+        self.assertEqual(Bounds(10, 35, row.preferred_size.width, 20), row.bounds)
+        self.assertEqual(25, self.view.row_stride)
+
+    def test_mouse_wheel(self):
+        self.context.process()
+
+        self.mouse.scroll(3)
+
+        self.assertEqual(0, self.view.scroll_offset)
+
+        self.mouse.move_to(Point(50, 50))
+        self.mouse.scroll(3)
+
+        self.assertEqual(60, self.view.scroll_offset)
+
+        self.mouse.scroll(-1)
+
+        self.assertEqual(40, self.view.scroll_offset)
+
+        self.context.process()
+
+        self.assertEqual("Item 2", self.view.rows[0].text)
+
+
+if __name__ == '__main__':
+    unittest.main()
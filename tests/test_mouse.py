@@ -1,12 +1,31 @@
 import unittest
 
-from alleycat.ui import Bounds, Component, Point, Window, MouseMoveEvent, MouseOverEvent, \
-    MouseOutEvent, DragStartEvent, DragEvent, DragOverEvent, DragLeaveEvent, DragEndEvent
+from alleycat.ui import Bounds, Component, Context, Point, PollingMouseInput, Window, MouseMoveEvent, \
+    MouseOverEvent, MouseOutEvent, DragStartEvent, DragEvent, DragOverEvent, DragLeaveEvent, DragEndEvent
 from alleycat.ui import MouseButton, MouseDownEvent, MouseUpEvent
 # noinspection DuplicatedCode
 from ui import UITestCase
 
 
+class PolledMouseInput(PollingMouseInput):
+
+    def __init__(self, context: Context) -> None:
+        super().__init__(context)
+
+        self.location = Point(0, 0)
+        self.pressed = 0
+        self.wheel = 0.
+
+    def poll_position(self) -> Point:
+        return self.location
+
+    def poll_buttons(self) -> int:
+        return self.pressed
+
+    def poll_wheel(self) -> float:
+        return self.wheel
+
+
 # noinspection DuplicatedCode
 class MouseTest(UITestCase):
 
@@ -192,6 +211,39 @@ class MouseTest(UITestCase):
 
         self.assertEqual([MouseOverEvent(self.parent, Point(20, 20))], parent_events)
 
+    def test_hovered(self):
+        events = []
+
+        self.component.on_mouse_over.subscribe(events.append)
+        self.component.on_mouse_out.subscribe(events.append)
+        self.parent.on_mouse_over.subscribe(events.append)
+        self.parent.on_mouse_out.subscribe(events.append)
+
+        self.assertEqual((), self.mouse.hovered)
+
+        self.mouse.move_to(Point(35, 35))
+
+        self.assertEqual((self.component, self.parent), self.mouse.hovered)
+        self.assertEqual([
+            MouseOverEvent(self.parent, Point(35, 35)),
+            MouseOverEvent(self.component, Point(35, 35))
+        ], events)
+
+        self.mouse.move_to(Point(25, 25))
+
+        self.assertEqual((self.parent,), self.mouse.hovered)
+        self.assertEqual([MouseOutEvent(self.component, Point(25, 25))], events[2:])
+
+        self.mouse.move_to(Point(35, 35))
+        self.mouse.move_to(Point(0, 0))
+
+        self.assertEqual((), self.mouse.hovered)
+        self.assertEqual([
+            MouseOverEvent(self.component, Point(35, 35)),
+            MouseOutEvent(self.component, Point(0, 0)),
+            MouseOutEvent(self.parent, Point(0, 0))
+        ], events[3:])
+
     def test_mouse_out(self):
         events = []
         parent_events = []
@@ -404,6 +456,50 @@ class MouseTest(UITestCase):
         self.assertEqual([], events[1:])
         self.assertEqual([DragEndEvent(self.parent, Point(30, 30), MouseButton.RIGHT)], parent_events[1:])
 
+    def test_polling(self):
+        mouse = PolledMouseInput(self.context)
+
+        positions = []
+        buttons = []
+        wheel = []
+
+        mouse.observe("position").subscribe(positions.append)
+        mouse.observe("buttons").subscribe(buttons.append)
+        mouse.on_mouse_wheel.subscribe(wheel.append)
+
+        for _ in range(3):
+            mouse.process()
+
+        self.assertEqual([Point(0, 0)], positions)
+        self.assertEqual([0], buttons)
+        self.assertEqual([], wheel)
+
+        mouse.location = Point(10, 20)
+        mouse.pressed = MouseButton.LEFT
+
+        for _ in range(3):
+            mouse.process()
+
+        self.assertEqual([Point(0, 0), Point(10, 20)], positions)
+        self.assertEqual([0, MouseButton.LEFT], buttons)
+
+        mouse.pressed = MouseButton.LEFT | MouseButton.RIGHT
+        mouse.wheel = 2
+
+        mouse.process()
+
+        mouse.pressed = 0
+        mouse.wheel = 0
+
+        mouse.process()
+        mouse.process()
+
+        self.assertEqual([Point(0, 0), Point(10, 20)], positions)
+        self.assertEqual([0, MouseButton.LEFT, MouseButton.LEFT | MouseButton.RIGHT, 0], buttons)
+        self.assertEqual([2], wheel)
+
+        mouse.dispose()
+
 
 if __name__ == '__main__':
     unittest.main()
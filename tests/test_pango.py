@@ -0,0 +1,168 @@
+import unittest
+from typing import cast
+
+import numpy as np
+from cairocffi import ANTIALIAS_NONE, Context as Graphics, FONT_WEIGHT_BOLD, FORMAT_ARGB32, FontOptions, ImageSurface, \
+    ToyFontFace
+
+from alleycat.ui import Bounds, FontRegistry, Frame, Label, LabelButton, RGBA
+from alleycat.ui.glass import StyleKeys
+from alleycat.ui.pango import GlassPangoLabelButtonUI, GlassPangoLabelUI, GlassPangoLookAndFeel, \
+    PangoFontRegistry
+from ui import FixtureToolkit, UI, UITestCase
+
+
+class PangoFixtureToolkit(FixtureToolkit):
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._pango_registry = PangoFontRegistry(self.error_handler)
+
+    @property
+    def fonts(self) -> FontRegistry:
+        return self._pango_registry
+
+
+class PangoFontRegistryTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        def fail(e: BaseException) -> None:
+            raise e
+
+        self.registry = PangoFontRegistry(fail)
+
+    def tearDown(self) -> None:
+        self.registry.dispose()
+
+        super().tearDown()
+
+    def test_text_extent(self):
+        font = self.registry.fallback_font
+
+        extent = self.registry.text_extent("AlleyCat", font, 12)
+
+        self.assertGreater(extent.width, 0)
+        self.assertGreater(extent.height, 0)
+
+        bold = self.registry.text_extent("AlleyCat", ToyFontFace("Sans", weight=FONT_WEIGHT_BOLD), 12)
+        larger = self.registry.text_extent("AlleyCat", font, 24)
+
+        self.assertGreater(bold.width, extent.width)
+        self.assertGreater(larger.width, extent.width)
+        self.assertGreater(larger.height, extent.height)
+
+        self.assertEqual(0, self.registry.text_extent("", font, 12).width)
+
+        self.assertRaises(ValueError, lambda: self.registry.text_extent(None, font, 12))
+        self.assertRaises(ValueError, lambda: self.registry.text_extent("AlleyCat", font, 0))
+
+    def test_create_layout(self):
+        font = self.registry.fallback_font
+
+        layout = self.registry.create_layout("AlleyCat", font, 12)
+
+        self.assertEqual("AlleyCat", layout.get_text())
+        self.assertEqual(self.registry.text_extent("AlleyCat", font, 12), self.registry.layout_extent(layout))
+
+
+# noinspection DuplicatedCode
+class PangoLabelTest(UITestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.context.dispose()
+
+        toolkit = PangoFixtureToolkit()
+
+        self.context = UI(toolkit).with_look_and_feel(GlassPangoLookAndFeel(toolkit)).create_context()
+
+    def test_create_ui(self):
+        self.assertIsInstance(Label(self.context).ui, GlassPangoLabelUI)
+        self.assertIsInstance(LabelButton(self.context).ui, GlassPangoLabelButtonUI)
+
+    def test_text_layout(self):
+        window = Frame(self.context)
+        window.bounds = Bounds(0, 0, 100, 100)
+
+        label = Label(self.context, text="AlleyCat", text_size=18)
+        label.bounds = Bounds(0, 0, 100, 100)
+
+        window.add(label)
+
+        ui = cast(GlassPangoLabelUI, label.ui)
+        fonts = self.context.toolkit.fonts
+
+        layout = ui.text_layout(label)
+
+        self.assertEqual(fonts.text_extent("AlleyCat", fonts.fallback_font, 18), ui.extents(label))
+
+        self.context.process()
+
+        self.assertIs(layout, ui.text_layout(label))
+        self.assertEqual("AlleyCat", layout.get_text())
+
+        label.text = "Text"
+
+        self.assertIs(layout, ui.text_layout(label))
+        self.assertEqual("Text", layout.get_text())
+
+        label.text_size = 12
+
+        self.assertIs(layout, ui.text_layout(label))
+        self.assertEqual(fonts.text_extent("Text", fonts.fallback_font, 12), ui.extents(label))
+
+    def test_draw(self):
+        window = Frame(self.context)
+        window.bounds = Bounds(0, 0, 100, 100)
+        window.set_color(StyleKeys.Background, RGBA(0, 0, 0, 0))
+        window.set_color(StyleKeys.Border, RGBA(0, 0, 0, 0))
+
+        label = Label(self.context, text="AlleyCat", text_size=18)
+        label.bounds = Bounds(0, 0, 100, 100)
+        label.set_color(StyleKeys.Text, RGBA(1, 0, 0, 1))
+
+        window.add(label)
+
+        self.context.process()
+
+        data = np.frombuffer(self.context.surface.get_data(), dtype=np.uint8).reshape((100, 100, 4))
+
+        (rows, columns) = np.nonzero(data[:, :, 2])
+
+        extents = label.ui.extents(label)
+
+        self.assertGreater(len(rows), 0)
+        self.assertEqual(0, np.count_nonzero(data[:, :, 1]))
+
+        self.assertLessEqual(abs((columns.min() + columns.max()) / 2 - 50), 2)
+        self.assertLessEqual(abs((rows.min() + rows.max()) / 2 - 50), extents.height / 2)
+
+    def test_draw_with_font_options(self):
+        label = Label(self.context, text="AlleyCat", text_size=18)
+
+        ui = cast(GlassPangoLabelUI, label.ui)
+
+        surface = ImageSurface(FORMAT_ARGB32, 100, 40)
+
+        g = Graphics(surface)
+        g.set_font_options(FontOptions(antialias=ANTIALIAS_NONE))
+        g.set_source_rgba(1, 0, 0, 1)
+
+        ui.show_text(g, label, ui.font(label), 0, 0)
+
+        surface.flush()
+
+        alpha = np.frombuffer(surface.get_data(), dtype=np.uint8).reshape((40, 100, 4))[:, :, 3]
+
+        self.assertGreater(np.count_nonzero(alpha), 0)
+        self.assertEqual({0, 255}, set(np.unique(alpha)))
+
+        surface.finish()
+
+
+if __name__ == '__main__':
+    unittest.main()
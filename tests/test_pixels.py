@@ -0,0 +1,69 @@
+import unittest
+from typing import Sequence
+
+import numpy as np
+
+from alleycat.ui.pixels import surface_from_pixels
+
+
+class FakePixels:
+
+    def __init__(self, values: Sequence[float]) -> None:
+        self.values = values
+
+    def foreach_get(self, target: np.ndarray) -> None:
+        target[:] = self.values
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+
+class FakeImage:
+
+    def __init__(self, width: int, height: int, values: Sequence[float]) -> None:
+        self.size = (width, height)
+        self.pixels = FakePixels(values)
+
+
+class PixelsTest(unittest.TestCase):
+
+    def test_surface_from_pixels(self):
+        # Blender stores rows from the bottom, so the first pixel here is the bottom left one.
+        image = FakeImage(3, 2, [
+            1, 0, 0, 1, 0, 1, 0, 1, 0, 0, 1, 1,
+            0.5, 0.5, 0.5, 0.5, 0, 0, 0, 0, 1, 1, 1, 1])
+
+        surface = surface_from_pixels(image)
+
+        self.assertEqual(3, surface.get_width())
+        self.assertEqual(2, surface.get_height())
+
+        stride = surface.get_stride()
+        data = np.frombuffer(surface.get_data(), dtype=np.uint32).reshape((2, stride // 4))
+
+        expected = [
+            [0x7f7f7f7f, 0x00000000, 0xffffffff],
+            [0xffff0000, 0xff00ff00, 0xff0000ff]]
+
+        self.assertEqual(expected, data[:, :3].tolist())
+
+        surface.finish()
+
+    def test_large_image(self):
+        size = 2048
+
+        values = np.random.default_rng(0).random(size * size * 4, dtype=np.float32)
+
+        surface = surface_from_pixels(FakeImage(size, size, values))
+
+        data = np.frombuffer(surface.get_data(), dtype=np.uint8).reshape((size, surface.get_stride() // 4, 4))
+
+        top_left = values[(size - 1) * size * 4:(size - 1) * size * 4 + 4]
+
+        self.assertEqual([int(top_left[i] * 255) for i in (2, 1, 0, 3)], data[0, 0].tolist())
+
+        surface.finish()
+
+
+if __name__ == '__main__':
+    unittest.main()
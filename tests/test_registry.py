@@ -0,0 +1,171 @@
+import unittest
+from pathlib import Path
+from typing import List
+
+from cairocffi import FORMAT_ARGB32, ImageSurface
+from returns.maybe import Maybe, Some
+from rx.disposable import Disposable
+
+from alleycat.ui import Canvas, Dimension, Registry
+from ui import FixtureContext, FixtureToolkit, TestImage as FixtureImage
+
+
+class Item(Disposable):
+
+    def __init__(self, name: str, size: int) -> None:
+        super().__init__()
+
+        self.name = name
+        self.size = size
+        self.disposed_item = False
+
+    def dispose(self) -> None:
+        self.disposed_item = True
+
+        super().dispose()
+
+
+class FixtureRegistry(Registry[Item]):
+
+    def __init__(self, budget: int) -> None:
+        super().__init__(lambda e: None, budget)
+
+        self.created: List[str] = []
+
+    def create(self, name: str) -> Maybe[Item]:
+        self.created.append(name)
+
+        return Some(Item(name, int(name[1:])))
+
+    def item_size(self, item: Item) -> int:
+        return item.size
+
+
+class RegistryTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        registry = FixtureRegistry(budget=100)
+
+        a = registry["a40"]
+        b = registry["b40"]
+
+        self.assertEqual(80, registry.memory_usage)
+
+        registry["a40"]
+
+        c = registry["c40"]
+
+        self.assertEqual(["a40", "c40"], list(registry))
+        self.assertEqual(80, registry.memory_usage)
+
+        self.assertTrue(b.disposed_item)
+        self.assertFalse(a.disposed_item)
+        self.assertFalse(c.disposed_item)
+
+        big = registry["d200"]
+
+        self.assertEqual(["d200"], list(registry))
+        self.assertFalse(big.disposed_item)
+        self.assertEqual(200, registry.memory_usage)
+
+        del registry["d200"]
+
+        self.assertEqual(0, registry.memory_usage)
+
+    def test_pin(self):
+        registry = FixtureRegistry(budget=100)
+
+        a = registry["a40"]
+
+        registry.pin(a)
+        registry.pin(a)
+
+        registry["b40"]
+        registry["c40"]
+
+        self.assertEqual(["a40", "c40"], list(registry))
+
+        registry.unpin(a)
+
+        self.assertTrue(registry.pinned(a))
+
+        registry["d40"]
+
+        self.assertEqual(["a40", "d40"], list(registry))
+
+        registry.unpin(a)
+
+        self.assertFalse(registry.pinned(a))
+
+        registry["e40"]
+
+        self.assertEqual(["d40", "e40"], list(registry))
+        self.assertTrue(a.disposed_item)
+
+        other = Item("f40", 40)
+
+        registry.pin(other)
+        registry.unpin(other)
+
+        self.assertFalse(registry.pinned(other))
+
+        d = registry["d40"]
+
+        registry.pin(d)
+
+        del registry["d40"]
+
+        self.assertFalse(registry.pinned(d))
+
+        registry["g40"]
+        registry["h40"]
+        registry["i40"]
+
+        self.assertEqual(["h40", "i40"], list(registry))
+
+    def test_unbounded(self):
+        registry = FixtureRegistry(budget=None)
+
+        for i in range(10):
+            registry[f"i{i + 100}"]
+
+        self.assertEqual(10, len(registry))
+
+        self.assertRaises(ValueError, lambda: FixtureRegistry(budget=-1))
+
+    def test_canvas_pin(self):
+        context = FixtureContext(Dimension(100, 100), FixtureToolkit())
+
+        images = context.toolkit.images
+
+        image = images[str(Path(__file__).parent.joinpath("fixtures/cat.png"))]
+
+        canvas = Canvas(context)
+
+        self.assertFalse(images.pinned(image))
+
+        canvas.image = Some(image)
+
+        self.assertTrue(images.pinned(image))
+
+        canvas.image = Some(image)
+
+        self.assertTrue(images.pinned(image))
+
+        placeholder = FixtureImage(ImageSurface(FORMAT_ARGB32, 8, 8))
+
+        canvas.image = Some(placeholder)
+
+        self.assertFalse(images.pinned(image))
+        self.assertFalse(images.pinned(placeholder))
+
+        canvas.image = Some(image)
+        canvas.dispose()
+
+        self.assertFalse(images.pinned(image))
+
+        context.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from returns.maybe import Nothing, Some
+
+from alleycat.ui import Bounds, Point, SpatialIndex
+
+
+class SpatialIndexTest(unittest.TestCase):
+
+    def test_query(self):
+        index = SpatialIndex[str](cell_size=10)
+
+        index.update("a", Bounds(0, 0, 20, 20))
+        index.update("b", Bounds(15, 15, 10, 10))
+        index.update("c", Bounds(100, 100, 5, 5))
+
+        self.assertEqual(3, len(index))
+        self.assertEqual({"a"}, index.query(Point(5, 5)))
+        self.assertEqual({"a", "b"}, index.query(Point(18, 18)))
+        self.assertEqual({"a", "b"}, index.query(Point(20, 20)))
+        self.assertEqual({"b"}, index.query(Point(25, 25)))
+        self.assertEqual({"c"}, index.query(Point(100, 105)))
+        self.assertEqual(set(), index.query(Point(50, 50)))
+        self.assertEqual(set(), index.query(Point(-1, 0)))
+
+    def test_update(self):
+        index = SpatialIndex[str](cell_size=10)
+
+        index.update("a", Bounds(0, 0, 5, 5))
+
+        self.assertEqual(Some(Bounds(0, 0, 5, 5)), index.bounds_of("a"))
+
+        index.update("a", Bounds(2, 2, 5, 5))
+
+        self.assertEqual({"a"}, index.query(Point(6, 6)))
+        self.assertEqual(set(), index.query(Point(1, 1)))
+
+        index.update("a", Bounds(40, 40, 5, 5))
+
+        self.assertEqual(set(), index.query(Point(6, 6)))
+        self.assertEqual({"a"}, index.query(Point(42, 42)))
+        self.assertEqual(1, len(index))
+
+        index.remove("a")
+
+        self.assertEqual(Nothing, index.bounds_of("a"))
+        self.assertEqual(set(), index.query(Point(42, 42)))
+        self.assertFalse("a" in index)
+
+    def test_large_items(self):
+        index = SpatialIndex[str](cell_size=10, max_cells=4)
+
+        index.update("a", Bounds(0, 0, 100, 100))
+        index.update("b", Bounds(0, 0, 5, 5))
+
+        self.assertEqual({"a", "b"}, index.query(Point(2, 2)))
+        self.assertEqual({"a"}, index.query(Point(90, 90)))
+
+        index.update("a", Bounds(0, 0, 5, 5))
+
+        self.assertEqual(set(), index.query(Point(90, 90)))
+        self.assertEqual({"a", "b"}, index.query(Point(2, 2)))
+
+        index.update("a", Bounds(0, 0, 100, 100))
+        index.remove("a")
+
+        self.assertEqual(set(), index.query(Point(90, 90)))
+
+        index.clear()
+
+        self.assertEqual(0, len(index))
+
+    def test_validation(self):
+        self.assertRaises(ValueError, lambda: SpatialIndex(cell_size=0))
+        self.assertRaises(ValueError, lambda: SpatialIndex(max_cells=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
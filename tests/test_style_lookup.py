@@ -3,7 +3,8 @@ import unittest
 from cairocffi import ToyFontFace
 from returns.maybe import Nothing, Some
 
-from alleycat.ui import ColorChangeEvent, FontChangeEvent, Insets, InsetsChangeEvent, RGBA, StyleLookup
+from alleycat.ui import ColorChangeEvent, FontChangeEvent, Insets, InsetsChangeEvent, RGBA, StyleLookup, Theme, \
+    ThemeChangeEvent
 
 
 class StyleLookupTest(unittest.TestCase):
@@ -111,6 +112,40 @@ class StyleLookupTest(unittest.TestCase):
 
         self.assertEqual([InsetsChangeEvent(lookup, "padding", Nothing)], changes[7:])
 
+    def test_apply_theme(self):
+        lookup = StyleLookup()
+
+        lookup.set_color("color1", RGBA(1, 0, 0, 1))
+        lookup.set_color("color2", RGBA(0, 1, 0, 1))
+
+        changes = []
+
+        lookup.on_style_change.subscribe(changes.append)
+
+        padding = Insets(5, 5, 5, 5)
+
+        lookup.apply_theme(Theme(colors={"color1": RGBA(1, 0, 0, 1), "color3": RGBA(0, 0, 1, 1)},
+                                 insets={"padding": padding}))
+
+        self.assertEqual(RGBA(0, 1, 0, 1), lookup.get_color("color2").unwrap())
+        self.assertEqual(RGBA(0, 0, 1, 1), lookup.get_color("color3").unwrap())
+        self.assertEqual(padding, lookup.get_insets("padding").unwrap())
+
+        self.assertEqual([ThemeChangeEvent(lookup, (
+            ColorChangeEvent(lookup, "color3", Some(RGBA(0, 0, 1, 1))),
+            InsetsChangeEvent(lookup, "padding", Some(padding))))], changes)
+
+        lookup.apply_theme(Theme(colors={"color1": RGBA(1, 0, 0, 1)}), replace=True)
+
+        self.assertEqual(Nothing, lookup.get_color("color2"))
+        self.assertEqual(Nothing, lookup.get_insets("padding"))
+
+        self.assertEqual({"color2", "color3", "padding"}, changes[1].keys)
+
+        lookup.apply_theme(Theme(colors={"color1": RGBA(1, 0, 0, 1)}), replace=True)
+
+        self.assertEqual(2, len(changes))
+
 
 if __name__ == '__main__':
     unittest.main()
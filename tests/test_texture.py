@@ -0,0 +1,154 @@
+import unittest
+from typing import Any, List, Tuple
+
+import numpy as np
+from cairocffi import FORMAT_ARGB32, ImageSurface
+
+from alleycat.ui import Bounds, Dimension, Frame, Panel
+from alleycat.ui.texture import GLBackend, SurfaceTexture
+from ui import FixtureContext, FixtureToolkit
+
+
+class FakeGLBackend(GLBackend):
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Any]] = []
+        self.buffers: List[bytearray] = []
+
+    def create_texture(self) -> int:
+        self.calls.append(("create_texture", None))
+        return 1
+
+    def delete_texture(self, texture: int) -> None:
+        self.calls.append(("delete_texture", texture))
+
+    def bind_texture(self, texture: int) -> None:
+        pass
+
+    def allocate_texture(self, width: int, height: int) -> None:
+        self.calls.append(("allocate_texture", (width, height)))
+
+    def create_buffer(self, size: int) -> Any:
+        self.calls.append(("create_buffer", size))
+        self.buffers.append(bytearray(size))
+        return self.buffers[-1]
+
+    def buffer_data(self, buffer: Any) -> memoryview:
+        return memoryview(buffer)
+
+    def upload(self, buffer: Any, row_length: int, area: Bounds) -> None:
+        self.calls.append(("upload", area))
+
+    def uploads(self) -> List[Bounds]:
+        return [c[1] for c in self.calls if c[0] == "upload"]
+
+
+class SurfaceTextureTest(unittest.TestCase):
+
+    def test_update(self):
+        backend = FakeGLBackend()
+        texture = SurfaceTexture(backend)
+
+        surface = ImageSurface(FORMAT_ARGB32, 100, 50)
+
+        texture.update(surface, ())
+
+        self.assertEqual([
+            ("create_texture", None),
+            ("allocate_texture", (100, 50)),
+            ("create_buffer", 100 * 50 * 4),
+            ("upload", Bounds(0, 0, 100, 50))], backend.calls)
+
+        self.assertEqual(100 * 50 * 4, texture.uploaded_bytes)
+
+        backend.calls.clear()
+
+        texture.update(surface, (Bounds(10, 10, 20, 5), Bounds(90, 40, 20, 20), Bounds(200, 200, 10, 10)))
+
+        self.assertEqual([Bounds(10, 10, 20, 5), Bounds(90, 40, 10, 10)], backend.uploads())
+        self.assertEqual((20 * 5 + 10 * 10) * 4, texture.uploaded_bytes)
+
+        resized = ImageSurface(FORMAT_ARGB32, 200, 100)
+
+        texture.update(resized, (Bounds(0, 0, 10, 10),))
+
+        self.assertIn(("allocate_texture", (200, 100)), backend.calls)
+        self.assertEqual(Bounds(0, 0, 200, 100), backend.uploads()[-1])
+
+        texture.dispose()
+
+        self.assertEqual(("delete_texture", 1), backend.calls[-1])
+
+        surface.finish()
+        resized.finish()
+
+    def test_copy_areas(self):
+        backend = FakeGLBackend()
+        texture = SurfaceTexture(backend)
+
+        surface = ImageSurface(FORMAT_ARGB32, 100, 50)
+        stride = surface.get_stride()
+
+        pixels = np.ndarray((50, stride), dtype=np.uint8, buffer=surface.get_data())
+        pixels[:] = 1
+
+        texture.update(surface, ())
+
+        pixels[:] = 2
+
+        texture.update(surface, (Bounds(10, 20, 30, 5),))
+
+        staging = np.ndarray((50, stride), dtype=np.uint8, buffer=backend.buffers[0])
+
+        copied = np.zeros((50, stride), dtype=bool)
+        copied[20:25, 40:160] = True
+
+        self.assertTrue(np.all(staging[copied] == 2))
+        self.assertTrue(np.all(staging[~copied] == 1))
+
+        texture.dispose()
+        surface.finish()
+
+    def test_drawn_areas(self):
+        context = FixtureContext(Dimension(100, 100), FixtureToolkit())
+
+        backend = FakeGLBackend()
+        texture = SurfaceTexture(backend)
+
+        window = Frame(context)
+        window.bounds = Bounds(0, 0, 100, 100)
+
+        panel = Panel(context)
+        panel.bounds = Bounds(20, 20, 20, 20)
+
+        window.add(panel)
+
+        context.process()
+
+        texture.update(context.surface, context.drawn_areas)
+
+        backend.calls.clear()
+
+        context.process()
+
+        self.assertEqual((), context.drawn_areas)
+
+        panel.bounds = Bounds(50, 50, 20, 20)
+
+        context.process()
+
+        self.assertNotEqual((), context.drawn_areas)
+
+        texture.update(context.surface, context.drawn_areas)
+
+        self.assertNotIn("allocate_texture", [c[0] for c in backend.calls])
+        self.assertEqual(list(context.drawn_areas), backend.uploads())
+        self.assertEqual(sum(a.width * a.height * 4 for a in context.drawn_areas), texture.uploaded_bytes)
+        self.assertLess(texture.uploaded_bytes, 100 * 100 * 4 / 2)
+
+        texture.dispose()
+        context.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
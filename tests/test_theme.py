@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+from returns.maybe import Nothing
+
+from alleycat.ui import Bounds, Frame, Insets, Label, RGBA, Theme
+from alleycat.ui.glass import StyleKeys
+from alleycat.ui.layout import StackLayout
+from ui import UITestCase
+
+
+class ThemeTest(UITestCase):
+
+    def test_from_json(self):
+        fonts = self.context.toolkit.fonts
+
+        theme = Theme.from_json("""
+        {
+            "colors": {
+                "Window.background": "#ff000080",
+                "Button.text": "#00ff00",
+                "text": [0.5, 0.5, 0.5]
+            },
+            "fonts": {
+                "text": "Sans"
+            },
+            "insets": {
+                "padding": 5,
+                "Label.padding": [1, 2, 3, 4]
+            }
+        }
+        """, fonts)
+
+        self.assertEqual(RGBA(1, 0, 0, 128 / 255.), theme.colors["Window.background"])
+        self.assertEqual(RGBA(0, 1, 0, 1), theme.colors["Button.text"])
+        self.assertEqual(RGBA(0.5, 0.5, 0.5, 1), theme.colors["text"])
+        self.assertEqual("Sans", theme.fonts["text"].get_family())
+        self.assertEqual(Insets(5, 5, 5, 5), theme.insets["padding"])
+        self.assertEqual(Insets(1, 2, 3, 4), theme.insets["Label.padding"])
+
+        with self.assertRaises(ValueError):
+            Theme.from_json('{"colors": {"text": "red"}}', fonts)
+
+        with self.assertRaises(ValueError):
+            Theme.from_json('{"colours": {}}', fonts)
+
+    def test_load(self):
+        (handle, path) = tempfile.mkstemp(suffix=".json")
+
+        try:
+            with os.fdopen(handle, "w") as file:
+                file.write('{"colors": {"text": [1, 0, 0, 1]}}')
+
+            theme = Theme.load(path, self.context.toolkit.fonts)
+
+            self.assertEqual(RGBA(1, 0, 0, 1), theme.colors["text"])
+        finally:
+            os.remove(path)
+
+    def test_switch_theme(self):
+        laf = self.context.look_and_feel
+
+        window = Frame(self.context, StackLayout())
+        window.bounds = Bounds(0, 0, 100, 100)
+
+        labels = [Label(self.context, text=f"Label {i}") for i in range(3)]
+
+        for label in labels:
+            window.add(label)
+
+        self.context.process()
+
+        changes = []
+        label_changes = []
+
+        laf.on_style_change.subscribe(changes.append)
+        labels[0].on_inherited_style_change.subscribe(label_changes.append)
+
+        faction = Theme(
+            colors={StyleKeys.Text: RGBA(1, 0, 0, 1), "Window.background": RGBA(0, 0, 1, 1)},
+            insets={"Label.padding": Insets(2, 2, 2, 2)})
+
+        laf.apply_theme(laf.default_theme.merge(faction), replace=True)
+
+        self.assertEqual(1, len(changes))
+        self.assertEqual({StyleKeys.Text, "Window.background", "Label.padding"}, changes[0].keys)
+
+        self.assertEqual(1, len(label_changes))
+        self.assertEqual({StyleKeys.Text, "Label.padding"}, label_changes[0].keys)
+
+        self.assertFalse(labels[0].valid)
+        self.assertEqual(RGBA(1, 0, 0, 1), labels[0].resolve_color(StyleKeys.Text).unwrap())
+        self.assertEqual(Insets(2, 2, 2, 2), labels[0].resolve_insets(StyleKeys.Padding).unwrap())
+
+        laf.apply_theme(laf.default_theme, replace=True)
+
+        self.assertEqual(2, len(changes))
+        self.assertEqual(RGBA(0.8, 0.8, 0.8, 1), labels[0].resolve_color(StyleKeys.Text).unwrap())
+        self.assertEqual(Nothing, laf.get_insets("Label.padding"))
+
+
+if __name__ == '__main__':
+    unittest.main()
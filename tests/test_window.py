@@ -1,6 +1,7 @@
 import unittest
 
-from returns.maybe import Some
+import numpy as np
+from returns.maybe import Nothing, Some
 
 from alleycat.ui import Bounds, Dimension, Frame, MouseButton, Panel, Point, RGBA
 from alleycat.ui.glass import StyleKeys
@@ -56,6 +57,137 @@ class WindowTest(UITestCase):
 
         self.assertImage("draw_children", self.context)
 
+    def test_cache(self):
+        window = Frame(self.context)
+
+        window.bounds = Bounds(10, 20, 60, 60)
+
+        child = Panel(self.context)
+
+        child.bounds = Bounds(10, 10, 20, 20)
+        child.set_color(StyleKeys.Background, RGBA(1, 0, 0, 1))
+
+        window.add(child)
+
+        self.assertEqual(Nothing, window.cache)
+
+        self.context.process()
+
+        cache = window.cache.unwrap()
+
+        self.assertEqual((62, 62), (cache.get_width(), cache.get_height()))
+
+        window.bounds = Bounds(20, 30, 60, 60)
+
+        self.context.process()
+
+        self.assertIs(cache, window.cache.unwrap())
+        self.assertEqual(0, len(window.cache_damage))
+
+        child.set_color(StyleKeys.Background, RGBA(0, 0, 1, 1))
+
+        self.assertIs(cache, window.cache.unwrap())
+        self.assertEqual((Bounds(10, 10, 22, 22),), window.cache_damage.areas)
+
+        self.context.process()
+
+        self.assertIs(cache, window.cache.unwrap())
+        self.assertTrue(window.cache_damage.empty)
+
+        window.bounds = Bounds(20.5, 30, 60, 60)
+
+        self.context.process()
+
+        self.assertIsNot(cache, window.cache.unwrap())
+
+        cache = window.cache.unwrap()
+
+        window.set_color(StyleKeys.Background, RGBA(0, 1, 0, 1))
+
+        self.assertEqual(Nothing, window.cache)
+
+        self.context.process()
+
+        self.assertIsNot(cache, window.cache.unwrap())
+
+    def test_cache_move(self):
+        window = Frame(self.context)
+
+        window.bounds = Bounds(0, 0, 20, 20)
+        window.set_color(StyleKeys.Background, RGBA(1, 0, 0, 1))
+
+        def red_at(x: int) -> bool:
+            data = np.frombuffer(self.context.surface.get_data(), dtype=np.uint8).reshape((100, 100, 4))
+            return bool(data[10, x, 2] > 0)
+
+        self.context.process()
+
+        cache = window.cache.unwrap()
+
+        self.assertTrue(red_at(10))
+
+        window.bounds = Bounds(30, 0, 20, 20)
+
+        self.context.process()
+
+        window.bounds = Bounds(60, 0, 20, 20)
+
+        self.context.process()
+
+        self.assertIs(cache, window.cache.unwrap())
+        self.assertEqual(Some(Bounds(59, -1, 22, 22)), window.painted_area)
+
+        self.assertFalse(red_at(10))
+        self.assertFalse(red_at(40))
+        self.assertTrue(red_at(70))
+
+        self.context.window_manager.remove(window)
+
+        self.context.process()
+
+        self.assertFalse(red_at(70))
+
+    def test_cache_on_style_change(self):
+        window1 = Frame(self.context)
+        window1.bounds = Bounds(0, 0, 40, 40)
+
+        window2 = Frame(self.context)
+        window2.bounds = Bounds(50, 50, 40, 40)
+
+        child = Panel(self.context)
+        child.bounds = Bounds(10, 10, 20, 20)
+
+        window1.add(child)
+
+        self.context.process()
+
+        cache1 = window1.cache.unwrap()
+        cache2 = window2.cache.unwrap()
+
+        laf = self.context.look_and_feel
+
+        laf.set_color("Label.text", RGBA(0, 0, 1, 1))
+
+        self.assertIs(cache1, window1.cache.unwrap())
+        self.assertIs(cache2, window2.cache.unwrap())
+        self.assertTrue(window1.cache_damage.empty)
+        self.assertTrue(window2.cache_damage.empty)
+        self.assertFalse(self.context.frame_dirty)
+
+        laf.set_color("Panel.background", RGBA(0, 0, 1, 1))
+
+        self.assertIs(cache1, window1.cache.unwrap())
+        self.assertIs(cache2, window2.cache.unwrap())
+        self.assertEqual((Bounds(10, 10, 22, 22),), window1.cache_damage.areas)
+        self.assertTrue(window2.cache_damage.empty)
+
+        self.context.process()
+
+        laf.set_color("Frame.background", RGBA(0, 0, 1, 1))
+
+        self.assertEqual(Nothing, window1.cache)
+        self.assertEqual(Nothing, window2.cache)
+
     def test_window_at(self):
         manager = self.context.window_manager
 
@@ -81,6 +213,17 @@ class WindowTest(UITestCase):
         self.assertEqual(Some(top), manager.window_at(Point(150, 50)))
         self.assertEqual(Some(top), manager.window_at(Point(50, 150)))
 
+        manager.remove(bottom)
+        manager.add(bottom)
+
+        self.assertEqual(Some(bottom), manager.window_at(Point(50, 50)))
+        self.assertEqual(Some(top), manager.window_at(Point(150, 150)))
+
+        manager.remove(top)
+
+        self.assertEqual(Some(middle), manager.window_at(Point(150, 150)))
+        self.assertEqual(Nothing, manager.window_at(Point(150, 50)))
+
     def test_drag(self):
         window = Frame(self.context)
         window.draggable = True
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import unittest
 from abc import ABC
+from concurrent.futures import Executor, Future
 from pathlib import Path
 from typing import Optional, Sequence, cast
 
@@ -11,7 +12,7 @@ from alleycat.reactive import RV, functions as rv
 from cairocffi import FontOptions, ImageSurface, Surface
 from returns.maybe import Maybe, Nothing, Some
 
-from alleycat.ui import Context, Dimension, FakeMouseInput, FontRegistry, Image, ImageRegistry, Input, \
+from alleycat.ui import Context, Dimension, FakeMouseInput, FontRegistry, Image, ImageCache, ImageRegistry, Input, \
     LookAndFeel, MouseInput, Toolkit, ToyFontRegistry, WindowManager
 from alleycat.ui.context import ContextBuilder, ErrorHandler
 from alleycat.ui.glass import StyleKeys
@@ -43,7 +44,7 @@ class FixtureToolkit(Toolkit[FixtureContext]):
         super().__init__(resource_path, error_handler)
 
         self._font_registry = ToyFontRegistry(self.error_handler)
-        self._image_registry = FixtureImageRegistry(self.error_handler)
+        self._image_registry = FixtureImageRegistry(self.error_handler, executor=SynchronousExecutor())
 
     @property
     def fonts(self) -> FontRegistry:
@@ -99,8 +100,13 @@ class TestImage(Image):
 
 class FixtureImageRegistry(ImageRegistry[TestImage]):
 
-    def __init__(self, error_handler: ErrorHandler) -> None:
-        super().__init__(error_handler)
+    def __init__(
+            self,
+            error_handler: ErrorHandler,
+            budget: Optional[int] = None,
+            disk_cache: Optional[ImageCache] = None,
+            executor: Optional[Executor] = None) -> None:
+        super().__init__(error_handler, budget, disk_cache=disk_cache, executor=executor)
 
     def create(self, key: str) -> Maybe[TestImage]:
         if key is None:
@@ -109,11 +115,24 @@ class FixtureImageRegistry(ImageRegistry[TestImage]):
         if not Path(key).exists():
             return Nothing
 
-        source = ImageSurface.create_from_png(key)
+        source = self.load_surface(key, lambda: ImageSurface.create_from_png(key))
 
         return Some(TestImage(source))
 
 
+class SynchronousExecutor(Executor):
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+        return future
+
+
 class UITestCase(unittest.TestCase, ABC):
     def __init__(self, name: str, fixture_dir: Optional[Path] = None, output_dir: Optional[Path] = None):
         super().__init__(name)